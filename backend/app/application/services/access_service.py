@@ -1,101 +1,160 @@
+import uuid
+from typing import List
 from sqlalchemy.orm import Session
-from app.application.use_cases.access_use_case import get_access_by_id_use_case, update_access_use_case, create_access_use_case
+from app.application.use_cases.access_use_case import (
+    get_access_by_id_use_case, update_access_use_case, create_access_use_case,
+    create_accesses_use_case, get_software_ids_with_access_use_case
+)
 from app.application.use_cases.state_request_use_case import get_state_request_by_id_use_case
-from app.domain.schemas.access import AccessUpdate, AccessCreate
-from app.config.logger import get_logger
+from app.application.use_cases.role_use_case import get_role_by_id_use_case
+from app.application.use_cases.software_use_case import get_all_software_use_case
+from app.domain.schemas.access import AccessUpdate, AccessCreate, AccessProvisionRequest
+from app.config.logger import get_logger, lazy
 from fastapi import HTTPException
-from app.application.services.notification_service import notify_team_new_request, notify_user_request_update
+from app.application.services.notification_service import queue_team_new_requests, queue_user_request_update
 
 logger = get_logger("services.access_service")
 
 
 def update_access_status_service(db: Session, access_id: str, new_status: str):
-    logger.info(f"Entrando a update_access_status_service with access_id={access_id}, new_status={new_status}")
-    logger.debug(f"Iniciando actualización de estado de acceso - Access ID: {access_id}, Nuevo estado: {new_status}")
+    logger.info("Entrando a update_access_status_service with access_id=%s, new_status=%s", access_id, new_status)
+    logger.debug("Iniciando actualización de estado de acceso - Access ID: %s, Nuevo estado: %s", access_id, new_status)
     
     try:
-        logger.debug(f"Verificando existencia del estado con ID: {new_status}")
+        logger.debug("Verificando existencia del estado con ID: %s", new_status)
         status_request = get_state_request_by_id_use_case(db, new_status)
         if not status_request:
-            logger.warning(f"Estado con ID {new_status} no encontrado en la base de datos")
+            logger.warning("Estado con ID %s no encontrado en la base de datos", new_status)
             raise ValueError(f"State request with id {new_status} does not exist.")
         
-        logger.debug(f"Estado encontrado: {status_request.label}")
+        logger.debug("Estado encontrado: %s", status_request.label)
         
-        logger.debug(f"Verificando existencia del acceso con ID: {access_id}")
+        logger.debug("Verificando existencia del acceso con ID: %s", access_id)
         existing_access = get_access_by_id_use_case(db, access_id)
         if not existing_access:
-            logger.warning(f"Acceso con ID {access_id} no encontrado")
+            logger.warning("Acceso con ID %s no encontrado", access_id)
             raise ValueError(f"Access with id {access_id} does not exist.")
         
-        logger.debug(f"Acceso encontrado - Estado actual: {getattr(existing_access, 'status', 'N/A')}")
+        logger.debug("Acceso encontrado - Estado actual: %s", getattr(existing_access, 'status', 'N/A'))
         
         user_id = str(existing_access.user_id) if hasattr(existing_access, 'user_id') else None
         if not user_id:
-            logger.warning(f"Acceso {access_id} no tiene usuario asignado para notificación")
+            logger.warning("Acceso %s no tiene usuario asignado para notificación", access_id)
         
         access_data = AccessUpdate(state_request_id=status_request.id)
-        logger.debug(f"Datos de actualización preparados: {access_data}")
+        logger.debug("Datos de actualización preparados: %s", access_data)
 
-        logger.debug(f"Ejecutando update_access_use_case en base de datos")
+        if user_id:
+            logger.debug("Encolando notificación al usuario %s sobre actualización de estado de acceso", user_id)
+            queue_user_request_update(db, user_id, "access", access_id, new_status=status_request.label)
+        
+        logger.debug("Ejecutando update_access_use_case en base de datos")
         updated_access = update_access_use_case(db, access_id, access_data)
         
         if not updated_access:
-            logger.error(f"Fallo en la actualización del acceso con ID {access_id} - Resultado nulo")
+            logger.error("Fallo en la actualización del acceso con ID %s - Resultado nulo", access_id)
             raise ValueError(f"Failed to update access with id {access_id}.")
         
-        logger.info(f"Acceso actualizado exitosamente - ID: {access_id}, Nuevo estado: {updated_access.state_request_id}")
+        logger.info("Acceso actualizado exitosamente - ID: %s, Nuevo estado: %s", access_id, updated_access.state_request_id)
         
-        if user_id:
-            logger.debug(f"Notificando usuario {user_id} sobre actualización de estado de acceso")
-            notify_user_request_update(
-                db=db,
-                user_id=user_id,
-                request_data=updated_access.__dict__,
-                request_type="access",
-                new_status=status_request.label
-            )
-            logger.info(f"Usuario {user_id} notificado sobre la actualización de estado de acceso {access_id}")
-        
-        logger.debug(f"Proceso de actualización completado para acceso {access_id}")
+        logger.debug("Proceso de actualización completado para acceso %s", access_id)
         
         return updated_access
     
     except ValueError as ve:
-        logger.error(f"Error de validación en actualización de acceso: {str(ve)}")
+        logger.error("Error de validación en actualización de acceso: %s", ve)
         raise
     except Exception as e:
-        logger.error(f"Error inesperado durante la actualización del acceso {access_id}: {str(e)}")
+        logger.error("Error inesperado durante la actualización del acceso %s: %s", access_id, e)
         logger.exception("Detalles completos del error:")
         raise ValueError(f"Unexpected error occurred while updating access {access_id}: {str(e)}")
 
 
 def create_access_service(db: Session, access_data: AccessCreate):
-    logger.info(f"Entrando a create_access_service con datos: {access_data.dict()}")
-    logger.debug(f"Iniciando el proceso de creación de solicitud de acceso")
+    logger.info("Entrando a create_access_service con datos: %s", lazy(access_data.dict))
+    logger.debug("Iniciando el proceso de creación de solicitud de acceso")
     
     try:
-        access_created = create_access_use_case(db, access_data)
+        access_id = uuid.uuid4()
+        logger.debug("Encolando notificación al equipo de accesos sobre nueva solicitud")
+        queue_team_new_requests(db, "access", "access", [access_id])
+        
+        access_created = create_access_use_case(db, access_data, access_id)
         if not access_created:
             logger.error("Fallo en la creación de la solicitud de acceso - Resultado nulo")
             raise HTTPException(status_code=500, detail="Error interno al crear la solicitud de acceso")
         
-        logger.info(f"Solicitud de acceso creada - ID: {access_created.id}")
+        logger.info("Solicitud de acceso creada - ID: %s", access_created.id)
         
-        logger.debug(f"Notificando equipo de accesos sobre nueva solicitud")
-        notify_team_new_request(
-            db=db,
-            team_type="access",
-            request_data=access_created.__dict__,
-            request_type="access"
-        )
-        
-        logger.info(f"Proceso de creación de solicitud de acceso completado - ID: {access_created.id}")
+        logger.info("Proceso de creación de solicitud de acceso completado - ID: %s", access_created.id)
         return access_created
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error inesperado durante la creación de la solicitud de acceso: {str(e)}")
+        logger.error("Error inesperado durante la creación de la solicitud de acceso: %s", e)
         logger.exception("Detalles completos del error:")
         raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
+
+
+def create_accesses_service(db: Session, accesses_data: List[AccessCreate]):
+    logger.info("Entrando a create_accesses_service con %s solicitudes", len(accesses_data))
+    
+    try:
+        if not accesses_data:
+            logger.warning("No se proporcionaron solicitudes de acceso")
+            return []
+        
+        access_ids = [uuid.uuid4() for _ in accesses_data]
+        logger.debug("Encolando notificación al equipo de accesos sobre las nuevas solicitudes")
+        queue_team_new_requests(db, "access", "access", access_ids)
+        
+        accesses_created = create_accesses_use_case(db, accesses_data, access_ids)
+        logger.info("Solicitudes de acceso creadas en bloque: %s", len(accesses_created))
+        
+        return accesses_created
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error inesperado durante la creación en bloque de solicitudes de acceso: %s", e)
+        logger.exception("Detalles completos del error:")
+        raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
+
+
+def provision_access_by_role_service(db: Session, provision_data: AccessProvisionRequest):
+    logger.info("Entrando a provision_access_by_role_service con datos: %s", lazy(provision_data.dict))
+    
+    role = get_role_by_id_use_case(db, provision_data.role_id)
+    if not role:
+        logger.warning("Rol con ID %s no encontrado", provision_data.role_id)
+        raise HTTPException(status_code=404, detail=f"Rol con ID {provision_data.role_id} no encontrado")
+    
+    state_request = get_state_request_by_id_use_case(db, provision_data.state_request_id)
+    if not state_request:
+        logger.warning("Estado con ID %s no encontrado", provision_data.state_request_id)
+        raise HTTPException(status_code=404, detail=f"Estado con ID {provision_data.state_request_id} no encontrado")
+    
+    # The software catalog is cached with its roles, so resolving software_roles costs no query.
+    software_ids = [
+        software.id for software in get_all_software_use_case(db)
+        if any(software_role.id == role.id for software_role in software.roles)
+    ]
+    if not software_ids:
+        logger.warning("No hay software disponible para el rol %s", role.label)
+        raise HTTPException(status_code=404, detail="No hay software disponible para este rol")
+    
+    already_provisioned = get_software_ids_with_access_use_case(db, provision_data.user_id, software_ids)
+    if already_provisioned:
+        logger.info("El usuario ya tiene acceso a %s de %s software del rol", len(already_provisioned), len(software_ids))
+    
+    accesses_data = [
+        AccessCreate(
+            user_id=provision_data.user_id,
+            software_id=software_id,
+            state_request_id=state_request.id
+        )
+        for software_id in software_ids if software_id not in already_provisioned
+    ]
+    logger.debug("Solicitudes a crear para el rol %s: %s", role.label, len(accesses_data))
+    return create_accesses_service(db, accesses_data)
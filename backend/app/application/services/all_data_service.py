@@ -1,30 +1,233 @@
+import contextvars
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.application.use_cases.user_use_case import get_all_users_use_case
-from app.application.use_cases.device_use_case import get_all_devices_use_case
-from app.application.use_cases.access_use_case import get_all_accesses_use_case
-from app.config.logger import get_logger
+from app.application.use_cases.user_use_case import get_all_users_use_case, iter_all_users_use_case, get_all_users_async_use_case
+from app.application.use_cases.device_use_case import get_all_devices_use_case, iter_all_devices_use_case, get_all_devices_async_use_case
+from app.application.use_cases.access_use_case import get_all_accesses_use_case, iter_all_accesses_use_case, get_all_accesses_async_use_case
+from app.application.use_cases.user_use_case import get_users_changed_since_use_case, get_users_rows_use_case
+from app.application.use_cases.device_use_case import get_devices_changed_since_use_case, get_devices_rows_use_case
+from app.application.use_cases.access_use_case import get_accesses_changed_since_use_case, get_accesses_rows_use_case
+from app.application.use_cases.role_use_case import get_all_roles_use_case
+from app.application.use_cases.state_request_use_case import get_all_state_requests_use_case
+from app.application.use_cases.software_use_case import get_all_software_use_case
+from app.application.use_cases.collection_version_use_case import (
+    get_sync_watermark_use_case, reference_data_changed_since_use_case
+)
+from app.application.use_cases.tombstone_use_case import get_deleted_ids_since_use_case
+from app.domain.models.user import User
+from app.domain.models.device import Device
+from app.domain.models.access import Access
+from app.domain.schemas.user import UserResponse
+from app.domain.schemas.device import DeviceResponse
+from app.domain.schemas.access import AccessResponse
+from app.config.env import DELTA_SYNC_OVERLAP_SECONDS, ALL_DATA_PARALLEL_READS, ALL_DATA_READ_WORKERS
+from app.config.logger import get_logger, log_event
+from app.config.request_metrics import record_timing
 
 logger = get_logger("services.all_data")
 
+STREAM_BATCH_SIZE = 500
+
+# Response key -> (tombstone entity, changed-since use case)
+DELTA_SECTIONS = {
+    "user": (User.__tablename__, get_users_changed_since_use_case),
+    "devices": (Device.__tablename__, get_devices_changed_since_use_case),
+    "access": (Access.__tablename__, get_accesses_changed_since_use_case),
+}
+
+# Reads for get_all_data_service that run beside the request's own session, each on a connection of its own.
+_read_executor = ThreadPoolExecutor(max_workers=ALL_DATA_READ_WORKERS, thread_name_prefix="all-data-read")
+
+
+def _timed_read(db: Session, name: str, use_case: Callable[[Session], List[Any]]) -> Tuple[List[Any], float]:
+    started = time.perf_counter()
+    rows = use_case(db)
+    elapsed = time.perf_counter() - started
+    record_timing(f"read_{name}", elapsed)
+    logger.debug("%s obtenidos: %s registros en %.1f ms", name, len(rows), elapsed * 1000)
+    return rows, elapsed
+
+
+def _timed_read_own_session(bind: Any, name: str, use_case: Callable[[Session], List[Any]]) -> Tuple[List[Any], float]:
+    # Rows are fully loaded by the use case, so they stay usable once their session is closed.
+    db = Session(bind=bind, autoflush=False)
+    try:
+        return _timed_read(db, name, use_case)
+    finally:
+        db.close()
+
+
 def get_all_data_service(db: Session):
     logger.debug("Iniciando get_all_data_service")
     try:
-        logger.debug("Obteniendo usuarios")
-        users = get_all_users_use_case(db)
-        logger.debug(f"Usuarios obtenidos: {len(users)} registros")
+        # Read before the data so a client resuming from it can only see rows twice, never miss one.
+        watermark = get_sync_watermark_use_case(db)
 
-        logger.debug("Obteniendo dispositivos")
-        devices = get_all_devices_use_case(db)
-        logger.debug(f"Dispositivos obtenidos: {len(devices)} registros")
-
-        logger.debug("Obteniendo accesos")
-        access = get_all_accesses_use_case(db)
-        logger.debug(f"Accesos obtenidos: {len(access)} registros")
+        started = time.perf_counter()
+        if ALL_DATA_PARALLEL_READS:
+            # Devices and accesses are read on other connections while users are read on this one; a copy of
+            # the context per task keeps their queries counted in this request's metrics. Each read is its own
+            # transaction, so a write committed in between can show up in one list and not another (an access
+            # whose user is missing from "user"); the watermark, read first, still makes the next delta sync
+            # pick that write up. ALL_DATA_PARALLEL_READS=false reads all three in this session.
+            bind = db.get_bind()
+            devices_future = _read_executor.submit(
+                contextvars.copy_context().run, _timed_read_own_session, bind, "devices", get_all_devices_use_case)
+            access_future = _read_executor.submit(
+                contextvars.copy_context().run, _timed_read_own_session, bind, "access", get_all_accesses_use_case)
+            users, users_time = _timed_read(db, "users", get_all_users_use_case)
+            devices, devices_time = devices_future.result()
+            access, access_time = access_future.result()
+        else:
+            users, users_time = _timed_read(db, "users", get_all_users_use_case)
+            devices, devices_time = _timed_read(db, "devices", get_all_devices_use_case)
+            access, access_time = _timed_read(db, "access", get_all_accesses_use_case)
 
+        log_event(
+            logger, logging.INFO, "all_data_reads", parallel=ALL_DATA_PARALLEL_READS,
+            users_ms=round(users_time * 1000, 2), devices_ms=round(devices_time * 1000, 2),
+            access_ms=round(access_time * 1000, 2), wall_ms=round((time.perf_counter() - started) * 1000, 2)
+        )
         logger.info("get_all_data_service completado exitosamente")
+        return {"user": users, "devices": devices, "access": access, "watermark": watermark}
+    except Exception as e:
+        logger.error("Error en get_all_data_service: %s", e)
+        raise
+
+
+def get_all_data_changes_service(db: Session, since: datetime):
+    """Rows created or updated after ``since`` plus the ids deleted since then, and the next watermark.
+
+    If a role, state or software changed in the window, the rows embedding it are not in the delta, so
+    everything is returned instead with ``full_resync`` set and the client replaces what it holds.
+    """
+    logger.debug("Iniciando get_all_data_changes_service con since=%s", since)
+    try:
+        window_start = since - timedelta(seconds=DELTA_SYNC_OVERLAP_SECONDS)
+        if reference_data_changed_since_use_case(db, window_start):
+            logger.info("Datos de referencia modificados desde %s; se envía una resincronización completa", since)
+            return {**get_all_data_service(db), "deleted": _no_deletions(), "full_resync": True}
+
+        watermark = get_sync_watermark_use_case(db)
+
+        changes = {}
+        for key, (_, changed_since_use_case) in DELTA_SECTIONS.items():
+            changes[key] = changed_since_use_case(db, window_start)
+            logger.debug("Cambios en %s: %s registros", key, len(changes[key]))
+
+        changes["deleted"] = _deleted_since(db, window_start)
+
+        logger.info("get_all_data_changes_service completado exitosamente")
+        return {**changes, "watermark": watermark}
+    except Exception as e:
+        logger.error("Error en get_all_data_changes_service: %s", e)
+        raise
+
+
+def _no_deletions():
+    return {key: [] for key in DELTA_SECTIONS}
+
+
+def _deleted_since(db: Session, window_start: datetime):
+    tombstones = get_deleted_ids_since_use_case(
+        db, [entity for entity, _ in DELTA_SECTIONS.values()], window_start)
+    return {key: tombstones[entity] for key, (entity, _) in DELTA_SECTIONS.items()}
+
+
+def get_all_data_normalized_service(db: Session, since: Optional[datetime] = None):
+    """``shape=normalized``: plain column rows plus one lookup map per referenced table.
+
+    Rows come back as column tuples (no ORM entities, no joins); roles, states and software are read from the
+    reference caches and only the ones referenced by the rows are included. With ``since`` it is the delta
+    variant, with ``deleted`` and the same overlap window and ``full_resync`` rule as get_all_data_changes_service.
+    """
+    logger.debug("Iniciando get_all_data_normalized_service con since=%s", since)
+    try:
+        watermark = get_sync_watermark_use_case(db)
+        window_start = since - timedelta(seconds=DELTA_SYNC_OVERLAP_SECONDS) if since is not None else None
+        full_resync = window_start is not None and reference_data_changed_since_use_case(db, window_start)
+        if full_resync:
+            logger.info("Datos de referencia modificados desde %s; se envía una resincronización completa", since)
+            window_start = None
+
+        users = get_users_rows_use_case(db, window_start)
+        devices = get_devices_rows_use_case(db, window_start)
+        access = get_accesses_rows_use_case(db, window_start)
+        logger.debug("Filas obtenidas: %s usuarios, %s dispositivos, %s accesos", len(users), len(devices), len(access))
+
+        software_by_id = {software.id: software for software in get_all_software_use_case(db)}
+        software = {}
+        for software_id in {row.software_id for row in access}:
+            item = software_by_id.get(software_id)
+            if item is not None:
+                software[software_id] = {
+                    **item.model_dump(exclude={"roles"}), "role_ids": [role.id for role in item.roles]}
+
+        role_ids = {row.role_id for row in users}
+        role_ids.update(role_id for item in software.values() for role_id in item["role_ids"])
+        state_ids = {row.state_request_id for row in devices} | {row.state_request_id for row in access}
+
+        data = {
+            "user": users,
+            "devices": devices,
+            "access": access,
+            "roles": {role.id: role for role in get_all_roles_use_case(db) if role.id in role_ids},
+            "state_requests": {
+                state.id: state for state in get_all_state_requests_use_case(db) if state.id in state_ids},
+            "software": software,
+            "watermark": watermark,
+        }
+        if since is not None:
+            data["deleted"] = _no_deletions() if full_resync else _deleted_since(db, window_start)
+            data["full_resync"] = full_resync
+        logger.info("get_all_data_normalized_service completado exitosamente")
+        return data
+    except Exception as e:
+        logger.error("Error en get_all_data_normalized_service: %s", e)
+        raise
+
+
+async def get_all_data_async_service(db: AsyncSession):
+    logger.debug("Iniciando get_all_data_async_service")
+    try:
+        users = await get_all_users_async_use_case(db)
+        logger.debug("Usuarios obtenidos: %s registros", len(users))
+
+        devices = await get_all_devices_async_use_case(db)
+        logger.debug("Dispositivos obtenidos: %s registros", len(devices))
+
+        access = await get_all_accesses_async_use_case(db)
+        logger.debug("Accesos obtenidos: %s registros", len(access))
+
+        logger.info("get_all_data_async_service completado exitosamente")
         return {"user": users, "devices": devices, "access": access}
     except Exception as e:
-        logger.error(f"Error en get_all_data_service: {e}")
+        logger.error("Error en get_all_data_async_service: %s", e)
         raise
 
 
+def stream_all_data_service(db: Session) -> Iterator[str]:
+    """Yield one NDJSON line per user, device and access, reading each table through a server-side cursor."""
+    logger.debug("Iniciando stream_all_data_service")
+    sections = (
+        ("user", iter_all_users_use_case, UserResponse),
+        ("devices", iter_all_devices_use_case, DeviceResponse),
+        ("access", iter_all_accesses_use_case, AccessResponse),
+    )
+    try:
+        for record_type, iter_use_case, schema in sections:
+            count = 0
+            for row in iter_use_case(db, STREAM_BATCH_SIZE):
+                data = schema.model_validate(row).model_dump_json()
+                yield f'{{"type":"{record_type}","data":{data}}}\n'
+                count += 1
+            logger.debug("Registros de %s emitidos: %s", record_type, count)
+        logger.info("stream_all_data_service completado exitosamente")
+    except Exception as e:
+        logger.error("Error en stream_all_data_service: %s", e)
+        raise
@@ -1,3 +1,4 @@
+import uuid
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 from app.application.use_cases.device_use_case import (
@@ -5,83 +6,80 @@ from app.application.use_cases.device_use_case import (
     update_device_use_case,
     get_device_by_id_use_case
 )
+from app.application.use_cases.state_request_use_case import get_state_request_by_id_use_case
 from app.domain.schemas.device import DeviceCreate, DeviceUpdate
-from app.application.services.notification_service import notify_team_new_request, notify_user_request_update
-from app.config.logger import get_logger
+from app.application.services.notification_service import queue_team_new_requests, queue_user_request_update
+from app.config.logger import get_logger, lazy
 
 logger = get_logger("services.device_service")
 
 def create_device_service(db: Session, device_data: DeviceCreate):
-    logger.info(f"Entrando a create_device_service con datos: {device_data.dict()}")
-    logger.debug(f"Iniciando el proceso de creación de device")
+    logger.info("Entrando a create_device_service con datos: %s", lazy(device_data.dict))
+    logger.debug("Iniciando el proceso de creación de device")
     
     try:
-        device_created = create_device_use_case(db, device_data)
+        device_id = uuid.uuid4()
+        logger.debug("Encolando notificación al equipo de TI sobre nueva solicitud de dispositivo")
+        queue_team_new_requests(db, "it", "device", [device_id])
+        
+        device_created = create_device_use_case(db, device_data, device_id)
         if not device_created:
             logger.error("Fallo en la creación del dispositivo - Resultado nulo")
             raise HTTPException(status_code=500, detail="Error interno al crear el dispositivo")
         
-        logger.info(f"Dispositivo creado - ID: {device_created.id}")
-        
-        logger.debug(f"Notificando equipo de TI sobre nueva solicitud de dispositivo")
-        notify_team_new_request(
-            db=db,
-            team_type="it",
-            request_data=device_created.__dict__,
-            request_type="device"
-        )
+        logger.info("Dispositivo creado - ID: %s", device_created.id)
         
-        logger.info(f"Proceso de creación de dispositivo completado - ID: {device_created.id}")
+        logger.info("Proceso de creación de dispositivo completado - ID: %s", device_created.id)
         return device_created
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error inesperado durante la creación del dispositivo: {str(e)}")
+        logger.error("Error inesperado durante la creación del dispositivo: %s", e)
         logger.exception("Detalles completos del error:")
         raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
 
 def update_device_status_service(db: Session, device_id: str, device_data: DeviceUpdate):
-    logger.info(f"Entrando a update_device_status_service con ID={device_id}")
-    logger.debug(f"Iniciando actualización de estado de dispositivo - Device ID: {device_id}")
+    logger.info("Entrando a update_device_status_service con ID=%s", device_id)
+    logger.debug("Iniciando actualización de estado de dispositivo - Device ID: %s", device_id)
     
     try:
-        logger.debug(f"Verificando existencia del dispositivo con ID: {device_id}")
+        logger.debug("Verificando existencia del dispositivo con ID: %s", device_id)
         existing_device = get_device_by_id_use_case(db, device_id)
         if not existing_device:
-            logger.warning(f"Dispositivo con ID {device_id} no encontrado")
+            logger.warning("Dispositivo con ID %s no encontrado", device_id)
             raise HTTPException(status_code=404, detail=f"Device with ID {device_id} not found")
         
-        logger.debug(f"Dispositivo encontrado - ID: {device_id}")
+        logger.debug("Dispositivo encontrado - ID: %s", device_id)
         user_id = existing_device.user_id if hasattr(existing_device, 'user_id') else None
         
         if not user_id:
-            logger.warning(f"Dispositivo {device_id} no tiene usuario asignado para notificación")
+            logger.warning("Dispositivo %s no tiene usuario asignado para notificación", device_id)
+        
+        if user_id:
+            # The label is captured now: by the time the dispatcher runs, the device may have moved on.
+            new_status = None
+            if device_data.state_request_id:
+                state_request = get_state_request_by_id_use_case(db, device_data.state_request_id)
+                new_status = state_request.label if state_request else None
+            logger.debug("Encolando notificación al usuario sobre actualización de dispositivo")
+            queue_user_request_update(db, user_id, "device", device_id, new_status=new_status)
         
-        logger.debug(f"Actualizando dispositivo en base de datos")
+        logger.debug("Actualizando dispositivo en base de datos")
         updated_device = update_device_use_case(db, device_id, device_data)
         
         if not updated_device:
-            logger.error(f"Fallo en la actualización del dispositivo con ID {device_id} - Resultado nulo")
+            logger.error("Fallo en la actualización del dispositivo con ID %s - Resultado nulo", device_id)
             raise HTTPException(status_code=500, detail=f"Failed to update device with ID {device_id}")
         
-        logger.info(f"Dispositivo actualizado exitosamente - ID: {device_id}")
-        
-        if user_id:
-            logger.debug(f"Notificando usuario sobre actualización de dispositivo")
-            notify_user_request_update(
-                db=db,
-                user_id=str(user_id),
-                request_data=updated_device.__dict__,
-                request_type="device"
-            )
+        logger.info("Dispositivo actualizado exitosamente - ID: %s", device_id)
         
-        logger.debug(f"Proceso de actualización completado para dispositivo {device_id}")
+        logger.debug("Proceso de actualización completado para dispositivo %s", device_id)
         return updated_device
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error inesperado durante la actualización del dispositivo {device_id}: {str(e)}")
+        logger.error("Error inesperado durante la actualización del dispositivo %s: %s", device_id, e)
         logger.exception("Detalles completos del error:")
         raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
@@ -0,0 +1,237 @@
+import threading
+from email.message import EmailMessage
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from app.application.use_cases.access_use_case import get_accesses_by_ids_use_case
+from app.application.use_cases.device_use_case import get_devices_by_ids_use_case
+from app.application.use_cases.notification_outbox_use_case import (
+    claim_notification_batch_use_case,
+    get_notification_events_use_case,
+    mark_notification_sent_use_case,
+    mark_notification_failed_use_case,
+    complete_notification_batch_use_case
+)
+from app.application.services.notification_service import (
+    TEAM_NEW_REQUEST_EVENT,
+    USER_REQUEST_UPDATE_EVENT,
+    build_team_new_requests_notification,
+    build_user_request_updates_notification
+)
+from app.domain.models.notification_outbox import NotificationOutbox
+from app.infrastructure.email.delivery import DeliveryBackend, delivery_backend
+from app.config.notification_config import NOTIFICATION_SETTINGS
+from app.config.logger import get_logger
+
+logger = get_logger("services.notification_dispatcher")
+
+_REQUEST_LOADERS = {
+    "access": get_accesses_by_ids_use_case,
+    "device": get_devices_by_ids_use_case,
+}
+
+
+def _load_requests(db: Session, request_type: str, request_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Load the requests named by a group of events in one query, keyed by id."""
+    requests = {str(request.id): request.__dict__ for request in _REQUEST_LOADERS[request_type](db, request_ids)}
+    missing = len(set(request_ids)) - len(requests)
+    if missing:
+        logger.warning("%s solicitudes de %s ya no existen; se omiten de la notificación", missing, request_type)
+    return requests
+
+
+def _render_team_new_requests(db: Session, payloads: List[Dict[str, Any]]) -> Optional[EmailMessage]:
+    team_type, request_type = payloads[0]["team_type"], payloads[0]["request_type"]
+    request_ids = [request_id for payload in payloads for request_id in payload["request_ids"]]
+    requests = _load_requests(db, request_type, request_ids)
+    return build_team_new_requests_notification(
+        db, team_type, [requests[request_id] for request_id in request_ids if request_id in requests], request_type)
+
+
+def _render_user_request_updates(db: Session, payloads: List[Dict[str, Any]]) -> Optional[EmailMessage]:
+    requests = {}
+    for request_type in dict.fromkeys(payload["request_type"] for payload in payloads):
+        ids = [payload["request_id"] for payload in payloads if payload["request_type"] == request_type]
+        requests[request_type] = _load_requests(db, request_type, ids)
+    updates = [
+        {
+            "request_type": payload["request_type"],
+            "request_data": requests[payload["request_type"]][payload["request_id"]],
+            "new_status": payload.get("new_status")
+        }
+        for payload in payloads if payload["request_id"] in requests[payload["request_type"]]
+    ]
+    return build_user_request_updates_notification(db, payloads[0]["user_id"], updates)
+
+
+# Each handler renders the message for the payloads of one group (a single event, or every event of a
+# digest), or returns None when there is nobody left to notify. Handlers only read; sending is batched.
+EVENT_HANDLERS: Dict[str, Callable[[Session, List[Dict[str, Any]]], Optional[EmailMessage]]] = {
+    TEAM_NEW_REQUEST_EVENT: _render_team_new_requests,
+    USER_REQUEST_UPDATE_EVENT: _render_user_request_updates,
+}
+
+
+class NotificationDispatcher:
+    """Background thread that drains the notification outbox in batches, retrying failures with backoff.
+
+    Events are claimed and leased in a short transaction and their messages rendered; the whole batch is
+    then handed to ``DeliveryBackend.send_many`` with no transaction open, and the outcome of each event
+    recorded in a second short transaction, so a slow SMTP server never keeps the outbox locked.
+
+    With ``digest`` enabled, events sharing a digest key are sent as one message of up to
+    ``max_batch_size`` requests.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session], batch_size: int, poll_interval_seconds: float,
+                 max_attempts: int, retry_backoff_seconds: int, lease_seconds: int,
+                 digest: Optional[Dict[str, Any]] = None, delivery: DeliveryBackend = delivery_backend):
+        self._session_factory = session_factory
+        self.delivery = delivery
+        self.digest = digest
+        self.batch_size = batch_size
+        self.lease_seconds = lease_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+        self.max_attempts = max_attempts
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="notification-dispatcher", daemon=True)
+        self._thread.start()
+        logger.info("Dispatcher de notificaciones iniciado")
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        logger.info("Dispatcher de notificaciones detenido")
+
+    def _run(self):
+        while not self._stop.is_set():
+            dispatched = self.dispatch_batch()
+            # A full batch means there is probably more waiting; otherwise sleep until the next poll.
+            if dispatched < self.batch_size:
+                self._stop.wait(self.poll_interval_seconds)
+
+    def _group_events(self, events: List[NotificationOutbox]) -> List[List[NotificationOutbox]]:
+        """Split the claimed events into messages; digests are packed up to ``max_batch_size`` requests each."""
+        if not self.digest or not self.digest.get("enabled"):
+            return [[event] for event in events]
+        groups: List[List[NotificationOutbox]] = []
+        digests: Dict[str, List[NotificationOutbox]] = {}
+        for event in events:
+            if event.digest_key is None:
+                groups.append([event])
+            else:
+                digests.setdefault(f"{event.event_type}|{event.digest_key}", []).append(event)
+        size = self.digest["max_batch_size"]
+        for digest in digests.values():
+            group: List[NotificationOutbox] = []
+            requests = 0
+            for event in digest:
+                count = event.request_count
+                if group and requests + count > size:
+                    groups.append(group)
+                    group, requests = [], 0
+                group.append(event)
+                requests += count
+            if group:
+                groups.append(group)
+        return groups
+
+    def _messages(self, group: List[NotificationOutbox]) -> List[List[Dict[str, Any]]]:
+        """Payloads for each message of a group: one message, unless a single bulk event alone exceeds the limit."""
+        payloads = [event.payload for event in group]
+        if not self.digest or not self.digest.get("enabled") or len(group) > 1:
+            return [payloads]
+        size = self.digest["max_batch_size"]
+        request_ids = payloads[0].get("request_ids")
+        if not request_ids or len(request_ids) <= size:
+            return [payloads]
+        return [[{**payloads[0], "request_ids": request_ids[i:i + size]}] for i in range(0, len(request_ids), size)]
+
+    def _render(self, db: Session, event_type: str, messages: List[List[Dict[str, Any]]]) -> List[EmailMessage]:
+        handler = EVENT_HANDLERS.get(event_type)
+        if handler is None:
+            raise ValueError(f"Tipo de evento desconocido: {event_type}")
+        rendered = (handler(db, payloads) for payloads in messages)
+        return [message for message in rendered if message is not None]
+
+    def _deliver(self, groups: List[Tuple[str, List[EmailMessage]]]) -> List[Optional[str]]:
+        """Send every rendered message of the batch in one ``send_many`` call; returns each group's error, if any."""
+        errors: List[Optional[str]] = [None] * len(groups)
+        outbox = [(index, message) for index, (_, messages) in enumerate(groups) for message in messages]
+        if not outbox:
+            return errors
+        try:
+            results = self.delivery.send_many([message for _, message in outbox])
+        except Exception as e:
+            logger.error("Error enviando el lote de notificaciones: %s", e)
+            results = None
+        for position, (index, message) in enumerate(outbox):
+            result = results[position] if results is not None else None
+            if result is not None and result.ok:
+                logger.info("NOTIFICATION [%s] sent to %s: %s", groups[index][0], message["To"], message["Subject"])
+            elif errors[index] is None:
+                # Nobody received it: the whole group goes back to the outbox for a retry.
+                reason = result.describe() if result is not None else "error de envío"
+                errors[index] = f"Notificación no entregada a {message['To']}: {reason}"
+        return errors
+
+    def _record(self, db: Session, now, groups: List[List[Any]], errors: List[Optional[str]]):
+        outcome = {event_id: error for event_ids, error in zip(groups, errors) for event_id in event_ids}
+        for event in get_notification_events_use_case(db, list(outcome)):
+            error = outcome[event.id]
+            if error is None:
+                mark_notification_sent_use_case(event, now)
+            else:
+                mark_notification_failed_use_case(event, now, error, self.max_attempts, self.retry_backoff_seconds)
+        complete_notification_batch_use_case(db)
+
+    def dispatch_batch(self) -> int:
+        db = self._session_factory()
+        try:
+            now, events = claim_notification_batch_use_case(db, self.batch_size, self.lease_seconds, self.digest)
+            if not events:
+                complete_notification_batch_use_case(db)
+                return 0
+            # Taken before the commit below expires the claimed rows.
+            groups = [([event.id for event in group], group[0].event_type, self._messages(group))
+                      for group in self._group_events(events)]
+            complete_notification_batch_use_case(db)
+
+            rendered: List[Tuple[str, List[EmailMessage]]] = []
+            render_errors: List[Optional[str]] = []
+            for _, event_type, messages in groups:
+                try:
+                    rendered.append((event_type, self._render(db, event_type, messages)))
+                    render_errors.append(None)
+                except Exception as e:
+                    rendered.append((event_type, []))
+                    render_errors.append(str(e))
+            # Ends the read transaction the handlers opened before any network I/O.
+            db.rollback()
+
+            errors = [render_error or delivery_error
+                      for render_error, delivery_error in zip(render_errors, self._deliver(rendered))]
+            self._record(db, now, [event_ids for event_ids, _, _ in groups], errors)
+            return len(events)
+        except Exception as e:
+            db.rollback()
+            logger.error("Error procesando el outbox de notificaciones: %s", e)
+            return 0
+        finally:
+            db.close()
+
+
+def _create_dispatcher() -> NotificationDispatcher:
+    from app.infrastructure.database.database import SessionLocal
+    return NotificationDispatcher(SessionLocal, digest=NOTIFICATION_SETTINGS.get("digest"), **NOTIFICATION_SETTINGS["outbox"])
+
+
+notification_dispatcher = _create_dispatcher()
@@ -1,22 +1,29 @@
 from sqlalchemy.orm import Session
-from app.config.logger import get_logger
+from app.config.logger import get_logger, lazy
 from typing import Optional, Dict, Any, List
 from app.domain.models.user import User
 from app.domain.schemas.access import AccessResponse
 from app.domain.schemas.device import DeviceResponse
-from app.application.use_cases.user_use_case import get_user_by_id_use_case
-from app.config.notification_config import NOTIFICATION_SETTINGS, EMAIL_TEMPLATES
+from app.application.use_cases.user_use_case import get_user_by_id_use_case, get_users_by_ids_use_case
+from app.application.use_cases.software_use_case import get_software_by_id_use_case
+from app.application.use_cases.state_request_use_case import get_state_request_by_id_use_case
+from app.application.use_cases.notification_outbox_use_case import enqueue_notification_use_case
+from app.application.services.notification_templates import render_notification
+from app.config.notification_config import NOTIFICATION_SETTINGS
 import json
-from datetime import datetime
+from email.message import EmailMessage
 
 logger = get_logger("services.notification_service")
 
+TEAM_NEW_REQUEST_EVENT = "team_new_request"
+USER_REQUEST_UPDATE_EVENT = "user_request_update"
+
 def _get_user_info(db: Session, user_id: str) -> Optional[Dict[str, Any]]:
-    logger.debug(f"Getting user info for user ID: {user_id}")
+    logger.debug("Getting user info for user ID: %s", user_id)
     user = get_user_by_id_use_case(db, user_id)
     
     if not user:
-        logger.warning(f"User with ID {user_id} not found for notification")
+        logger.warning("User with ID %s not found for notification", user_id)
         return None
     
     return {
@@ -27,20 +34,49 @@ def _get_user_info(db: Session, user_id: str) -> Optional[Dict[str, Any]]:
         "team": user.team
     }
 
-def _log_notification_sent(notification_type: str, recipient_type: str, recipient: str, content: Dict[str, Any], template_key: Optional[str] = None):
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"NOTIFICATION [{notification_type}] sent at {timestamp} to {recipient_type}: {recipient}")
+def _get_users_info(db: Session, user_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Batch variant of ``_get_user_info`` for digests: one query for every user mentioned."""
+    users = get_users_by_ids_use_case(db, list(dict.fromkeys(user_ids))) if user_ids else []
+    return {str(user.id): {"id": str(user.id), "name": user.name, "email": user.email,
+                           "area": user.area, "team": user.team} for user in users}
+
+# Reference tables are served from the in-process cache, so resolving them by id costs no query.
+_REFERENCE_LOOKUPS = {
+    "software": get_software_by_id_use_case,
+    "state_request": get_state_request_by_id_use_case,
+}
+
+def _related_value(db: Session, request_data: Dict[str, Any], relation: str, attr: str, default: str = "N/A") -> Any:
+    related = request_data.get(relation)
+    related_id = request_data.get(f"{relation}_id")
+    if related is None and related_id is not None and relation in _REFERENCE_LOOKUPS:
+        related = _REFERENCE_LOOKUPS[relation](db, related_id)
+    if related is None:
+        return default
+    if isinstance(related, dict):
+        return related.get(attr, default)
+    return getattr(related, attr, default)
+
+def _build_notification(notification_type: str, recipient: str, content: Dict[str, Any], template_key: Optional[str] = None,
+                        items: Optional[List[Dict[str, Any]]] = None) -> EmailMessage:
+    rendered = render_notification(template_key, content, items) if template_key else None
+    subject, body = rendered or (f"Notificación {notification_type}", json.dumps(content, default=str, indent=2))
     
-    if template_key and template_key in EMAIL_TEMPLATES:
-        subject = EMAIL_TEMPLATES[template_key].get("subject", "No subject")
-        logger.info(f"Email subject: {subject}")
+    message = EmailMessage()
+    message["From"] = NOTIFICATION_SETTINGS["delivery"]["sender"]
+    message["To"] = recipient
+    message["Subject"] = subject
+    message.set_content(body)
     
-    logger.info(f"Notification content: {json.dumps(content, default=str)}")
+    logger.debug("Notification [%s] for %s rendered: %s", notification_type, recipient, subject)
+    logger.debug("Notification content: %s", lazy(json.dumps, content, default=str))
+    return message
 
-def notify_team_new_request(db: Session, team_type: str, request_data: Dict[str, Any], request_type: str):
+def build_team_new_request_notification(db: Session, team_type: str, request_data: Dict[str, Any],
+                                         request_type: str) -> Optional[EmailMessage]:
     if team_type not in ["access", "it"]:
-        logger.error(f"Invalid team type for notification: {team_type}")
-        return
+        logger.error("Invalid team type for notification: %s", team_type)
+        return None
     
     team_settings = NOTIFICATION_SETTINGS["teams"].get(team_type, {})
     team_email = team_settings.get("email", "unknown@example.com")
@@ -58,26 +94,70 @@ def notify_team_new_request(db: Session, team_type: str, request_data: Dict[str,
         "request_type": request_type,
         "created_at": str(request_data.get("created_at", "Unknown")),
         "user_name": user_name,
-        "software_name": request_data.get("software", {}).get("name", "N/A") if request_type == "access" else "N/A",
+        "software_name": _related_value(db, request_data, "software", "name") if request_type == "access" else "N/A",
         "device_type": request_data.get("type", "N/A") if request_type == "device" else "N/A",
-        "status": request_data.get("state_request", {}).get("label", "N/A")
+        "status": _related_value(db, request_data, "state_request", "label")
     }
     
     team_name = "Equipo de Accesos" if team_type == "access" else "Equipo de Tecnología TI"
-    logger.info(f"TEAM_NOTIFICATION: Nueva solicitud de {request_type} recibida - ID: {notification_content['request_id']} - Para: {team_name}")
+    logger.info("TEAM_NOTIFICATION: Nueva solicitud de %s recibida - ID: %s - Para: %s", request_type, notification_content['request_id'], team_name)
     
-    _log_notification_sent("team", "email", team_email, notification_content, template_key)
+    return _build_notification("team", team_email, notification_content, template_key)
 
-def notify_user_request_update(db: Session, user_id: str, request_data: Dict[str, Any], request_type: str, 
-                               new_status: Optional[str] = None):
+def build_team_new_requests_notification(db: Session, team_type: str, requests_data: List[Dict[str, Any]],
+                                          request_type: str) -> Optional[EmailMessage]:
+    """One digest team notification listing a batch of requests, rendered from the ``<type>_created_digest`` template."""
+    if team_type not in ["access", "it"]:
+        logger.error("Invalid team type for notification: %s", team_type)
+        return None
+    if not requests_data:
+        return None
+    if len(requests_data) == 1:
+        return build_team_new_request_notification(db, team_type, requests_data[0], request_type)
+    
+    team_settings = NOTIFICATION_SETTINGS["teams"].get(team_type, {})
+    team_email = team_settings.get("email", "unknown@example.com")
+    
+    template_key = f"{request_type}_created_digest"
+    
+    users_info = _get_users_info(db, [str(data["user_id"]) for data in requests_data if "user_id" in data])
+    
+    items = [
+        {
+            "request_id": str(data.get("id", "Unknown")),
+            "created_at": str(data.get("created_at", "Unknown")),
+            "user_name": users_info.get(str(data.get("user_id")), {}).get("name", "N/A"),
+            "software_name": _related_value(db, data, "software", "name") if request_type == "access" else "N/A",
+            "device_type": data.get("type", "N/A") if request_type == "device" else "N/A",
+            "status": _related_value(db, data, "state_request", "label")
+        }
+        for data in requests_data
+    ]
+    created = sorted(str(data.get("created_at", "")) for data in requests_data)
+    
+    notification_content = {
+        "request_ids": [item["request_id"] for item in items],
+        "request_count": len(items),
+        "request_type": request_type,
+        "first_created_at": created[0],
+        "last_created_at": created[-1]
+    }
+    
+    team_name = "Equipo de Accesos" if team_type == "access" else "Equipo de Tecnología TI"
+    logger.info("TEAM_NOTIFICATION: %s nuevas solicitudes de %s recibidas - Para: %s", len(requests_data), request_type, team_name)
+    
+    return _build_notification("team", team_email, notification_content, template_key, items)
+
+def build_user_request_update_notification(db: Session, user_id: str, request_data: Dict[str, Any], request_type: str,
+                                           new_status: Optional[str] = None) -> Optional[EmailMessage]:
     user_info = _get_user_info(db, user_id)
     if not user_info:
-        logger.warning(f"Cannot notify user {user_id} - user not found")
-        return
+        logger.warning("Cannot notify user %s - user not found", user_id)
+        return None
     
     template_key = f"{request_type}_updated"
     
-    status = new_status or request_data.get("state_request", {}).get("label", "Unknown")
+    status = new_status or _related_value(db, request_data, "state_request", "label", "Unknown")
     
     notification_content = {
         "request_id": str(request_data.get("id", "Unknown")),
@@ -85,12 +165,73 @@ def notify_user_request_update(db: Session, user_id: str, request_data: Dict[str
         "status": status,
         "updated_at": str(request_data.get("updated_at", "Unknown")),
         "user_name": user_info['name'],
-        "software_name": request_data.get("software", {}).get("name", "N/A") if request_type == "access" else "N/A",
+        "software_name": _related_value(db, request_data, "software", "name") if request_type == "access" else "N/A",
         "device_type": request_data.get("type", "N/A") if request_type == "device" else "N/A"
     }
     
-    logger.info(f"USER_NOTIFICATION: Usuario {user_info['name']} notificado sobre actualización " 
-                f"de solicitud de {request_type} - ID: {notification_content['request_id']}, " 
-                f"Estado: {notification_content['status']}")
+    logger.info("USER_NOTIFICATION: Usuario %s notificado sobre actualización " 
+                "de solicitud de %s - ID: %s, " 
+                "Estado: %s", user_info['name'], request_type, notification_content['request_id'], notification_content['status'])
+    
+    return _build_notification("user", user_info['email'], notification_content, template_key)
+
+def build_user_request_updates_notification(db: Session, user_id: str, updates: List[Dict[str, Any]]) -> Optional[EmailMessage]:
+    """One digest notification for several status changes of the same user's requests.
+
+    ``updates`` holds ``{"request_type", "request_data", "new_status"}`` entries.
+    """
+    if not updates:
+        return None
+    if len(updates) == 1:
+        update = updates[0]
+        return build_user_request_update_notification(db, user_id, update["request_data"], update["request_type"], update.get("new_status"))
+    
+    user_info = _get_user_info(db, user_id)
+    if not user_info:
+        logger.warning("Cannot notify user %s - user not found", user_id)
+        return None
     
-    _log_notification_sent("user", "email", user_info['email'], notification_content, template_key)
+    items = []
+    for update in updates:
+        request_data = update["request_data"]
+        request_type = update["request_type"]
+        items.append({
+            "request_id": str(request_data.get("id", "Unknown")),
+            "request_label": f"Acceso a {_related_value(db, request_data, 'software', 'name')}" if request_type == "access"
+                             else f"Dispositivo {request_data.get('type', 'N/A')}",
+            "status": update.get("new_status") or _related_value(db, request_data, "state_request", "label", "Unknown"),
+            "updated_at": str(request_data.get("updated_at", "Unknown"))
+        })
+    
+    notification_content = {
+        "request_ids": [item["request_id"] for item in items],
+        "request_count": len(items),
+        "user_name": user_info["name"]
+    }
+    
+    logger.info("USER_NOTIFICATION: Usuario %s notificado sobre %s actualizaciones de solicitudes", user_info['name'], len(items))
+    
+    return _build_notification("user", user_info["email"], notification_content, "request_updates_digest", items)
+
+# The queue_* functions only add an outbox row to the caller's session: they must run before the
+# use case that commits, so the request and its notification are stored in the same transaction.
+# The notification itself is sent later by the dispatcher (see notification_dispatcher).
+def queue_team_new_requests(db: Session, team_type: str, request_type: str, request_ids: List[Any]):
+    if not request_ids:
+        return
+    logger.debug("Encolando notificación de %s solicitudes de %s para el equipo %s", len(request_ids), request_type, team_type)
+    enqueue_notification_use_case(db, TEAM_NEW_REQUEST_EVENT, {
+        "team_type": team_type,
+        "request_type": request_type,
+        "request_ids": [str(request_id) for request_id in request_ids],
+    }, digest_key=f"team:{team_type}:{request_type}", request_count=len(request_ids))
+
+def queue_user_request_update(db: Session, user_id: Any, request_type: str, request_id: Any,
+                              new_status: Optional[str] = None):
+    logger.debug("Encolando notificación de actualización de %s %s para el usuario %s", request_type, request_id, user_id)
+    enqueue_notification_use_case(db, USER_REQUEST_UPDATE_EVENT, {
+        "user_id": str(user_id),
+        "request_type": request_type,
+        "request_id": str(request_id),
+        "new_status": new_status,
+    }, digest_key=f"user:{user_id}")
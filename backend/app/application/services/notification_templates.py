@@ -0,0 +1,45 @@
+import string
+import textwrap
+from typing import Any, Dict, List, Optional, Tuple
+from app.config.notification_config import EMAIL_TEMPLATES
+
+_FORMATTER = string.Formatter()
+
+
+class _Fields(dict):
+    def __missing__(self, key):
+        return "N/A"
+
+
+class CompiledTemplate:
+    """An EMAIL_TEMPLATES entry prepared once: body dedented and every placeholder checked up front."""
+
+    __slots__ = ("key", "subject", "body", "item")
+
+    def __init__(self, key: str, spec: Dict[str, str]):
+        self.key = key
+        self.subject = spec.get("subject", "No subject")
+        self.body = textwrap.dedent(spec.get("body", "")).strip()
+        self.item = spec.get("item")
+        for text in (self.subject, self.body, self.item or ""):
+            # Raises ValueError on a malformed placeholder at import time instead of mid-send.
+            list(_FORMATTER.parse(text))
+
+    def render(self, content: Dict[str, Any], items: Optional[List[Dict[str, Any]]] = None) -> Tuple[str, str]:
+        fields = _Fields(content)
+        if self.item is not None and items is not None:
+            fields["items"] = "\n".join(self.item.format_map(_Fields(item)) for item in items)
+        return self.subject.format_map(fields), self.body.format_map(fields)
+
+
+COMPILED_TEMPLATES: Dict[str, CompiledTemplate] = {
+    key: CompiledTemplate(key, spec) for key, spec in EMAIL_TEMPLATES.items()
+}
+
+
+def render_notification(template_key: str, content: Dict[str, Any],
+                        items: Optional[List[Dict[str, Any]]] = None) -> Optional[Tuple[str, str]]:
+    template = COMPILED_TEMPLATES.get(template_key)
+    if template is None:
+        return None
+    return template.render(content, items)
@@ -4,20 +4,20 @@ from app.domain.schemas.software import SoftwareCreate, SoftwareCreateRequest, S
 from app.application.use_cases.software_use_case import create_software_use_case, update_software_use_case, get_software_by_id_use_case
 from app.application.use_cases.software_roles_use_case import assign_role_to_software_use_case, remove_role_from_software_use_case
 from app.application.use_cases.role_use_case import get_role_by_id_use_case
-from app.config.logger import get_logger
+from app.config.logger import get_logger, lazy
 from typing import List, Set
 
 logger = get_logger("services.software_service")
 
 
 def _validate_role_exists(db: Session, role_id: str):
-    logger.info(f"Verificando existencia del rol con ID: {role_id}")
+    logger.info("Verificando existencia del rol con ID: %s", role_id)
     rol = get_role_by_id_use_case(db, role_id)
     if not rol:
-        logger.error(f"Rol con ID {role_id} no encontrado en base de datos")
+        logger.error("Rol con ID %s no encontrado en base de datos", role_id)
         raise HTTPException(status_code=404, detail=f"Rol con ID {role_id} no encontrado")
     
-    logger.info(f"Rol encontrado - ID: {rol.id}, Label: {rol.label}")
+    logger.info("Rol encontrado - ID: %s, Label: %s", rol.id, rol.label)
     return rol
 
 
@@ -25,18 +25,18 @@ def _process_software_url(software_data_dict: dict) -> dict:
     if "url" in software_data_dict and software_data_dict["url"]:
         original_url = software_data_dict["url"]
         software_data_dict["url"] = str(software_data_dict["url"])
-        logger.info(f"URL del software procesada: {original_url} -> {software_data_dict['url']}")
+        logger.info("URL del software procesada: %s -> %s", original_url, software_data_dict['url'])
     return software_data_dict
 
 
 def _prepare_software_data_for_update(software_data: SoftwareCreateRequest) -> dict:
     software_data_dict = software_data.dict()
-    logger.info(f"Datos del software convertidos a dict: {software_data_dict}")
+    logger.info("Datos del software convertidos a dict: %s", software_data_dict)
     
     software_data_dict = _process_software_url(software_data_dict)
     
     software_data_dict.pop("roles_required", None)
-    logger.info(f"Datos del software después de remover roles: {software_data_dict}")
+    logger.info("Datos del software después de remover roles: %s", software_data_dict)
     
     return software_data_dict
 
@@ -45,32 +45,32 @@ def _assign_single_role_to_software(db: Session, software_id: str, role_id: str,
     try:
         rol = _validate_role_exists(db, role_id)
         assign_role_to_software_use_case(db, software_id, rol.id)
-        logger.info(f"Rol '{rol.label}' asignado exitosamente al software '{software_name}' ({current_count}/{total_count})")
+        logger.info("Rol '%s' asignado exitosamente al software '%s' (%s/%s)", rol.label, software_name, current_count, total_count)
         return rol
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error al asignar rol {role_id} al software {software_id}: {str(e)}")
+        logger.error("Error al asignar rol %s al software %s: %s", role_id, software_id, e)
         raise HTTPException(status_code=500, detail=f"Error al asignar rol {role_id}")
 
 
 def _remove_single_role_from_software(db: Session, software_id: str, role_id: str, current_count: int, total_count: int):
     try:
-        logger.info(f"Eliminando rol {role_id} del software {software_id}")
+        logger.info("Eliminando rol %s del software %s", role_id, software_id)
         remove_role_from_software_use_case(db, software_id, role_id)
-        logger.info(f"Rol {role_id} eliminado exitosamente ({current_count}/{total_count})")
+        logger.info("Rol %s eliminado exitosamente (%s/%s)", role_id, current_count, total_count)
     except Exception as e:
-        logger.error(f"Error al eliminar rol {role_id} del software {software_id}: {str(e)}")
+        logger.error("Error al eliminar rol %s del software %s: %s", role_id, software_id, e)
         raise HTTPException(status_code=500, detail=f"Error al eliminar rol {role_id}")
 
 
 def _assign_roles_to_software(db: Session, software_id: str, software_name: str, roles_required: List[str]) -> List:
     roles = []
     roles_assigned_count = 0
-    logger.info(f"Iniciando asignación de {len(roles_required)} roles al software")
+    logger.info("Iniciando asignación de %s roles al software", len(roles_required))
     
     for index, role_id in enumerate(roles_required, 1):
-        logger.info(f"Procesando rol {index}/{len(roles_required)} - ID: {role_id}")
+        logger.info("Procesando rol %s/%s - ID: %s", index, len(roles_required), role_id)
         
         rol = _assign_single_role_to_software(
             db, software_id, role_id, software_name, 
@@ -79,7 +79,7 @@ def _assign_roles_to_software(db: Session, software_id: str, software_name: str,
         roles_assigned_count += 1
         roles.append(rol)
     
-    logger.info(f"Asignación completada - {roles_assigned_count} roles asignados al software '{software_name}'")
+    logger.info("Asignación completada - %s roles asignados al software '%s'", roles_assigned_count, software_name)
     return roles
 
 
@@ -87,22 +87,22 @@ def _update_software_roles(db: Session, software_id: str, current_roles: Set[str
     roles_to_add = new_roles_required - current_roles
     roles_to_remove = current_roles - new_roles_required
     
-    logger.info(f"Análisis de roles - A agregar: {len(roles_to_add)}, A eliminar: {len(roles_to_remove)}")
-    logger.info(f"Roles a agregar: {roles_to_add}")
-    logger.info(f"Roles a eliminar: {roles_to_remove}")
+    logger.info("Análisis de roles - A agregar: %s, A eliminar: %s", len(roles_to_add), len(roles_to_remove))
+    logger.info("Roles a agregar: %s", roles_to_add)
+    logger.info("Roles a eliminar: %s", roles_to_remove)
     
     roles_removed_count = 0
     if roles_to_remove:
-        logger.info(f"Iniciando eliminación de {len(roles_to_remove)} roles obsoletos")
+        logger.info("Iniciando eliminación de %s roles obsoletos", len(roles_to_remove))
         for index, role_id in enumerate(roles_to_remove, 1):
             _remove_single_role_from_software(db, software_id, role_id, index, len(roles_to_remove))
             roles_removed_count += 1
     
     roles_added_count = 0
     if roles_to_add:
-        logger.info(f"Iniciando asignación de {len(roles_to_add)} nuevos roles")
+        logger.info("Iniciando asignación de %s nuevos roles", len(roles_to_add))
         for index, role_id in enumerate(roles_to_add, 1):
-            logger.info(f"Procesando nuevo rol - ID: {role_id}")
+            logger.info("Procesando nuevo rol - ID: %s", role_id)
             _assign_single_role_to_software(
                 db, software_id, role_id, "software", 
                 index, len(roles_to_add)
@@ -113,27 +113,27 @@ def _update_software_roles(db: Session, software_id: str, current_roles: Set[str
 
 
 def _log_operation_summary(operation: str, software_name: str, software_id: str, **kwargs):
-    logger.info(f"{operation} completada exitosamente:")
-    logger.info(f"  - Software: {software_name} (ID: {software_id})")
+    logger.info("%s completada exitosamente:", operation)
+    logger.info("  - Software: %s (ID: %s)", software_name, software_id)
     
     for key, value in kwargs.items():
-        logger.info(f"  - {key}: {value}")
+        logger.info("  - %s: %s", key, value)
 
 
 def _get_current_software_roles(current_software) -> Set[str]:
     current_roles = set()
     if hasattr(current_software, 'roles') and current_software.roles:
         current_roles = {role.id for role in current_software.roles}
-        logger.info(f"Roles actuales del software ({len(current_roles)}): {current_roles}")
+        logger.info("Roles actuales del software (%s): %s", len(current_roles), current_roles)
     else:
         logger.info("El software no tiene roles asignados actualmente")
     return current_roles
 
 
 def create_software_service(db: Session, software_data: SoftwareCreateRequest):
-    logger.debug(f"Entrando a create_software_service con datos: {software_data.dict()}")
-    logger.info(f"Iniciando el proceso de creación de software - Nombre: {getattr(software_data, 'name', 'N/A')}")
-    logger.debug(f"Datos de entrada del software: {software_data}")
+    logger.debug("Entrando a create_software_service con datos: %s", lazy(software_data.dict))
+    logger.info("Iniciando el proceso de creación de software - Nombre: %s", getattr(software_data, 'name', 'N/A'))
+    logger.debug("Datos de entrada del software: %s", software_data)
      
     try:
         roles_required = software_data.roles_required
@@ -141,14 +141,14 @@ def create_software_service(db: Session, software_data: SoftwareCreateRequest):
             logger.warning("No se proporcionaron roles requeridos para el software")
             raise HTTPException(status_code=400, detail="Debe proporcionar al menos un rol requerido")
 
-        logger.debug(f"Validación de roles requeridos ({len(roles_required)}): {roles_required}")
+        logger.debug("Validación de roles requeridos (%s): %s", len(roles_required), roles_required)
          
         logger.debug("Preparando datos para actualización")
         software_data_dict = _prepare_software_data_for_update(software_data)
         
         logger.debug("Preparando creación en base de datos")
         new_software = SoftwareCreate(**software_data_dict)   
-        logger.debug(f"Objeto SoftwareCreate preparado: {new_software}")
+        logger.debug("Objeto SoftwareCreate preparado: %s", new_software)
         
         logger.debug("Llamando a create_software_use_case")
         software_created = create_software_use_case(db, new_software)
@@ -156,12 +156,12 @@ def create_software_service(db: Session, software_data: SoftwareCreateRequest):
             logger.error("Fallo en la creación del software - Resultado nulo")
             raise HTTPException(status_code=500, detail="Error interno al crear el software")
         
-        logger.info(f"Software creado - ID: {software_created.id}, Nombre: {software_created.name}")
+        logger.info("Software creado - ID: %s, Nombre: %s", software_created.id, software_created.name)
         
-        logger.debug(f"Asignando roles al software ID: {software_created.id}")
+        logger.debug("Asignando roles al software ID: %s", software_created.id)
         roles = _assign_roles_to_software(db, software_created.id, software_created.name, roles_required)
         
-        software_created.roles = roles
+        software_created = get_software_by_id_use_case(db, software_created.id)
         _log_operation_summary(
             "Creación de software", 
             software_created.name, 
@@ -174,29 +174,29 @@ def create_software_service(db: Session, software_data: SoftwareCreateRequest):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error inesperado durante la creación del software: {str(e)}")
+        logger.error("Error inesperado durante la creación del software: %s", e)
         logger.exception("Detalles completos del error:")
         raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
 
 
 def update_software_service(db: Session, software_id: str, software_data: SoftwareCreateRequest):
-    logger.debug(f"Entrando a update_software_service con ID={software_id}, datos: {software_data.dict()}")
-    logger.info(f"Iniciando actualización de software - ID: {software_id}, Nombre: {getattr(software_data, 'name', 'N/A')}")
-    logger.debug(f"Datos de entrada para actualización: {software_data}")
+    logger.debug("Entrando a update_software_service con ID=%s, datos: %s", software_id, lazy(software_data.dict))
+    logger.info("Iniciando actualización de software - ID: %s, Nombre: %s", software_id, getattr(software_data, 'name', 'N/A'))
+    logger.debug("Datos de entrada para actualización: %s", software_data)
     
     try:
-        logger.info(f"Obteniendo software actual con ID: {software_id}")
+        logger.info("Obteniendo software actual con ID: %s", software_id)
         current_software = get_software_by_id_use_case(db, software_id)
         if not current_software:
-            logger.error(f"Software con ID {software_id} no encontrado")
+            logger.error("Software con ID %s no encontrado", software_id)
             raise HTTPException(status_code=404, detail=f"Software con ID {software_id} no encontrado")
         
-        logger.debug(f"Software encontrado - ID: {software_id}, Nombre: {current_software.name}")
+        logger.debug("Software encontrado - ID: %s, Nombre: %s", software_id, current_software.name)
         
         current_roles = _get_current_software_roles(current_software)
         
         new_roles_required = set(software_data.roles_required) if software_data.roles_required else set()
-        logger.debug(f"Nuevos roles requeridos ({len(new_roles_required)}): {new_roles_required}")
+        logger.debug("Nuevos roles requeridos (%s): %s", len(new_roles_required), new_roles_required)
         
         software_data_dict = _prepare_software_data_for_update(software_data)
         
@@ -207,7 +207,7 @@ def update_software_service(db: Session, software_id: str, software_data: Softwa
             logger.error("Fallo en la actualización del software - Resultado nulo")
             raise HTTPException(status_code=500, detail="Error interno al actualizar el software")
         
-        logger.info(f"Software básico actualizado - ID: {software_id}")
+        logger.info("Software básico actualizado - ID: %s", software_id)
         
         roles_removed_count, roles_added_count = _update_software_roles(
             db, software_id, current_roles, new_roles_required
@@ -229,14 +229,14 @@ def update_software_service(db: Session, software_id: str, software_data: Softwa
         
         if hasattr(final_software, 'roles') and final_software.roles:
             final_role_labels = [r.label for r in final_software.roles]
-            logger.debug(f"Roles finales: {final_role_labels}")
+            logger.debug("Roles finales: %s", final_role_labels)
         
         return final_software
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error inesperado durante la actualización del software {software_id}: {str(e)}")
+        logger.error("Error inesperado durante la actualización del software %s: %s", software_id, e)
         logger.exception("Detalles completos del error:")
         raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
 
@@ -0,0 +1,133 @@
+import codecs
+import csv
+import json
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+from app.application.use_cases.user_use_case import bulk_create_users_use_case
+from app.application.use_cases.role_use_case import get_all_roles_use_case
+from app.domain.schemas.user import UserCreate
+from app.config.logger import get_logger
+
+logger = get_logger("services.user_import")
+
+IMPORT_BATCH_SIZE = 500
+IMPORT_FORMATS = ("csv", "json", "ndjson")
+
+
+def detect_import_format(filename: Optional[str], content_type: Optional[str] = None) -> str:
+    name = (filename or "").lower()
+    if name.endswith((".ndjson", ".jsonl")) or content_type == "application/x-ndjson":
+        return "ndjson"
+    if name.endswith(".json") or content_type == "application/json":
+        return "json"
+    return "csv"
+
+
+def iter_user_rows(stream: BinaryIO, file_format: str) -> Iterator[Any]:
+    """Yield raw rows from an uploaded file; CSV and NDJSON are read line by line, JSON expects an array."""
+    if file_format not in IMPORT_FORMATS:
+        raise ValueError(f"Formato de importación no soportado: {file_format}")
+    reader = codecs.getreader("utf-8-sig")(stream)
+    if file_format == "csv":
+        for row in csv.DictReader(reader):
+            yield {key.strip(): value.strip() for key, value in row.items() if key and isinstance(value, str)}
+    elif file_format == "ndjson":
+        for line in reader:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                yield line
+    else:
+        data = json.load(reader)
+        if not isinstance(data, list):
+            raise ValueError("El archivo JSON debe contener una lista de usuarios")
+        yield from data
+
+
+def _validation_detail(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc']) or 'fila'}: {item['msg']}" for item in error.errors()
+    )
+
+
+def _validate_row(raw: Any, roles_by_label: Dict[str, Any], role_ids: set) -> UserCreate:
+    if not isinstance(raw, dict):
+        raise ValueError("La fila no es un objeto JSON válido")
+    data = {key: value for key, value in raw.items() if value not in ("", None)}
+    role_label = data.pop("role", None)
+    if "role_id" not in data and role_label is not None:
+        role_id = roles_by_label.get(str(role_label).strip().lower())
+        if role_id is None:
+            raise ValueError(f"Rol '{role_label}' no existe")
+        data["role_id"] = role_id
+    user = UserCreate.model_validate(data)
+    if user.role_id not in role_ids:
+        raise ValueError(f"Rol con ID {user.role_id} no existe")
+    return user
+
+
+def _add_error(report: Dict[str, Any], row: int, email: Optional[str], status: str, detail: str):
+    report["skipped" if status == "skipped" else "failed"] += 1
+    report["errors"].append({"row": row, "email": email, "status": status, "detail": detail})
+
+
+def _flush_batch(db: Session, batch: List[Tuple[int, UserCreate]], report: Dict[str, Any]):
+    try:
+        inserted = bulk_create_users_use_case(db, [user for _, user in batch])
+    except Exception as e:
+        db.rollback()
+        logger.error("Error insertando lote de %s usuarios: %s", len(batch), e)
+        for row, user in batch:
+            _add_error(report, row, user.email, "error", f"Error de base de datos: {e}")
+        return
+    for row, user in batch:
+        if user.email in inserted:
+            report["created"] += 1
+        else:
+            _add_error(report, row, user.email, "skipped", "Email ya registrado")
+
+
+def import_users_service(db: Session, rows: Iterable[Any], batch_size: int = IMPORT_BATCH_SIZE) -> Dict[str, Any]:
+    """Validate and insert users in batches, one transaction per batch, reporting problems row by row."""
+    logger.info("Iniciando importación de usuarios en lotes de %s", batch_size)
+    roles = get_all_roles_use_case(db)
+    roles_by_label = {role.label.strip().lower(): role.id for role in roles}
+    role_ids = {role.id for role in roles}
+
+    report = {"total": 0, "created": 0, "skipped": 0, "failed": 0, "errors": []}
+    batch: List[Tuple[int, UserCreate]] = []
+    seen_emails = set()
+
+    for row, raw in enumerate(rows, start=1):
+        report["total"] += 1
+        email = raw.get("email") if isinstance(raw, dict) else None
+        try:
+            user = _validate_row(raw, roles_by_label, role_ids)
+        except ValidationError as e:
+            _add_error(report, row, email, "error", _validation_detail(e))
+            continue
+        except ValueError as e:
+            _add_error(report, row, email, "error", str(e))
+            continue
+
+        if user.email in seen_emails:
+            _add_error(report, row, user.email, "error", "Email duplicado en el archivo")
+            continue
+        seen_emails.add(user.email)
+
+        batch.append((row, user))
+        if len(batch) >= batch_size:
+            _flush_batch(db, batch, report)
+            batch = []
+
+    if batch:
+        _flush_batch(db, batch, report)
+
+    logger.info(
+        "Importación completada - total: %s, creados: %s, "
+        "omitidos: %s, fallidos: %s", report['total'], report['created'], report['skipped'], report['failed']
+    )
+    return report
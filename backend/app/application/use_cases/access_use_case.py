@@ -1,22 +1,62 @@
+from datetime import datetime
+from typing import List, Optional, Sequence
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.infrastructure.database.repositories.access_repository import (
-    create_access, update_access, get_all_accesses, get_access_by_id, delete_access
+    create_access, create_accesses, get_software_ids_with_access, update_access, get_all_accesses, get_accesses_page, iter_all_accesses, get_accesses_changed_since, get_accesses_rows, get_accesses_by_ids, get_access_by_id, delete_access,
+    get_all_accesses_async, get_accesses_page_async, get_access_by_id_async
 )
 from app.domain.models.access import Access
 from app.domain.schemas.access import AccessCreate, AccessUpdate
 
-def create_access_use_case(db: Session, access_data: AccessCreate):
+def create_access_use_case(db: Session, access_data: AccessCreate, access_id: Optional[UUID] = None):
     access = Access(**access_data.dict())
+    if access_id is not None:
+        access.id = access_id
     return create_access(db, access)
 
+def create_accesses_use_case(db: Session, accesses_data: List[AccessCreate], access_ids: Optional[Sequence[UUID]] = None):
+    rows = [access_data.dict() for access_data in accesses_data]
+    if access_ids is not None:
+        rows = [{**row, "id": access_id} for row, access_id in zip(rows, access_ids)]
+    return create_accesses(db, rows)
+
+def get_software_ids_with_access_use_case(db: Session, user_id: UUID, software_ids: Sequence[UUID]):
+    return get_software_ids_with_access(db, user_id, software_ids)
+
 def update_access_use_case(db: Session, access_id: str, access_data: AccessUpdate):
     return update_access(db, access_id, access_data)
 
 def get_all_accesses_use_case(db: Session):
     return get_all_accesses(db)
 
+def get_accesses_page_use_case(db: Session, limit: int, cursor: Optional[str] = None):
+    return get_accesses_page(db, limit, cursor)
+
+def iter_all_accesses_use_case(db: Session, batch_size: int):
+    return iter_all_accesses(db, batch_size)
+
+def get_accesses_rows_use_case(db: Session, since: Optional[datetime] = None):
+    return get_accesses_rows(db, since)
+
+def get_accesses_changed_since_use_case(db: Session, since: datetime):
+    return get_accesses_changed_since(db, since)
+
+def get_accesses_by_ids_use_case(db: Session, access_ids: Sequence[str]):
+    return get_accesses_by_ids(db, access_ids)
+
 def get_access_by_id_use_case(db: Session, access_id: str):
     return get_access_by_id(db, access_id)
 
 def delete_access_use_case(db: Session, access_id: str):
-    return delete_access(db, access_id)
\ No newline at end of file
+    return delete_access(db, access_id)
+
+async def get_all_accesses_async_use_case(db: AsyncSession):
+    return await get_all_accesses_async(db)
+
+async def get_accesses_page_async_use_case(db: AsyncSession, limit: int, cursor: Optional[str] = None):
+    return await get_accesses_page_async(db, limit, cursor)
+
+async def get_access_by_id_async_use_case(db: AsyncSession, access_id: str):
+    return await get_access_by_id_async(db, access_id)
\ No newline at end of file
@@ -0,0 +1,67 @@
+from datetime import datetime
+from typing import Any
+from sqlalchemy.orm import Session
+from app.infrastructure.database.collection_version import get_table_versions, get_database_now, any_updated_since
+from app.infrastructure.cache.reference_cache import role_cache, state_request_cache, software_cache
+from app.domain.models.user import User
+from app.domain.models.device import Device
+from app.domain.models.access import Access
+from app.domain.models.role import Role
+from app.domain.models.state_request import StateRequest
+from app.domain.models.software import Software
+from app.config.logger import get_logger
+
+logger = get_logger("use_cases.collection_version")
+
+# Reference caches and the tables each one is built from. They are checked against the database on every
+# validation, so a write made by another worker or replica drops this process's copy before it is served.
+_REFERENCE_CACHES = (
+    (role_cache, (Role,)),
+    (state_request_cache, (StateRequest,)),
+    (software_cache, (Software, Role)),
+)
+
+def _collection_version(db: Session, *models: Any) -> str:
+    versions = get_table_versions(db, models)
+    for cache, tables in _REFERENCE_CACHES:
+        if all(table.__tablename__ in versions for table in tables):
+            cache.sync(";".join(versions[table.__tablename__] for table in tables))
+    return ";".join(f"{table}:{version}" for table, version in versions.items())
+
+# Each version covers every table its response schema embeds.
+def get_users_version_use_case(db: Session) -> str:
+    logger.debug("get_users_version_use_case called")
+    return _collection_version(db, User, Role)
+
+def get_devices_version_use_case(db: Session) -> str:
+    logger.debug("get_devices_version_use_case called")
+    return _collection_version(db, Device, StateRequest)
+
+def get_accesses_version_use_case(db: Session) -> str:
+    logger.debug("get_accesses_version_use_case called")
+    return _collection_version(db, Access, Software, Role, StateRequest)
+
+def get_software_version_use_case(db: Session) -> str:
+    logger.debug("get_software_version_use_case called")
+    return _collection_version(db, Software, Role)
+
+def get_roles_version_use_case(db: Session) -> str:
+    logger.debug("get_roles_version_use_case called")
+    return _collection_version(db, Role)
+
+def get_state_requests_version_use_case(db: Session) -> str:
+    logger.debug("get_state_requests_version_use_case called")
+    return _collection_version(db, StateRequest)
+
+def get_all_data_version_use_case(db: Session) -> str:
+    logger.debug("get_all_data_version_use_case called")
+    return _collection_version(db, User, Device, Access, Role, StateRequest, Software)
+
+def get_sync_watermark_use_case(db: Session) -> datetime:
+    logger.debug("get_sync_watermark_use_case called")
+    return get_database_now(db)
+
+def reference_data_changed_since_use_case(db: Session, since: datetime) -> bool:
+    """Roles, states and software are embedded in the rows a delta returns; a change to one leaves those rows untouched."""
+    logger.debug(f"reference_data_changed_since_use_case called with since: {since}")
+    return any_updated_since(db, [Role, StateRequest, Software], since)
@@ -1,6 +1,11 @@
+from datetime import datetime
+from typing import Optional, Sequence
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.infrastructure.database.repositories.device_repository import (
-    create_device, update_device, get_all_devices, get_device_by_id, delete_device
+    create_device, update_device, get_all_devices, get_devices_page, iter_all_devices, get_devices_changed_since, get_devices_rows, get_devices_by_ids, get_device_by_id, delete_device,
+    get_all_devices_async, get_devices_page_async, get_device_by_id_async
 )
 from app.domain.models.device import Device
 from app.domain.schemas.device import DeviceCreate, DeviceUpdate
@@ -8,9 +13,11 @@ from app.config.logger import get_logger
 
 logger = get_logger("use_cases.device")
 
-def create_device_use_case(db: Session, device_data: DeviceCreate):
+def create_device_use_case(db: Session, device_data: DeviceCreate, device_id: Optional[UUID] = None):
     logger.debug(f"create_device_use_case called with data: {device_data.dict()}")
     device = Device(**device_data.dict())
+    if device_id is not None:
+        device.id = device_id
     created = create_device(db, device)
     logger.info(f"Device created successfully - ID: {created.id}")
     return created
@@ -30,6 +37,34 @@ def get_all_devices_use_case(db: Session):
     logger.info(f"Retrieved {len(devices)} devices")
     return devices
 
+def get_devices_page_use_case(db: Session, limit: int, cursor: Optional[str] = None):
+    logger.debug(f"get_devices_page_use_case called with limit: {limit}, cursor: {cursor}")
+    items, next_cursor = get_devices_page(db, limit, cursor)
+    logger.info(f"Retrieved page of {len(items)} devices")
+    return items, next_cursor
+
+def iter_all_devices_use_case(db: Session, batch_size: int):
+    logger.debug(f"iter_all_devices_use_case called with batch_size: {batch_size}")
+    return iter_all_devices(db, batch_size)
+
+def get_devices_rows_use_case(db: Session, since: Optional[datetime] = None):
+    logger.debug(f"get_devices_rows_use_case called with since: {since}")
+    rows = get_devices_rows(db, since)
+    logger.info(f"Retrieved {len(rows)} devices rows")
+    return rows
+
+def get_devices_changed_since_use_case(db: Session, since: datetime):
+    logger.debug(f"get_devices_changed_since_use_case called with since: {since}")
+    changed = get_devices_changed_since(db, since)
+    logger.info(f"Retrieved {len(changed)} devices changed since {since}")
+    return changed
+
+def get_devices_by_ids_use_case(db: Session, device_ids: Sequence[str]):
+    logger.debug(f"get_devices_by_ids_use_case called with {len(device_ids)} ids")
+    devices = get_devices_by_ids(db, device_ids)
+    logger.info(f"Retrieved {len(devices)} of {len(device_ids)} devices by id")
+    return devices
+
 def get_device_by_id_use_case(db: Session, device_id: str):
     logger.debug(f"get_device_by_id_use_case called with id: {device_id}")
     device = get_device_by_id(db, device_id)
@@ -46,4 +81,25 @@ def delete_device_use_case(db: Session, device_id: str):
         logger.info(f"Device deleted successfully - ID: {device_id}")
     else:
         logger.warning(f"Device not found for deletion - ID: {device_id}")
-    return result
\ No newline at end of file
+    return result
+
+async def get_all_devices_async_use_case(db: AsyncSession):
+    logger.debug("get_all_devices_async_use_case called")
+    items = await get_all_devices_async(db)
+    logger.info(f"Retrieved {len(items)} devices")
+    return items
+
+async def get_devices_page_async_use_case(db: AsyncSession, limit: int, cursor: Optional[str] = None):
+    logger.debug(f"get_devices_page_async_use_case called with limit: {limit}, cursor: {cursor}")
+    items, next_cursor = await get_devices_page_async(db, limit, cursor)
+    logger.info(f"Retrieved page of {len(items)} devices")
+    return items, next_cursor
+
+async def get_device_by_id_async_use_case(db: AsyncSession, device_id: str):
+    logger.debug(f"get_device_by_id_async_use_case called with id: {device_id}")
+    item = await get_device_by_id_async(db, device_id)
+    if item:
+        logger.info(f"Device found - ID: {device_id}")
+    else:
+        logger.warning(f"Device not found - ID: {device_id}")
+    return item
\ No newline at end of file
@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy.orm import Session
+from app.infrastructure.database.collection_version import get_database_now
+from app.infrastructure.database.repositories.notification_outbox_repository import (
+    add_outbox_event, claim_pending_events, claim_ready_digest_events, mark_event_sent, mark_event_retry, commit_outbox_batch, count_events_by_status,
+    get_events_by_ids, lease_events
+)
+from app.domain.models.notification_outbox import NotificationOutbox
+from app.config.logger import get_logger
+
+logger = get_logger("use_cases.notification_outbox")
+
+def enqueue_notification_use_case(db: Session, event_type: str, payload: Dict[str, Any], digest_key: Optional[str] = None,
+                                  request_count: int = 1):
+    logger.debug(f"enqueue_notification_use_case called with event_type: {event_type}, payload: {payload}")
+    add_outbox_event(db, event_type, payload, digest_key, request_count)
+
+def claim_notification_batch_use_case(db: Session, limit: int, lease_seconds: int,
+                                      digest: Optional[Dict[str, Any]] = None) -> Tuple[datetime, List[NotificationOutbox]]:
+    """Claim due events and lease them for ``lease_seconds``; commit right after to release the row locks.
+
+    With ``digest`` enabled, events with a digest key wait until their group is ready. Events of a dispatcher
+    that dies before recording the outcome stay pending, and are claimed again once the lease expires.
+    """
+    now = get_database_now(db)
+    if not digest or not digest.get("enabled"):
+        events = claim_pending_events(db, now, limit)
+    else:
+        events = claim_pending_events(db, now, limit, exclude_digest=True)
+        if len(events) < limit:
+            window_start = now - timedelta(seconds=digest["window_seconds"])
+            events += claim_ready_digest_events(db, now, window_start, digest["max_batch_size"], limit - len(events))
+    if events:
+        lease_events(events, now + timedelta(seconds=lease_seconds))
+        logger.debug(f"Claimed {len(events)} outbox events")
+    return now, events
+
+def get_notification_events_use_case(db: Session, event_ids: List[UUID]) -> List[NotificationOutbox]:
+    return get_events_by_ids(db, event_ids)
+
+def mark_notification_sent_use_case(event: NotificationOutbox, now: datetime):
+    mark_event_sent(event, now)
+
+def mark_notification_failed_use_case(event: NotificationOutbox, now: datetime, error: str, max_attempts: int, retry_backoff_seconds: int):
+    if event.attempts + 1 >= max_attempts:
+        logger.error(f"Outbox event {event.id} ({event.event_type}) failed after {event.attempts + 1} attempts: {error}")
+        mark_event_retry(event, error, None)
+        return
+    delay = retry_backoff_seconds * 2 ** event.attempts
+    logger.warning(f"Outbox event {event.id} ({event.event_type}) failed, retrying in {delay}s: {error}")
+    mark_event_retry(event, error, now + timedelta(seconds=delay))
+
+def complete_notification_batch_use_case(db: Session):
+    commit_outbox_batch(db)
+
+def get_outbox_status_use_case(db: Session) -> Dict[str, int]:
+    logger.debug("get_outbox_status_use_case called")
+    return count_events_by_status(db)
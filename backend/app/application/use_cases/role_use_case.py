@@ -1,17 +1,23 @@
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.infrastructure.database.repositories.role_repository import (
-    create_role, update_role, get_all_roles, get_role_by_id, delete_role
-)
+from app.infrastructure.database.repositories.role_repository import create_role, update_role, delete_role
+from app.infrastructure.cache.reference_cache import role_cache, software_cache
 from app.domain.models.role import Role
 from app.domain.schemas.role import RoleCreate, RoleUpdate
 from app.config.logger import get_logger
 
 logger = get_logger("use_cases.role")
 
+def _invalidate_role_caches():
+    role_cache.invalidate()
+    software_cache.invalidate()
+
 def create_role_use_case(db: Session, role_data: RoleCreate):
     logger.debug(f"create_role_use_case called with data: {role_data.dict()}")
     role = Role(**role_data.dict())
     created = create_role(db, role)
+    _invalidate_role_caches()
     logger.info(f"Role created - ID: {created.id}")
     return created
 
@@ -19,6 +25,7 @@ def update_role_use_case(db: Session, role_id: str, role_data: RoleUpdate):
     logger.debug(f"update_role_use_case called with id: {role_id}, data: {role_data.dict(exclude_unset=True)}")
     updated = update_role(db, role_id, role_data)
     if updated:
+        _invalidate_role_caches()
         logger.info(f"Role updated - ID: {role_id}")
     else:
         logger.warning(f"Role not found - ID: {role_id}")
@@ -26,13 +33,19 @@ def update_role_use_case(db: Session, role_id: str, role_data: RoleUpdate):
 
 def get_all_roles_use_case(db: Session):
     logger.debug("get_all_roles_use_case called")
-    roles = get_all_roles(db)
+    roles = role_cache.get_all(db)
     logger.info(f"Retrieved {len(roles)} roles")
     return roles
 
+def get_roles_page_use_case(db: Session, limit: int, cursor: Optional[str] = None):
+    logger.debug(f"get_roles_page_use_case called with limit: {limit}, cursor: {cursor}")
+    items, next_cursor = role_cache.get_page(db, limit, cursor)
+    logger.info(f"Retrieved page of {len(items)} roles")
+    return items, next_cursor
+
 def get_role_by_id_use_case(db: Session, role_id: str):
     logger.debug(f"get_role_by_id_use_case called with id: {role_id}")
-    role = get_role_by_id(db, role_id)
+    role = role_cache.get_by_id(db, role_id)
     if role:
         logger.info(f"Role found - ID: {role_id}")
     else:
@@ -43,7 +56,29 @@ def delete_role_use_case(db: Session, role_id: str):
     logger.debug(f"delete_role_use_case called with id: {role_id}")
     success = delete_role(db, role_id)
     if success:
+        _invalidate_role_caches()
         logger.info(f"Role deleted - ID: {role_id}")
     else:
         logger.warning(f"Role not found for deletion - ID: {role_id}")
-    return success
\ No newline at end of file
+    return success
+
+async def get_all_roles_async_use_case(db: AsyncSession):
+    logger.debug("get_all_roles_async_use_case called")
+    items = await role_cache.get_all_async(db)
+    logger.info(f"Retrieved {len(items)} roles")
+    return items
+
+async def get_roles_page_async_use_case(db: AsyncSession, limit: int, cursor: Optional[str] = None):
+    logger.debug(f"get_roles_page_async_use_case called with limit: {limit}, cursor: {cursor}")
+    items, next_cursor = await role_cache.get_page_async(db, limit, cursor)
+    logger.info(f"Retrieved page of {len(items)} roles")
+    return items, next_cursor
+
+async def get_role_by_id_async_use_case(db: AsyncSession, role_id: str):
+    logger.debug(f"get_role_by_id_async_use_case called with id: {role_id}")
+    item = await role_cache.get_by_id_async(db, role_id)
+    if item:
+        logger.info(f"Role found - ID: {role_id}")
+    else:
+        logger.warning(f"Role not found - ID: {role_id}")
+    return item
\ No newline at end of file
@@ -1,7 +1,8 @@
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.infrastructure.database.repositories.software_repository import (
-    create_software, update_software, get_all_software, get_software_by_id, delete_software
-)
+from app.infrastructure.database.repositories.software_repository import create_software, update_software, delete_software
+from app.infrastructure.cache.reference_cache import software_cache
 from app.domain.models.software import Software
 from app.domain.schemas.software import SoftwareCreate, SoftwareUpdate
 from app.config.logger import get_logger
@@ -12,6 +13,7 @@ def create_software_use_case(db: Session, software_data: SoftwareCreate):
     logger.debug(f"create_software_use_case called with data: {software_data.dict()}")
     software = Software(**software_data.dict())
     created = create_software(db, software)
+    software_cache.invalidate()
     logger.info(f"Software created - ID: {created.id}")
     return created
 
@@ -19,6 +21,7 @@ def update_software_use_case(db: Session, software_id: str, software_data: Softw
     logger.debug(f"update_software_use_case called with id: {software_id}, data: {software_data.dict(exclude_unset=True)}")
     updated = update_software(db, software_id, software_data)
     if updated:
+        software_cache.invalidate()
         logger.info(f"Software updated - ID: {software_id}")
     else:
         logger.warning(f"Software not found - ID: {software_id}")
@@ -26,13 +29,19 @@ def update_software_use_case(db: Session, software_id: str, software_data: Softw
 
 def get_all_software_use_case(db: Session):
     logger.debug("get_all_software_use_case called")
-    list_sw = get_all_software(db)
+    list_sw = software_cache.get_all(db)
     logger.info(f"Retrieved {len(list_sw)} software entries")
     return list_sw
 
+def get_software_page_use_case(db: Session, limit: int, cursor: Optional[str] = None):
+    logger.debug(f"get_software_page_use_case called with limit: {limit}, cursor: {cursor}")
+    items, next_cursor = software_cache.get_page(db, limit, cursor)
+    logger.info(f"Retrieved page of {len(items)} software entries")
+    return items, next_cursor
+
 def get_software_by_id_use_case(db: Session, software_id: str):
     logger.debug(f"get_software_by_id_use_case called with id: {software_id}")
-    sw = get_software_by_id(db, software_id)
+    sw = software_cache.get_by_id(db, software_id)
     if sw:
         logger.info(f"Software found - ID: {software_id}")
     else:
@@ -43,7 +52,29 @@ def delete_software_use_case(db: Session, software_id: str):
     logger.debug(f"delete_software_use_case called with id: {software_id}")
     success = delete_software(db, software_id)
     if success:
+        software_cache.invalidate()
         logger.info(f"Software deleted - ID: {software_id}")
     else:
         logger.warning(f"Software not found for deletion - ID: {software_id}")
-    return success
\ No newline at end of file
+    return success
+
+async def get_all_software_async_use_case(db: AsyncSession):
+    logger.debug("get_all_software_async_use_case called")
+    items = await software_cache.get_all_async(db)
+    logger.info(f"Retrieved {len(items)} software entries")
+    return items
+
+async def get_software_page_async_use_case(db: AsyncSession, limit: int, cursor: Optional[str] = None):
+    logger.debug(f"get_software_page_async_use_case called with limit: {limit}, cursor: {cursor}")
+    items, next_cursor = await software_cache.get_page_async(db, limit, cursor)
+    logger.info(f"Retrieved page of {len(items)} software entries")
+    return items, next_cursor
+
+async def get_software_by_id_async_use_case(db: AsyncSession, software_id: str):
+    logger.debug(f"get_software_by_id_async_use_case called with id: {software_id}")
+    item = await software_cache.get_by_id_async(db, software_id)
+    if item:
+        logger.info(f"Software found - ID: {software_id}")
+    else:
+        logger.warning(f"Software not found - ID: {software_id}")
+    return item
\ No newline at end of file
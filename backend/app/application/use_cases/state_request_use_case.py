@@ -1,8 +1,10 @@
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.infrastructure.database.repositories.state_request_repository import (
-    create_state_request, update_state_request, get_all_state_requests,
-    get_state_request_by_id, delete_state_request
+    create_state_request, update_state_request, delete_state_request
 )
+from app.infrastructure.cache.reference_cache import state_request_cache
 from app.domain.models.state_request import StateRequest
 from app.domain.schemas.state_request import StateRequestCreate, StateRequestUpdate
 from app.config.logger import get_logger
@@ -13,6 +15,7 @@ def create_state_request_use_case(db: Session, state_request_data: StateRequestC
     logger.debug(f"create_state_request_use_case called with data: {state_request_data.dict()}")
     state_request = StateRequest(**state_request_data.dict())
     created = create_state_request(db, state_request)
+    state_request_cache.invalidate()
     logger.info(f"StateRequest created - ID: {created.id}")
     return created
 
@@ -20,6 +23,7 @@ def update_state_request_use_case(db: Session, state_request_id: str, state_requ
     logger.debug(f"update_state_request_use_case called with id: {state_request_id}, data: {state_request_data.dict(exclude_unset=True)}")
     updated = update_state_request(db, state_request_id, state_request_data)
     if updated:
+        state_request_cache.invalidate()
         logger.info(f"StateRequest updated - ID: {state_request_id}")
     else:
         logger.warning(f"StateRequest not found - ID: {state_request_id}")
@@ -27,13 +31,19 @@ def update_state_request_use_case(db: Session, state_request_id: str, state_requ
 
 def get_all_state_requests_use_case(db: Session):
     logger.debug("get_all_state_requests_use_case called")
-    states = get_all_state_requests(db)
+    states = state_request_cache.get_all(db)
     logger.info(f"Retrieved {len(states)} state requests")
     return states
 
+def get_state_requests_page_use_case(db: Session, limit: int, cursor: Optional[str] = None):
+    logger.debug(f"get_state_requests_page_use_case called with limit: {limit}, cursor: {cursor}")
+    items, next_cursor = state_request_cache.get_page(db, limit, cursor)
+    logger.info(f"Retrieved page of {len(items)} state requests")
+    return items, next_cursor
+
 def get_state_request_by_id_use_case(db: Session, state_request_id: str):
     logger.debug(f"get_state_request_by_id_use_case called with id: {state_request_id}")
-    state = get_state_request_by_id(db, state_request_id)
+    state = state_request_cache.get_by_id(db, state_request_id)
     if state:
         logger.info(f"StateRequest found - ID: {state_request_id}")
     else:
@@ -44,7 +54,29 @@ def delete_state_request_use_case(db: Session, state_request_id: str):
     logger.debug(f"delete_state_request_use_case called with id: {state_request_id}")
     success = delete_state_request(db, state_request_id)
     if success:
+        state_request_cache.invalidate()
         logger.info(f"StateRequest deleted - ID: {state_request_id}")
     else:
         logger.warning(f"StateRequest not found for deletion - ID: {state_request_id}")
-    return success
\ No newline at end of file
+    return success
+
+async def get_all_state_requests_async_use_case(db: AsyncSession):
+    logger.debug("get_all_state_requests_async_use_case called")
+    items = await state_request_cache.get_all_async(db)
+    logger.info(f"Retrieved {len(items)} state requests")
+    return items
+
+async def get_state_requests_page_async_use_case(db: AsyncSession, limit: int, cursor: Optional[str] = None):
+    logger.debug(f"get_state_requests_page_async_use_case called with limit: {limit}, cursor: {cursor}")
+    items, next_cursor = await state_request_cache.get_page_async(db, limit, cursor)
+    logger.info(f"Retrieved page of {len(items)} state requests")
+    return items, next_cursor
+
+async def get_state_request_by_id_async_use_case(db: AsyncSession, state_request_id: str):
+    logger.debug(f"get_state_request_by_id_async_use_case called with id: {state_request_id}")
+    item = await state_request_cache.get_by_id_async(db, state_request_id)
+    if item:
+        logger.info(f"StateRequest found - ID: {state_request_id}")
+    else:
+        logger.warning(f"StateRequest not found - ID: {state_request_id}")
+    return item
\ No newline at end of file
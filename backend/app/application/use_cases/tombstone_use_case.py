@@ -0,0 +1,13 @@
+from datetime import datetime
+from typing import Sequence
+from sqlalchemy.orm import Session
+from app.infrastructure.database.repositories.tombstone_repository import get_deleted_ids_since
+from app.config.logger import get_logger
+
+logger = get_logger("use_cases.tombstone")
+
+def get_deleted_ids_since_use_case(db: Session, entities: Sequence[str], since: datetime):
+    logger.debug(f"get_deleted_ids_since_use_case called with entities: {list(entities)}, since: {since}")
+    deleted = get_deleted_ids_since(db, entities, since)
+    logger.info(f"Retrieved {sum(len(ids) for ids in deleted.values())} tombstones since {since}")
+    return deleted
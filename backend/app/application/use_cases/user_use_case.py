@@ -1,6 +1,10 @@
+from datetime import datetime
+from typing import List, Optional, Sequence
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.infrastructure.database.repositories.user_repository import (
-    create_user, update_user, get_all_users, get_user_by_id, delete_user
+    create_user, insert_users_skipping_existing, update_user, get_all_users, get_users_page, iter_all_users, get_users_changed_since, get_users_rows, get_users_by_ids, get_user_by_id, delete_user,
+    get_all_users_async, get_users_page_async, get_user_by_id_async
 )
 from app.domain.models.user import User
 from app.domain.schemas.user import UserCreate, UserUpdate
@@ -15,6 +19,12 @@ def create_user_use_case(db: Session, user_data: UserCreate):
     logger.info(f"User created successfully - ID: {created.id}")
     return created
 
+def bulk_create_users_use_case(db: Session, users_data: List[UserCreate]):
+    logger.debug(f"bulk_create_users_use_case called with {len(users_data)} users")
+    inserted = insert_users_skipping_existing(db, [user_data.dict() for user_data in users_data])
+    logger.info(f"Users created in bulk - {len(inserted)} of {len(users_data)}")
+    return inserted
+
 def update_user_use_case(db: Session, user_id: str, user_data: UserUpdate):
     logger.debug(f"update_user_use_case called with user_id: {user_id}, user_data: {user_data.dict(exclude_unset=True)}")
     updated = update_user(db, user_id, user_data)
@@ -30,6 +40,34 @@ def get_all_users_use_case(db: Session):
     logger.info(f"Retrieved {len(users)} users")
     return users
 
+def get_users_page_use_case(db: Session, limit: int, cursor: Optional[str] = None):
+    logger.debug(f"get_users_page_use_case called with limit: {limit}, cursor: {cursor}")
+    items, next_cursor = get_users_page(db, limit, cursor)
+    logger.info(f"Retrieved page of {len(items)} users")
+    return items, next_cursor
+
+def iter_all_users_use_case(db: Session, batch_size: int):
+    logger.debug(f"iter_all_users_use_case called with batch_size: {batch_size}")
+    return iter_all_users(db, batch_size)
+
+def get_users_rows_use_case(db: Session, since: Optional[datetime] = None):
+    logger.debug(f"get_users_rows_use_case called with since: {since}")
+    rows = get_users_rows(db, since)
+    logger.info(f"Retrieved {len(rows)} users rows")
+    return rows
+
+def get_users_changed_since_use_case(db: Session, since: datetime):
+    logger.debug(f"get_users_changed_since_use_case called with since: {since}")
+    changed = get_users_changed_since(db, since)
+    logger.info(f"Retrieved {len(changed)} users changed since {since}")
+    return changed
+
+def get_users_by_ids_use_case(db: Session, user_ids: Sequence[str]):
+    logger.debug(f"get_users_by_ids_use_case called with {len(user_ids)} ids")
+    users = get_users_by_ids(db, user_ids)
+    logger.info(f"Retrieved {len(users)} of {len(user_ids)} users by id")
+    return users
+
 def get_user_by_id_use_case(db: Session, user_id: str):
     logger.debug(f"get_user_by_id_use_case called with user_id: {user_id}")
     user = get_user_by_id(db, user_id)
@@ -46,4 +84,25 @@ def delete_user_use_case(db: Session, user_id: str):
         logger.info(f"User deleted successfully - ID: {user_id}")
     else:
         logger.warning(f"User not found for deletion - ID: {user_id}")
-    return success
\ No newline at end of file
+    return success
+
+async def get_all_users_async_use_case(db: AsyncSession):
+    logger.debug("get_all_users_async_use_case called")
+    items = await get_all_users_async(db)
+    logger.info(f"Retrieved {len(items)} users")
+    return items
+
+async def get_users_page_async_use_case(db: AsyncSession, limit: int, cursor: Optional[str] = None):
+    logger.debug(f"get_users_page_async_use_case called with limit: {limit}, cursor: {cursor}")
+    items, next_cursor = await get_users_page_async(db, limit, cursor)
+    logger.info(f"Retrieved page of {len(items)} users")
+    return items, next_cursor
+
+async def get_user_by_id_async_use_case(db: AsyncSession, user_id: str):
+    logger.debug(f"get_user_by_id_async_use_case called with user_id: {user_id}")
+    item = await get_user_by_id_async(db, user_id)
+    if item:
+        logger.info(f"User found - ID: {user_id}")
+    else:
+        logger.warning(f"User not found - ID: {user_id}")
+    return item
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""Bulk user import from the command line.
+
+    python -m app.cli.import_users usuarios.csv [--format csv|json|ndjson] [--batch-size 500]
+
+Prints the same JSON report as ``POST /users/import`` and exits non-zero if any row failed.
+"""
+import argparse
+import json
+import sys
+from app.infrastructure.database.database import SessionLocal
+from app.application.services.user_import_service import (
+    IMPORT_BATCH_SIZE, IMPORT_FORMATS, detect_import_format, iter_user_rows, import_users_service
+)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Importa usuarios desde un archivo CSV, JSON o NDJSON")
+    parser.add_argument("path", help="Archivo a importar")
+    parser.add_argument("--format", choices=IMPORT_FORMATS, help="Formato del archivo (por defecto se deduce de la extensión)")
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE, help="Filas por lote/transacción")
+    args = parser.parse_args(argv)
+
+    db = SessionLocal()
+    try:
+        with open(args.path, "rb") as stream:
+            report = import_users_service(
+                db, iter_user_rows(stream, args.format or detect_import_format(args.path)), args.batch_size)
+    finally:
+        db.close()
+
+    print(json.dumps(report, indent=2, ensure_ascii=False, default=str))
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
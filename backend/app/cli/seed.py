@@ -0,0 +1,41 @@
+"""Load the default roles, states, software, users, devices and accesses.
+
+    python -m app.cli.seed
+
+Requires a migrated schema (``alembic upgrade head``). Safe to run again: rows that already exist are skipped.
+"""
+import argparse
+import sys
+from app.infrastructure.database.database import SessionLocal, engine, load_models
+from app.infrastructure.database.init_data import load_all_initial_data
+from app.infrastructure.database.schema import SchemaOutOfDateError, check_schema
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Carga los datos por defecto en la base de datos")
+    parser.parse_args(argv)
+
+    load_models()
+    try:
+        check_schema(engine)
+    except SchemaOutOfDateError as e:
+        print(f"❌ {e}")
+        return 1
+
+    db = SessionLocal()
+    try:
+        timings = load_all_initial_data(db)
+        for name, rows, elapsed in timings:
+            print(f"  {name:<16} {rows:>7} filas  {elapsed * 1000:8.1f} ms")
+        print(f"🎉 Datos por defecto cargados en {sum(elapsed for _, _, elapsed in timings) * 1000:.1f} ms.")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error al cargar los datos por defecto: {e}")
+        return 1
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
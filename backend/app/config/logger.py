@@ -1,8 +1,12 @@
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional
 
 
 class CustomFormatter(logging.Formatter):
@@ -15,27 +19,43 @@ class CustomFormatter(logging.Formatter):
         'CRITICAL': '\033[35m',
         'RESET': '\033[0m'
     }
+    LOG_FORMAT = "%(asctime)s | %(name)s | %(levelname)s | %(message)s"
+    DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+    def __init__(self, color: bool = False):
+        super().__init__(self.LOG_FORMAT, datefmt=self.DATE_FORMAT)
+        self.color = color
+        # One formatter per level, built once instead of for every record.
+        self._color_formatters = {
+            level: logging.Formatter(f"{code}{self.LOG_FORMAT}{self.COLORS['RESET']}", datefmt=self.DATE_FORMAT)
+            for level, code in self.COLORS.items()
+        }
 
     def format(self, record):
-        log_format = "%(asctime)s | %(name)s | %(levelname)s | %(message)s"
+        if not self.color:
+            return super().format(record)
+        formatter = self._color_formatters.get(record.levelname, self._color_formatters['RESET'])
+        return formatter.format(record)
 
-        if hasattr(record, 'color') and record.color:
-            color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
-            log_format = f"{color}{log_format}{self.COLORS['RESET']}"
 
-        formatter = logging.Formatter(
-            log_format,
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+# Listeners own the real handlers and write from their own thread; stopped at exit so queued records are flushed.
+_listeners: List[logging.handlers.QueueListener] = []
+
+
+def stop_logging():
+    while _listeners:
+        _listeners.pop().stop()
 
-        return formatter.format(record)
+
+atexit.register(stop_logging)
 
 
 def setup_logger(
     name: str = "onboarding_flow",
     level: str = "INFO",
     log_file: Optional[str] = None,
-    console_output: bool = True
+    console_output: bool = True,
+    use_queue: bool = True
 ) -> logging.Logger:
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper()))
@@ -43,17 +63,13 @@ def setup_logger(
     if logger.handlers:
         return logger
 
+    handlers = []
+
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(getattr(logging, level.upper()))
-
-        console_formatter = CustomFormatter()
-        console_handler.setFormatter(console_formatter)
-
-        console_handler.addFilter(
-            lambda record: setattr(record, 'color', True) or True)
-
-        logger.addHandler(console_handler)
+        console_handler.setFormatter(CustomFormatter(color=True))
+        handlers.append(console_handler)
 
     if log_file:
         log_path = Path(log_file)
@@ -61,18 +77,75 @@ def setup_logger(
 
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(getattr(logging, level.upper()))
+        file_handler.setFormatter(CustomFormatter(color=False))
+        handlers.append(file_handler)
 
-        file_formatter = CustomFormatter()
-        file_handler.setFormatter(file_formatter)
-
-        file_handler.addFilter(lambda record: setattr(
-            record, 'color', False) or True)
+    if not use_queue:
+        for handler in handlers:
+            logger.addHandler(handler)
+        return logger
 
-        logger.addHandler(file_handler)
+    # QueueHandler.prepare still runs on the calling thread: it renders the message (%-args, lazy and
+    # StructuredMessage values, tracebacks) so that nothing it references is read after the caller moves on,
+    # e.g. an ORM object whose session has closed. The layout (timestamp, level colors) and the console/file
+    # I/O are left to the listener thread.
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners.append(listener)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     return logger
 
 
+class _Lazy:
+    __slots__ = ("func", "args", "kwargs")
+
+    def __init__(self, func: Callable[..., Any], args: tuple, kwargs: dict):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    def __str__(self):
+        return str(self.func(*self.args, **self.kwargs))
+
+    def __repr__(self):
+        return repr(self.func(*self.args, **self.kwargs))
+
+
+def lazy(func: Callable[..., Any], *args, **kwargs) -> _Lazy:
+    """Defer an expensive log argument: ``func(*args, **kwargs)`` only runs if the record is emitted.
+
+        logger.debug("Datos recibidos: %s", lazy(access_data.dict))
+    """
+    return _Lazy(func, args, kwargs)
+
+
+class StructuredMessage:
+    """``event key=value ...`` log message, rendered only when a handler formats the record."""
+
+    __slots__ = ("event", "fields")
+
+    def __init__(self, event: str, fields: Dict[str, Any]):
+        self.event = event
+        self.fields = fields
+
+    def __str__(self):
+        rendered = []
+        for key, value in self.fields.items():
+            text = str(value)
+            rendered.append(f'{key}="{text}"' if " " in text else f"{key}={text}")
+        return " ".join([self.event, *rendered])
+
+
+def log_event(logger: logging.Logger, level: int, event: str, **fields):
+    """Log a structured ``event`` with ``fields``; nothing is formatted unless ``level`` is enabled.
+
+        log_event(logger, logging.INFO, "request_metrics", route=route_key, queries=count)
+    """
+    logger.log(level, StructuredMessage(event, fields), stacklevel=2)
+
+
 def get_logger(name: str = None) -> logging.Logger:
     base_name = "onboarding_flow"
     if name:
@@ -89,7 +162,8 @@ def configure_default_logger():
 
     return setup_logger(
         name="onboarding_flow",
-        level="INFO",
+        # Read here rather than from config.env, which itself logs through this module.
+        level=os.getenv("LOG_LEVEL", "INFO"),
         log_file=str(log_file),
         console_output=True
     )
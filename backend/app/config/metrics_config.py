@@ -0,0 +1,20 @@
+from app.config.env import SQL_QUERY_BUDGET
+
+SQL_METRICS_SETTINGS = {
+    "default_query_budget": SQL_QUERY_BUDGET,
+    # "<METHOD> <route path>" -> max statements per request; a budget of 0 disables the check.
+    # Streamed responses (/all-data/stream, or /all-data/ with Accept: application/x-ndjson) are never
+    # checked: they run a query per batch, so the count scales with the table size.
+    "route_query_budgets": {
+        "GET /all-data/": 7,
+        "GET /users/": 2,
+        "GET /devices/": 3,
+        "GET /access/": 3,
+        "GET /software/": 3,
+        "GET /roles/": 2,
+        "GET /state-requests/": 2,
+        "GET /health": 0,
+        "GET /health/notifications": 1,
+        "GET /": 0,
+    }
+}
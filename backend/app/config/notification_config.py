@@ -1,3 +1,8 @@
+from app.config.env import (
+    NOTIFICATION_DIGEST_ENABLED, NOTIFICATION_BACKEND, SMTP_HOST, SMTP_PORT, SMTP_USERNAME, SMTP_PASSWORD, SMTP_STARTTLS,
+    SMTP_TIMEOUT, SMTP_FROM, SMTP_POOL_SIZE, SMTP_MAX_MESSAGES_PER_CONNECTION
+)
+
 NOTIFICATION_SETTINGS = {
     "teams": {
         "access": {
@@ -9,6 +14,35 @@ NOTIFICATION_SETTINGS = {
             "notify_on": ["device_created", "device_status_updated"]
         }
     },
+    "outbox": {
+        "batch_size": 100,
+        "poll_interval_seconds": 2,
+        "max_attempts": 5,
+        "retry_backoff_seconds": 5,
+        # Claimed events are not handed to another dispatcher for this long; it must outlast sending a batch.
+        "lease_seconds": 300
+    },
+    # Coalesces new-request events per team and status updates per user into a single message,
+    # sent once the oldest pending event is window_seconds old or max_batch_size requests are waiting.
+    "digest": {
+        "enabled": NOTIFICATION_DIGEST_ENABLED,
+        "window_seconds": 60,
+        "max_batch_size": 50
+    },
+    "delivery": {
+        "backend": NOTIFICATION_BACKEND,
+        "sender": SMTP_FROM,
+        "smtp": {
+            "host": SMTP_HOST,
+            "port": SMTP_PORT,
+            "username": SMTP_USERNAME,
+            "password": SMTP_PASSWORD,
+            "starttls": SMTP_STARTTLS,
+            "timeout": SMTP_TIMEOUT,
+            "pool_size": SMTP_POOL_SIZE,
+            "max_messages_per_connection": SMTP_MAX_MESSAGES_PER_CONNECTION
+        }
+    },
     "log_levels": {
         "team_notification": "INFO",
         "user_notification": "INFO",
@@ -31,6 +65,20 @@ EMAIL_TEMPLATES = {
         Por favor, revise y procese esta solicitud.
         """
     },
+    "access_created_digest": {
+        "subject": "Resumen: {request_count} Nuevas Solicitudes de Acceso",
+        "body": """
+        Se han recibido {request_count} solicitudes de acceso.
+        
+        {items}
+        
+        Primera solicitud: {first_created_at}
+        Última solicitud: {last_created_at}
+        
+        Por favor, revise y procese estas solicitudes.
+        """,
+        "item": "- {request_id} | Usuario: {user_name} | Software: {software_name} | Estado: {status}"
+    },
     "access_updated": {
         "subject": "Actualización en Solicitud de Acceso",
         "body": """
@@ -58,6 +106,31 @@ EMAIL_TEMPLATES = {
         Por favor, revise y procese esta solicitud.
         """
     },
+    "device_created_digest": {
+        "subject": "Resumen: {request_count} Nuevas Solicitudes de Dispositivo",
+        "body": """
+        Se han recibido {request_count} solicitudes de dispositivo.
+        
+        {items}
+        
+        Primera solicitud: {first_created_at}
+        Última solicitud: {last_created_at}
+        
+        Por favor, revise y procese estas solicitudes.
+        """,
+        "item": "- {request_id} | Usuario: {user_name} | Tipo de Dispositivo: {device_type} | Estado: {status}"
+    },
+    "request_updates_digest": {
+        "subject": "Resumen: {request_count} Actualizaciones en sus Solicitudes",
+        "body": """
+        Hola {user_name}, se han actualizado {request_count} de sus solicitudes.
+        
+        {items}
+        
+        Si tiene preguntas, contacte al equipo de soporte.
+        """,
+        "item": "- {request_label} {request_id} | Nuevo Estado: {status} | Fecha de Actualización: {updated_at}"
+    },
     "device_updated": {
         "subject": "Actualización en Solicitud de Dispositivo",
         "body": """
@@ -0,0 +1,35 @@
+from contextvars import ContextVar
+from threading import Lock
+from typing import List, Optional, Tuple
+
+
+class RequestQueryStats:
+    """Per-request SQL counters. Updates go through the methods: /all-data reads from several threads at once."""
+
+    __slots__ = ("query_count", "db_time", "timings", "_lock")
+
+    def __init__(self):
+        self.query_count = 0
+        self.db_time = 0.0
+        self.timings: List[Tuple[str, float]] = []
+        self._lock = Lock()
+
+    def add_query(self, seconds: float):
+        with self._lock:
+            self.query_count += 1
+            self.db_time += seconds
+
+    def add_timing(self, name: str, seconds: float):
+        with self._lock:
+            self.timings.append((name, seconds))
+
+
+# Set by QueryMetricsMiddleware; sync routes see the same object because the threadpool copies the context.
+current_request_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("request_query_stats", default=None)
+
+
+def record_timing(name: str, seconds: float):
+    """Add a ``name;dur=`` entry to the current request's Server-Timing header; a no-op outside a request."""
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.add_timing(name, seconds)
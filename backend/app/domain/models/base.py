@@ -1,8 +1,32 @@
 import uuid
-from sqlalchemy import Column, DateTime, func
+from sqlalchemy import Column, DateTime, Index, func
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import declared_attr
+from sqlalchemy.sql.functions import FunctionElement
+
+class write_timestamp(FunctionElement):
+    """Time of the statement that writes the row: ``clock_timestamp()`` on Postgres, where ``now()`` is the
+    transaction start and would stamp a long transaction's writes behind rows committed before it."""
+    type = DateTime()
+    inherit_cache = True
+
+@compiles(write_timestamp)
+def _write_timestamp_default(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+@compiles(write_timestamp, "postgresql")
+def _write_timestamp_postgresql(element, compiler, **kw):
+    return "clock_timestamp()"
 
 class TimestampMixin:
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     created_at = Column(DateTime, default=func.now(), nullable=False)
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
\ No newline at end of file
+    updated_at = Column(DateTime, default=write_timestamp(), onupdate=write_timestamp(), nullable=False)
+
+    @declared_attr
+    def __table_args__(cls):
+        return (
+            Index(f"ix_{cls.__tablename__}_created_at_id", "created_at", "id"),
+            Index(f"ix_{cls.__tablename__}_updated_at", "updated_at"),
+        )
\ No newline at end of file
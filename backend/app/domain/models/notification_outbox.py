@@ -0,0 +1,29 @@
+from sqlalchemy import Column, DateTime, Index, Integer, JSON, String, Text, func
+from app.infrastructure.database.database import Base
+from app.domain.models.base import TimestampMixin
+
+OUTBOX_PENDING = "pending"
+OUTBOX_SENT = "sent"
+OUTBOX_FAILED = "failed"
+
+class NotificationOutbox(Base, TimestampMixin):
+    """Notification written in the same transaction as the change that triggers it, sent later by the dispatcher."""
+    __tablename__ = 'notification_outbox'
+
+    event_type = Column(String, nullable=False)
+    payload = Column(JSON, nullable=False)
+    # Events sharing a key (same team, same user) can be coalesced into one digest message.
+    digest_key = Column(String, nullable=True)
+    # Requests the event announces (bulk events carry several); digests are sized in requests, not events.
+    request_count = Column(Integer, nullable=False, default=1)
+    status = Column(String, nullable=False, default=OUTBOX_PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=func.now())
+    last_error = Column(Text, nullable=True)
+    sent_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<NotificationOutbox(id={self.id}, event_type='{self.event_type}', status='{self.status}', attempts={self.attempts})>"
+
+Index("ix_notification_outbox_status_next_attempt_at", NotificationOutbox.status, NotificationOutbox.next_attempt_at)
+Index("ix_notification_outbox_status_digest_key", NotificationOutbox.status, NotificationOutbox.digest_key)
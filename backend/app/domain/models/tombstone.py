@@ -0,0 +1,14 @@
+from sqlalchemy import Column, String
+from sqlalchemy.dialects.postgresql import UUID
+from app.infrastructure.database.database import Base
+from app.domain.models.base import TimestampMixin
+
+class Tombstone(Base, TimestampMixin):
+    """Marks a hard-deleted row so delta sync clients can drop it; ``created_at`` is the deletion time."""
+    __tablename__ = 'tombstones'
+
+    entity = Column(String, nullable=False)
+    entity_id = Column(UUID(as_uuid=True), nullable=False)
+
+    def __repr__(self):
+        return f"<Tombstone(entity='{self.entity}', entity_id={self.entity_id})>"
@@ -29,4 +29,9 @@ class AccessResponse(AccessBase):
     state_request: StateRequestResponse
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class AccessProvisionRequest(BaseModel):
+    user_id: UUIDType
+    role_id: UUIDType
+    state_request_id: UUIDType
@@ -1,12 +1,77 @@
+from datetime import datetime
+from typing import Dict, Optional
+from uuid import UUID as UUIDType
 from pydantic import BaseModel
-from app.domain.schemas.user import UserResponse
-from app.domain.schemas.device import DeviceResponse
-from app.domain.schemas.access import AccessResponse
+from app.domain.schemas.user import UserBase, UserResponse
+from app.domain.schemas.device import DeviceBase, DeviceResponse
+from app.domain.schemas.access import AccessBase, AccessResponse
+from app.domain.schemas.software import SoftwareBase
+from app.domain.schemas.role import RoleResponse
+from app.domain.schemas.state_request import StateRequestResponse
 
 class AllDataResponse(BaseModel):
   user: list[UserResponse]
   devices: list[DeviceResponse]
   access: list[AccessResponse]
+  watermark: Optional[datetime] = None
   
   class Config:
     from_attributes = True
+
+class DeletedIds(BaseModel):
+  user: list[UUIDType] = []
+  devices: list[UUIDType] = []
+  access: list[UUIDType] = []
+
+class AllDataDeltaResponse(AllDataResponse):
+  deleted: DeletedIds
+  watermark: datetime
+  # A role, state or software changed since `since`: the lists hold every row and replace the client's copy.
+  full_resync: bool = False
+
+
+# shape=normalized: rows carry only foreign-key ids; each referenced role, state and software is sent once.
+class UserRow(UserBase):
+  id: UUIDType
+  created_at: datetime
+  updated_at: datetime
+
+  class Config:
+    from_attributes = True
+
+class DeviceRow(DeviceBase):
+  id: UUIDType
+  created_at: datetime
+  updated_at: datetime
+
+  class Config:
+    from_attributes = True
+
+class AccessRow(AccessBase):
+  id: UUIDType
+  created_at: datetime
+  updated_at: datetime
+
+  class Config:
+    from_attributes = True
+
+class SoftwareRow(SoftwareBase):
+  id: UUIDType
+  url: str
+  role_ids: list[UUIDType]
+  created_at: datetime
+  updated_at: datetime
+
+class AllDataNormalizedResponse(BaseModel):
+  user: list[UserRow]
+  devices: list[DeviceRow]
+  access: list[AccessRow]
+  roles: Dict[UUIDType, RoleResponse]
+  state_requests: Dict[UUIDType, StateRequestResponse]
+  software: Dict[UUIDType, SoftwareRow]
+  watermark: Optional[datetime] = None
+
+class AllDataNormalizedDeltaResponse(AllDataNormalizedResponse):
+  deleted: DeletedIds
+  watermark: datetime
+  full_resync: bool = False
@@ -1,4 +1,37 @@
-from pydantic import BaseModel
+from typing import Dict, Optional
+from pydantic import BaseModel, Field
 
 class HealthResponse(BaseModel):
-    status: str
\ No newline at end of file
+    status: str
+
+class PoolStats(BaseModel):
+    pool_class: str
+    size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    wait_time_total_ms: float
+    wait_time_max_ms: float
+
+class PoolStatusResponse(BaseModel):
+    sync: PoolStats
+    async_: PoolStats = Field(alias="async")
+
+    class Config:
+        populate_by_name = True
+
+class DeliveryStats(BaseModel):
+    backend: str
+    messages_sent: int
+    messages_failed: int
+    failed_recipients: Dict[str, int]
+    connections_opened: Optional[int] = None
+    idle_connections: Optional[int] = None
+
+class OutboxStatusResponse(BaseModel):
+    pending: int
+    sent: int
+    failed: int
+    delivery: DeliveryStats
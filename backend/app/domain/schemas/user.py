@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID as UUIDType
 from datetime import datetime
 from pydantic import BaseModel, EmailStr
@@ -35,4 +35,17 @@ class UserResponse(UserBase):
     role: RoleResponse
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class UserImportRowError(BaseModel):
+    row: int
+    email: Optional[str] = None
+    status: str
+    detail: str
+
+class UserImportReport(BaseModel):
+    total: int = 0
+    created: int = 0
+    skipped: int = 0
+    failed: int = 0
+    errors: List[UserImportRowError] = []
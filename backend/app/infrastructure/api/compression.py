@@ -0,0 +1,220 @@
+import gzip
+import zlib
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Dict, Optional
+from fastapi import Request, Response
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from app.config.env import (
+    COMPRESSION_ENABLED, COMPRESSION_MIN_SIZE, COMPRESSION_GZIP_LEVEL, COMPRESSION_BROTLI_QUALITY,
+    RESPONSE_BODY_CACHE_ENTRIES
+)
+from app.config.logger import get_logger
+
+try:
+    import brotli
+except ImportError:  # brotli is in requirements.txt; without it only gzip is offered
+    brotli = None
+
+logger = get_logger("api.compression")
+
+# In order of preference when the client accepts more than one.
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+_COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+# Bodies above this are compressed in the threadpool so a large dump does not stall the event loop.
+_INLINE_COMPRESSION_LIMIT = 64 * 1024
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Preferred encoding in ``ENCODINGS`` that the Accept-Encoding header allows, or None for identity."""
+    if not COMPRESSION_ENABLED or not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        weight = 1.0
+        params = params.strip().replace(" ", "")
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[coding.strip().lower()] = weight
+    for encoding in ENCODINGS:
+        if weights.get(encoding, weights.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=COMPRESSION_BROTLI_QUALITY)
+    # mtime=0 keeps the output identical for identical bodies.
+    return gzip.compress(data, compresslevel=COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+class _StreamCompressor:
+    """Incremental compressor for streamed bodies; every chunk is flushed so NDJSON lines still arrive as sent."""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=COMPRESSION_BROTLI_QUALITY)
+        else:
+            self._zlib = zlib.compressobj(COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def chunk(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.finish()
+        return self._zlib.flush()
+
+
+def _compressible(headers: Headers) -> bool:
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "")
+    return content_type.startswith(_COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    """Compresses JSON and text responses of at least COMPRESSION_MIN_SIZE bytes with brotli or gzip.
+
+    Responses that already carry a Content-Encoding (see ``PrecompressedBody``) are passed through
+    untouched. Streamed bodies are compressed chunk by chunk instead of being buffered.
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        stream: Optional[_StreamCompressor] = None
+
+        async def send_compressed(message):
+            nonlocal start_message, stream
+            if message["type"] == "http.response.start":
+                # Held back until the first body chunk shows whether the response is worth compressing.
+                start_message = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if start_message is not None:
+                start, start_message = start_message, None
+                headers = MutableHeaders(raw=list(start.get("headers", [])))
+                if not _compressible(headers) or (not more_body and len(body) < self.minimum_size):
+                    await send(start)
+                    await send(message)
+                    return
+                headers["content-encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if not more_body:
+                    if len(body) > _INLINE_COMPRESSION_LIMIT:
+                        body = await run_in_threadpool(compress, body, encoding)
+                    else:
+                        body = compress(body, encoding)
+                    headers["content-length"] = str(len(body))
+                    await send({**start, "headers": headers.raw})
+                    await send({**message, "body": body})
+                    return
+                del headers["content-length"]
+                stream = _StreamCompressor(encoding)
+                await send({**start, "headers": headers.raw})
+
+            if stream is None:
+                await send(message)
+                return
+            data = stream.chunk(body) if body else b""
+            if not more_body:
+                data += stream.finish()
+            if data or not more_body:
+                await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
+
+
+class PrecompressedBody:
+    """A rendered response body kept server-side, with each compressed variant built once on first use."""
+
+    __slots__ = ("identity", "_variants", "_lock")
+
+    def __init__(self, identity: bytes):
+        self.identity = identity
+        self._variants: Dict[str, bytes] = {}
+        self._lock = Lock()
+
+    def encoded(self, encoding: str) -> bytes:
+        variant = self._variants.get(encoding)
+        if variant is None:
+            with self._lock:
+                variant = self._variants.get(encoding)
+                if variant is None:
+                    variant = self._variants[encoding] = compress(self.identity, encoding)
+        return variant
+
+    def response(self, request: Request, media_type: str) -> Response:
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+        # Sent on every variant, identity included: a shared cache must not hand a stored identity body to a
+        # client that accepts br, or the reverse.
+        if encoding is None or len(self.identity) < COMPRESSION_MIN_SIZE:
+            return Response(self.identity, media_type=media_type, headers={"Vary": "Accept-Encoding"})
+        return Response(self.encoded(encoding), media_type=media_type,
+                        headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"})
+
+
+class ResponseBodyCache:
+    """Bounded LRU of ``PrecompressedBody`` keyed by ETag, which already names the data version and query."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._bodies: "OrderedDict[str, PrecompressedBody]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[PrecompressedBody]:
+        with self._lock:
+            body = self._bodies.get(key)
+            if body is not None:
+                self._bodies.move_to_end(key)
+            return body
+
+    def put(self, key: str, body: PrecompressedBody) -> PrecompressedBody:
+        if self.max_entries <= 0:
+            return body
+        with self._lock:
+            self._bodies[key] = body
+            self._bodies.move_to_end(key)
+            while len(self._bodies) > self.max_entries:
+                self._bodies.popitem(last=False)
+        logger.debug(f"Cuerpo de respuesta cacheado - {len(body.identity)} bytes, {len(self._bodies)} entradas")
+        return body
+
+    def get_or_build(self, key: str, build: Callable[[], PrecompressedBody]) -> PrecompressedBody:
+        body = self.get(key)
+        return body if body is not None else self.put(key, build())
+
+    def clear(self):
+        with self._lock:
+            self._bodies.clear()
+
+
+response_bodies = ResponseBodyCache(RESPONSE_BODY_CACHE_ENTRIES)
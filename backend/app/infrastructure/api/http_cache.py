@@ -0,0 +1,40 @@
+import hashlib
+from typing import Optional
+from fastapi import Request, Response
+from app.config.env import REFERENCE_DATA_MAX_AGE
+
+# Always revalidate; a matching ETag turns the response into an empty 304.
+REVALIDATE = "private, no-cache"
+# Reference tables the UI never edits can be reused for a while before revalidating.
+REFERENCE_DATA = f"private, max-age={REFERENCE_DATA_MAX_AGE}, must-revalidate"
+
+
+def make_etag(request: Request, version: str) -> str:
+    """Weak ETag over the collection version and the query string, which selects the representation (page, cursor, all)."""
+    query = "&".join(f"{key}={value}" for key, value in sorted(request.query_params.multi_items()))
+    raw = f"{version}|{request.url.path}|{query}"
+    return f'W/"{hashlib.sha1(raw.encode("utf-8")).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def not_modified(request: Request, response: Response, etag: str, cache_control: str) -> Optional[Response]:
+    """Stamp the validators on ``response``; return a 304 to send instead when the client's copy is current."""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
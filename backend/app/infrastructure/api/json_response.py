@@ -0,0 +1,98 @@
+from typing import Any, Callable, Dict, Optional, Union, get_args, get_origin
+from fastapi import Request, Response
+from pydantic import BaseModel, EmailStr, TypeAdapter, create_model
+from app.infrastructure.api.compression import PrecompressedBody, response_bodies
+
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultJSONResponse
+except ImportError:  # orjson is in requirements.txt; without it responses fall back to the stdlib encoder
+    from fastapi.responses import JSONResponse as DefaultJSONResponse
+
+JSON_MEDIA_TYPE = "application/json"
+
+# Input-only constraints that rows read back from our own tables already satisfied when they were written.
+# EmailStr alone is most of the cost of validating a user (IDNA checks on every address).
+_TRUSTED_TYPES: Dict[Any, Any] = {EmailStr: str}
+
+_trusted_models: Dict[type, type] = {}
+
+
+def _is_model(annotation: Any) -> bool:
+    # get_origin() first: on Python 3.9 ``list[X]`` passes isinstance(..., type) but not issubclass().
+    return get_origin(annotation) is None and isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def _trusted(annotation: Any) -> Any:
+    if annotation in _TRUSTED_TYPES:
+        return _TRUSTED_TYPES[annotation]
+    args = get_args(annotation)
+    if not args:
+        return trusted_schema(annotation) if _is_model(annotation) else annotation
+    trusted_args = tuple(_trusted(arg) for arg in args)
+    if trusted_args == args:
+        return annotation
+    origin = get_origin(annotation)
+    return Union[trusted_args] if origin is Union else origin[trusted_args]
+
+
+def trusted_schema(schema: Any) -> Any:
+    """``schema`` with the fields that only guard client input relaxed, e.g. ``EmailStr`` -> ``str``.
+
+    Models are subclassed rather than copied, so config, validators and serializers are inherited and
+    the JSON output is unchanged; a model with nothing to relax is returned as is.
+    """
+    if not _is_model(schema):
+        return _trusted(schema)
+    if schema not in _trusted_models:
+        overrides = {}
+        for name, field in schema.model_fields.items():
+            annotation = _trusted(field.annotation)
+            if annotation is not field.annotation:
+                overrides[name] = (annotation, field)
+        _trusted_models[schema] = create_model(schema.__name__, __base__=schema, **overrides) if overrides else schema
+    return _trusted_models[schema]
+
+
+class JSONBody:
+    """Prebuilt serializer for one response schema, for the large list and /all-data responses.
+
+    Returning ORM rows lets FastAPI validate them against ``response_model``, turn the result back into
+    plain dicts and lists, and then hand those to ``json.dumps``. Here the rows go through a TypeAdapter
+    built at import time, validated once from attributes against ``trusted_schema(schema)`` and dumped
+    straight to JSON bytes by pydantic-core. The output is the same.
+    """
+
+    __slots__ = ("adapter",)
+
+    def __init__(self, schema: Any):
+        self.adapter = TypeAdapter(trusted_schema(schema))
+
+    def render(self, data: Any) -> bytes:
+        return self.adapter.dump_json(self.adapter.validate_python(data, from_attributes=True))
+
+    def response(self, data: Any, sub_response: Optional[Response] = None) -> Response:
+        """Returned as-is by the route, so FastAPI's response_model pass is skipped.
+
+        Headers set on the route's ``response`` parameter (ETag, Cache-Control) are carried over, since
+        FastAPI only merges them into responses it builds itself.
+        """
+        return _with_headers(Response(self.render(data), media_type=JSON_MEDIA_TYPE), sub_response)
+
+    def cached_response(self, etag: str, load: Callable[[], Any], request: Request,
+                        sub_response: Optional[Response] = None, cache: Any = response_bodies) -> Response:
+        """Like ``response``, but the rendered and compressed bytes are kept in ``cache`` under ``etag``.
+
+        Only for routes whose ETag changes whenever the body would; ``load`` is not called on a hit.
+        ``cache`` is anything with ``get_or_build(key, build)``: the reference routes' LRU by default,
+        or a write-invalidated ``SnapshotCache``.
+        """
+        body = cache.get_or_build(etag, lambda: PrecompressedBody(self.render(load())))
+        return _with_headers(body.response(request, JSON_MEDIA_TYPE), sub_response)
+
+
+def _with_headers(response: Response, sub_response: Optional[Response]) -> Response:
+    if sub_response is not None:
+        response.headers.raw.extend(
+            (key, value) for key, value in sub_response.headers.raw if key != b"content-length")
+    return response
@@ -0,0 +1,105 @@
+import logging
+import time
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.config.metrics_config import SQL_METRICS_SETTINGS
+from app.config.request_metrics import RequestQueryStats, current_request_stats
+from app.config.logger import get_logger, log_event
+
+logger = get_logger("middleware.query_metrics")
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_start_time"].pop()
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.add_query(time.perf_counter() - started)
+
+
+def _handle_error(exception_context):
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_start_time"):
+        connection.info["query_start_time"].pop()
+
+
+def instrument_engine(engine: Engine):
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
+
+
+def _route_key(scope) -> str:
+    route = scope.get("route")
+    path = route.path if route is not None else scope.get("path", "")
+    return f"{scope.get('method', '')} {path}"
+
+
+def _query_budget(route_key: str) -> int:
+    return SQL_METRICS_SETTINGS["route_query_budgets"].get(
+        route_key, SQL_METRICS_SETTINGS["default_query_budget"])
+
+
+def _server_timing(stats: RequestQueryStats, elapsed: float) -> str:
+    db_ms = stats.db_time * 1000
+    total_ms = elapsed * 1000
+    value = (
+        f'db;dur={db_ms:.2f};desc="{stats.query_count} queries", '
+        f"app;dur={max(total_ms - db_ms, 0.0):.2f}, "
+        f"total;dur={total_ms:.2f}"
+    )
+    for name, seconds in stats.timings:
+        value += f", {name};dur={seconds * 1000:.2f}"
+    return value
+
+
+class QueryMetricsMiddleware:
+    """Counts SQL statements and DB time per request and reports them via Server-Timing and the log."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = current_request_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+        streamed = False
+
+        async def send_with_metrics(message):
+            nonlocal status_code, streamed
+            if message["type"] == "http.response.body" and message.get("more_body", False):
+                streamed = True
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", _server_timing(stats, time.perf_counter() - started).encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            current_request_stats.reset(token)
+            self._report(scope, stats, status_code, time.perf_counter() - started, streamed)
+
+    def _report(self, scope, stats: RequestQueryStats, status_code: int, elapsed: float, streamed: bool = False):
+        route_key = _route_key(scope)
+        log_event(
+            logger, logging.INFO, "request_metrics", route=route_key, path=scope.get("path"), status=status_code,
+            queries=stats.query_count, db_ms=round(stats.db_time * 1000, 2), total_ms=round(elapsed * 1000, 2),
+            streamed=streamed
+        )
+        # A streamed body issues queries per batch, so its count grows with the table rather than the code path.
+        budget = 0 if streamed else _query_budget(route_key)
+        if budget and stats.query_count > budget:
+            log_event(logger, logging.WARNING, "query_budget_exceeded",
+                      route=route_key, queries=stats.query_count, budget=budget)
@@ -1,76 +1,123 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from starlette.status import HTTP_204_NO_CONTENT
 from sqlalchemy.orm import Session
 from app.infrastructure.database.database import get_db
-from app.domain.schemas.access import AccessCreate, AccessUpdate, AccessResponse
+from app.infrastructure.database.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.infrastructure.api.http_cache import make_etag, not_modified, REVALIDATE
+from app.infrastructure.api.json_response import JSONBody
+from app.domain.schemas.pagination import Page
+from app.domain.schemas.access import AccessCreate, AccessUpdate, AccessResponse, AccessProvisionRequest
 from app.application.use_cases.access_use_case import (
-    create_access_use_case, get_all_accesses_use_case,
+    create_access_use_case, get_all_accesses_use_case, get_accesses_page_use_case,
     get_access_by_id_use_case, update_access_use_case, delete_access_use_case
 )
-from app.application.services.access_service import update_access_status_service, create_access_service
-from app.config.logger import get_logger
+from app.application.services.access_service import (
+    update_access_status_service, create_access_service, create_accesses_service, provision_access_by_role_service
+)
+from app.application.use_cases.collection_version_use_case import get_accesses_version_use_case
+from app.config.logger import get_logger, lazy
 
 logger = get_logger("routers.access")
 
 router = APIRouter(prefix="/access", tags=["Access"])
 
+ACCESSES_JSON = JSONBody(list[AccessResponse])
+ACCESSES_PAGE_JSON = JSONBody(Page[AccessResponse])
+
 @router.post("/", response_model=AccessResponse, description="Add a new access record")
 def add_access(access_data: AccessCreate, db: Session = Depends(get_db)):
-    logger.debug(f"Route add_access called with data: {access_data.dict()}")
+    logger.debug("Route add_access called with data: %s", lazy(access_data.dict))
     try:
         logger.debug("Calling create_access_service")
         return create_access_service(db, access_data)
     except Exception as e:
-        logger.error(f"Error adding access: {e}")
+        logger.error("Error adding access: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/bulk", response_model=list[AccessResponse], description="Add several access records in one transaction")
+def add_accesses(accesses_data: List[AccessCreate], db: Session = Depends(get_db)):
+    logger.debug("Route add_accesses called with %s records", len(accesses_data))
+    try:
+        logger.debug("Calling create_accesses_service")
+        return create_accesses_service(db, accesses_data)
+    except Exception as e:
+        logger.error("Error adding accesses: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/provision-by-role", response_model=list[AccessResponse], description="Request access to every software required by a role for a user")
+def provision_access_by_role(provision_data: AccessProvisionRequest, db: Session = Depends(get_db)):
+    logger.debug("Route provision_access_by_role called with data: %s", lazy(provision_data.dict))
+    try:
+        logger.debug("Calling provision_access_by_role_service")
+        return provision_access_by_role_service(db, provision_data)
+    except Exception as e:
+        logger.error("Error provisioning access by role: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/", response_model=list[AccessResponse], description="Get all access records")
-def get_accesses(db: Session = Depends(get_db)):
-    logger.debug("Route get_accesses called")
+@router.get("/", response_model=Union[Page[AccessResponse], list[AccessResponse]], description="Get access records paginated by cursor, or every row with all=true")
+def get_accesses(
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fetch_all: bool = Query(False, alias="all"),
+    db: Session = Depends(get_db)
+):
+    logger.debug("Route get_accesses called with limit: %s, cursor: %s, all: %s", limit, cursor, fetch_all)
     try:
-        logger.debug("Calling get_all_accesses_use_case")
-        return get_all_accesses_use_case(db)
+        logger.debug("Calling get_accesses_version_use_case")
+        etag = make_etag(request, get_accesses_version_use_case(db))
+        cached = not_modified(request, response, etag, REVALIDATE)
+        if cached:
+            return cached
+        if fetch_all:
+            logger.debug("Calling get_all_accesses_use_case")
+            return ACCESSES_JSON.response(get_all_accesses_use_case(db), response)
+        logger.debug("Calling get_accesses_page_use_case")
+        items, next_cursor = get_accesses_page_use_case(db, limit, cursor)
+        return ACCESSES_PAGE_JSON.response({"items": items, "next_cursor": next_cursor}, response)
     except Exception as e:
-        logger.error(f"Error getting accesses: {e}")
+        logger.error("Error getting accesses: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/{access_id}", response_model=AccessResponse, description="Get an access record by id")
 def get_access(access_id: str, db: Session = Depends(get_db)):
-    logger.debug(f"Route get_access called with id: {access_id}")
+    logger.debug("Route get_access called with id: %s", access_id)
     try:
         logger.debug("Calling get_access_by_id_use_case")
         return get_access_by_id_use_case(db, access_id)
     except Exception as e:
-        logger.error(f"Error getting access by id: {e}")
+        logger.error("Error getting access by id: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.put("/{access_id}", response_model=AccessResponse, description="Update an access record")
 def update_access(access_id: str, access_data: AccessUpdate, db: Session = Depends(get_db)):
-    logger.debug(f"Route update_access called with id: {access_id}, data: {access_data.dict(exclude_unset=True)}")
+    logger.debug("Route update_access called with id: %s, data: %s", access_id, lazy(access_data.dict, exclude_unset=True))
     try:
         logger.debug("Calling update_access_use_case")
         return update_access_use_case(db, access_id, access_data)
     except Exception as e:
-        logger.error(f"Error updating access: {e}")
+        logger.error("Error updating access: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.delete("/{access_id}", description="Delete an access record", status_code=HTTP_204_NO_CONTENT)
 def delete_access(access_id: str, db: Session = Depends(get_db)):
-    logger.debug(f"Route delete_access called with id: {access_id}")
+    logger.debug("Route delete_access called with id: %s", access_id)
     try:
         logger.debug("Calling delete_access_use_case")
         delete_access_use_case(db, access_id)
     except Exception as e:
-        logger.error(f"Error deleting access: {e}")
+        logger.error("Error deleting access: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
     
 @router.patch("/{access_id}/{new_status}", response_model=AccessResponse, description="Update the status of an access record")
 def update_access_status(access_id: str, new_status: str, db: Session = Depends(get_db)):
-    logger.debug(f"Route update_access_status called with id: {access_id}, new_status: {new_status}")
+    logger.debug("Route update_access_status called with id: %s, new_status: %s", access_id, new_status)
     try:
         logger.debug("Calling update_access_status_service")
         return update_access_status_service(db, access_id, new_status)
          
     except Exception as e:
-        logger.error(f"Error updating access status: {e}")
+        logger.error("Error updating access status: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
@@ -1,22 +1,84 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+from typing import Literal, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from starlette.status import HTTP_204_NO_CONTENT
 from sqlalchemy.orm import Session
-from app.infrastructure.database.database import get_db
-from app.domain.schemas.all_data import AllDataResponse
+from app.infrastructure.database.database import get_db, SessionLocal
+from app.infrastructure.api.http_cache import make_etag, not_modified, REVALIDATE
+from app.infrastructure.api.json_response import JSONBody
+from app.infrastructure.cache.snapshot_cache import all_data_snapshot
+from app.domain.schemas.all_data import (
+    AllDataResponse, AllDataDeltaResponse, AllDataNormalizedResponse, AllDataNormalizedDeltaResponse
+)
 from app.application.services.all_data_service import (
-    get_all_data_service
+    get_all_data_service,
+    get_all_data_changes_service,
+    get_all_data_normalized_service,
+    stream_all_data_service
 )
+from app.application.use_cases.collection_version_use_case import get_all_data_version_use_case
 from app.config.logger import get_logger
 
 logger = get_logger("routers.all_data")
 
 router = APIRouter(prefix="/all-data")
 
-@router.get("/", response_model=AllDataResponse, description="Get all data including users, devices, and accesses")
-def get_all_data(db: Session = Depends(get_db)):
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+ALL_DATA_JSON = JSONBody(AllDataResponse)
+ALL_DATA_DELTA_JSON = JSONBody(AllDataDeltaResponse)
+ALL_DATA_NORMALIZED_JSON = JSONBody(AllDataNormalizedResponse)
+ALL_DATA_NORMALIZED_DELTA_JSON = JSONBody(AllDataNormalizedDeltaResponse)
+
+
+def _ndjson_response() -> StreamingResponse:
+    # The stream outlives the request-scoped get_db session, so it owns its own.
+    def generate():
+        db = SessionLocal()
+        try:
+            yield from stream_all_data_service(db)
+        finally:
+            db.close()
+
+    return StreamingResponse(generate(), media_type=NDJSON_MEDIA_TYPE)
+
+
+@router.get(
+    "/",
+    response_model=Union[AllDataDeltaResponse, AllDataResponse, AllDataNormalizedDeltaResponse, AllDataNormalizedResponse],
+    description="Get all data including users, devices, and accesses, or only what changed after since=<watermark>. "
+                "shape=normalized returns rows with ids only, plus roles, state_requests and software lookup maps"
+)
+def get_all_data(
+    request: Request,
+    response: Response,
+    since: Optional[datetime] = None,
+    shape: Literal["nested", "normalized"] = "nested",
+    db: Session = Depends(get_db)
+):
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        logger.debug("Accept NDJSON recibido, delegando a stream de all-data")
+        return _ndjson_response()
     try:
-        return get_all_data_service(db)
+        etag = make_etag(request, get_all_data_version_use_case(db))
+        cached = not_modified(request, response, etag, REVALIDATE)
+        if cached:
+            return cached
+        if shape == "normalized":
+            logger.debug("Calling get_all_data_normalized_service")
+            body = ALL_DATA_NORMALIZED_JSON if since is None else ALL_DATA_NORMALIZED_DELTA_JSON
+            return body.response(get_all_data_normalized_service(db, since), response)
+        if since is not None:
+            logger.debug("Calling get_all_data_changes_service")
+            return ALL_DATA_DELTA_JSON.response(get_all_data_changes_service(db, since), response)
+        logger.debug("Sirviendo snapshot de all-data")
+        return ALL_DATA_JSON.cached_response(etag, lambda: get_all_data_service(db), request, response, all_data_snapshot)
     except Exception as e:
-        logger.error(f"Error getting data: {e}")
+        logger.error("Error getting data: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
+
+@router.get("/stream", description="Stream users, devices and accesses as NDJSON, one record per line")
+def stream_all_data():
+    return _ndjson_response()
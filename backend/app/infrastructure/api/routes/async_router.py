@@ -0,0 +1,208 @@
+from typing import Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.infrastructure.database.database import get_async_db
+from app.infrastructure.database.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.infrastructure.api.json_response import JSONBody
+from app.domain.schemas.pagination import Page
+from app.domain.schemas.user import UserResponse
+from app.domain.schemas.device import DeviceResponse
+from app.domain.schemas.access import AccessResponse
+from app.domain.schemas.software import SoftwareResponse
+from app.domain.schemas.role import RoleResponse
+from app.domain.schemas.state_request import StateRequestResponse
+from app.domain.schemas.all_data import AllDataResponse
+from app.application.use_cases.user_use_case import (
+    get_all_users_async_use_case, get_users_page_async_use_case, get_user_by_id_async_use_case
+)
+from app.application.use_cases.device_use_case import (
+    get_all_devices_async_use_case, get_devices_page_async_use_case, get_device_by_id_async_use_case
+)
+from app.application.use_cases.access_use_case import (
+    get_all_accesses_async_use_case, get_accesses_page_async_use_case, get_access_by_id_async_use_case
+)
+from app.application.use_cases.software_use_case import (
+    get_all_software_async_use_case, get_software_page_async_use_case, get_software_by_id_async_use_case
+)
+from app.application.use_cases.role_use_case import (
+    get_all_roles_async_use_case, get_roles_page_async_use_case, get_role_by_id_async_use_case
+)
+from app.application.use_cases.state_request_use_case import (
+    get_all_state_requests_async_use_case, get_state_requests_page_async_use_case, get_state_request_by_id_async_use_case
+)
+from app.application.services.all_data_service import get_all_data_async_service
+from app.config.logger import get_logger
+
+logger = get_logger("routers.async")
+
+# Read endpoints on the AsyncEngine/asyncpg stack. They mirror the sync routes
+# under an /async prefix so both paths can be benchmarked side by side.
+router = APIRouter(prefix="/async", tags=["Async"])
+
+
+def _bodies(schema):
+    return JSONBody(list[schema]), JSONBody(Page[schema])
+
+
+USERS_JSON = _bodies(UserResponse)
+DEVICES_JSON = _bodies(DeviceResponse)
+ACCESSES_JSON = _bodies(AccessResponse)
+SOFTWARE_JSON = _bodies(SoftwareResponse)
+ROLES_JSON = _bodies(RoleResponse)
+STATE_REQUESTS_JSON = _bodies(StateRequestResponse)
+ALL_DATA_JSON = JSONBody(AllDataResponse)
+
+
+async def _list_or_page(all_use_case, page_use_case, bodies, db: AsyncSession, limit: int, cursor: Optional[str], fetch_all: bool):
+    list_json, page_json = bodies
+    if fetch_all:
+        return list_json.response(await all_use_case(db))
+    items, next_cursor = await page_use_case(db, limit, cursor)
+    return page_json.response({"items": items, "next_cursor": next_cursor})
+
+
+@router.get("/users/", response_model=Union[Page[UserResponse], list[UserResponse]], description="Get users (async)")
+async def get_users(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fetch_all: bool = Query(False, alias="all"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    logger.debug("Route async get_users called with limit: %s, cursor: %s, all: %s", limit, cursor, fetch_all)
+    try:
+        return await _list_or_page(get_all_users_async_use_case, get_users_page_async_use_case, USERS_JSON, db, limit, cursor, fetch_all)
+    except Exception as e:
+        logger.error("Error getting users: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/users/{user_id}", response_model=UserResponse, description="Get a user by id (async)")
+async def get_user(user_id: str, db: AsyncSession = Depends(get_async_db)):
+    logger.debug("Route async get_user called with user_id: %s", user_id)
+    try:
+        return await get_user_by_id_async_use_case(db, user_id)
+    except Exception as e:
+        logger.error("Error getting user by id: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/devices/", response_model=Union[Page[DeviceResponse], list[DeviceResponse]], description="Get devices (async)")
+async def get_devices(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fetch_all: bool = Query(False, alias="all"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    logger.debug("Route async get_devices called with limit: %s, cursor: %s, all: %s", limit, cursor, fetch_all)
+    try:
+        return await _list_or_page(get_all_devices_async_use_case, get_devices_page_async_use_case, DEVICES_JSON, db, limit, cursor, fetch_all)
+    except Exception as e:
+        logger.error("Error getting devices: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/devices/{device_id}", response_model=DeviceResponse, description="Get a device by id (async)")
+async def get_device(device_id: str, db: AsyncSession = Depends(get_async_db)):
+    logger.debug("Route async get_device called with id: %s", device_id)
+    try:
+        return await get_device_by_id_async_use_case(db, device_id)
+    except Exception as e:
+        logger.error("Error getting device by id: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/access/", response_model=Union[Page[AccessResponse], list[AccessResponse]], description="Get access records (async)")
+async def get_accesses(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fetch_all: bool = Query(False, alias="all"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    logger.debug("Route async get_accesses called with limit: %s, cursor: %s, all: %s", limit, cursor, fetch_all)
+    try:
+        return await _list_or_page(get_all_accesses_async_use_case, get_accesses_page_async_use_case, ACCESSES_JSON, db, limit, cursor, fetch_all)
+    except Exception as e:
+        logger.error("Error getting accesses: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/access/{access_id}", response_model=AccessResponse, description="Get an access record by id (async)")
+async def get_access(access_id: str, db: AsyncSession = Depends(get_async_db)):
+    logger.debug("Route async get_access called with id: %s", access_id)
+    try:
+        return await get_access_by_id_async_use_case(db, access_id)
+    except Exception as e:
+        logger.error("Error getting access by id: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/software/", response_model=Union[Page[SoftwareResponse], list[SoftwareResponse]], description="Get software (async)")
+async def get_software(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fetch_all: bool = Query(False, alias="all"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    logger.debug("Route async get_software called with limit: %s, cursor: %s, all: %s", limit, cursor, fetch_all)
+    try:
+        return await _list_or_page(get_all_software_async_use_case, get_software_page_async_use_case, SOFTWARE_JSON, db, limit, cursor, fetch_all)
+    except Exception as e:
+        logger.error("Error getting software: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/software/{software_id}", response_model=SoftwareResponse, description="Get a software by id (async)")
+async def get_software_by_id(software_id: str, db: AsyncSession = Depends(get_async_db)):
+    logger.debug("Route async get_software_by_id called with id: %s", software_id)
+    try:
+        return await get_software_by_id_async_use_case(db, software_id)
+    except Exception as e:
+        logger.error("Error getting software by id: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/roles/", response_model=Union[Page[RoleResponse], list[RoleResponse]], description="Get roles (async)")
+async def get_roles(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fetch_all: bool = Query(False, alias="all"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    logger.debug("Route async get_roles called with limit: %s, cursor: %s, all: %s", limit, cursor, fetch_all)
+    try:
+        return await _list_or_page(get_all_roles_async_use_case, get_roles_page_async_use_case, ROLES_JSON, db, limit, cursor, fetch_all)
+    except Exception as e:
+        logger.error("Error getting roles: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/roles/{role_id}", response_model=RoleResponse, description="Get a role by id (async)")
+async def get_role(role_id: str, db: AsyncSession = Depends(get_async_db)):
+    logger.debug("Route async get_role called with id: %s", role_id)
+    try:
+        return await get_role_by_id_async_use_case(db, role_id)
+    except Exception as e:
+        logger.error("Error getting role by id: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/state-requests/", response_model=Union[Page[StateRequestResponse], list[StateRequestResponse]], description="Get state requests (async)")
+async def get_state_requests(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fetch_all: bool = Query(False, alias="all"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    logger.debug("Route async get_state_requests called with limit: %s, cursor: %s, all: %s", limit, cursor, fetch_all)
+    try:
+        return await _list_or_page(get_all_state_requests_async_use_case, get_state_requests_page_async_use_case, STATE_REQUESTS_JSON, db, limit, cursor, fetch_all)
+    except Exception as e:
+        logger.error("Error getting state requests: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/state-requests/{state_request_id}", response_model=StateRequestResponse, description="Get a state request by id (async)")
+async def get_state_request(state_request_id: str, db: AsyncSession = Depends(get_async_db)):
+    logger.debug("Route async get_state_request called with id: %s", state_request_id)
+    try:
+        return await get_state_request_by_id_async_use_case(db, state_request_id)
+    except Exception as e:
+        logger.error("Error getting state request by id: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/all-data/", response_model=AllDataResponse, description="Get all data including users, devices, and accesses (async)")
+async def get_all_data(db: AsyncSession = Depends(get_async_db)):
+    try:
+        return ALL_DATA_JSON.response(await get_all_data_async_service(db))
+    except Exception as e:
+        logger.error("Error getting data: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
@@ -1,67 +1,93 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from starlette.status import HTTP_204_NO_CONTENT
 from sqlalchemy.orm import Session
 from app.infrastructure.database.database import get_db
+from app.infrastructure.database.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.infrastructure.api.http_cache import make_etag, not_modified, REVALIDATE
+from app.infrastructure.api.json_response import JSONBody
+from app.domain.schemas.pagination import Page
 from app.domain.schemas.device import DeviceCreate, DeviceUpdate, DeviceResponse
 from app.application.use_cases.device_use_case import (
     get_all_devices_use_case,
+    get_devices_page_use_case,
     get_device_by_id_use_case,
     update_device_use_case,
     delete_device_use_case,
 )
 from app.application.services.device_service import create_device_service, update_device_status_service
-from app.config.logger import get_logger
+from app.application.use_cases.collection_version_use_case import get_devices_version_use_case
+from app.config.logger import get_logger, lazy
 
 logger = get_logger("routers.device")
 
 router = APIRouter(prefix="/devices", tags=["Devices"])
 
+DEVICES_JSON = JSONBody(list[DeviceResponse])
+DEVICES_PAGE_JSON = JSONBody(Page[DeviceResponse])
+
 @router.post("/", response_model=DeviceResponse, description="Add a new device")
 def add_device(device_data: DeviceCreate, db: Session = Depends(get_db)):
-    logger.debug(f"Route add_device called with data: {device_data.dict()}")
+    logger.debug("Route add_device called with data: %s", lazy(device_data.dict))
     try:
         logger.debug("Calling create_device_service")
         return create_device_service(db, device_data)
     except Exception as e:
-        logger.error(f"Error adding device: {e}")
+        logger.error("Error adding device: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/", response_model=list[DeviceResponse], description="Get all devices")
-def get_devices(db: Session = Depends(get_db)):
-    logger.debug("Route get_devices called")
+@router.get("/", response_model=Union[Page[DeviceResponse], list[DeviceResponse]], description="Get devices paginated by cursor, or every row with all=true")
+def get_devices(
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fetch_all: bool = Query(False, alias="all"),
+    db: Session = Depends(get_db)
+):
+    logger.debug("Route get_devices called with limit: %s, cursor: %s, all: %s", limit, cursor, fetch_all)
     try:
-        logger.debug("Calling get_all_devices_use_case")
-        return get_all_devices_use_case(db)
+        logger.debug("Calling get_devices_version_use_case")
+        etag = make_etag(request, get_devices_version_use_case(db))
+        cached = not_modified(request, response, etag, REVALIDATE)
+        if cached:
+            return cached
+        if fetch_all:
+            logger.debug("Calling get_all_devices_use_case")
+            return DEVICES_JSON.response(get_all_devices_use_case(db), response)
+        logger.debug("Calling get_devices_page_use_case")
+        items, next_cursor = get_devices_page_use_case(db, limit, cursor)
+        return DEVICES_PAGE_JSON.response({"items": items, "next_cursor": next_cursor}, response)
     except Exception as e:
-        logger.error(f"Error getting devices: {e}")
+        logger.error("Error getting devices: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/{device_id}", response_model=DeviceResponse, description="Get a device by id")
 def get_device(device_id: str, db: Session = Depends(get_db)):
-    logger.debug(f"Route get_device called with id: {device_id}")
+    logger.debug("Route get_device called with id: %s", device_id)
     try:
         logger.debug("Calling get_device_by_id_use_case")
         return get_device_by_id_use_case(db, device_id)
     except Exception as e:
-        logger.error(f"Error getting device by id: {e}")
+        logger.error("Error getting device by id: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.put("/{device_id}", response_model=DeviceResponse, description="Update a device")
 def update_device(device_id: str, device_data: DeviceUpdate, db: Session = Depends(get_db)):
-    logger.debug(f"Route update_device called with id: {device_id}, data: {device_data.dict(exclude_unset=True)}")
+    logger.debug("Route update_device called with id: %s, data: %s", device_id, lazy(device_data.dict, exclude_unset=True))
     try:
         logger.debug("Calling update_device_status_service")
         return update_device_status_service(db, device_id, device_data)
     except Exception as e:
-        logger.error(f"Error updating device: {e}")
+        logger.error("Error updating device: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.delete("/{device_id}", description="Delete a device", status_code=HTTP_204_NO_CONTENT)
 def delete_device(device_id: str, db: Session = Depends(get_db)):
-    logger.debug(f"Route delete_device called with id: {device_id}")
+    logger.debug("Route delete_device called with id: %s", device_id)
     try:
         logger.debug("Calling delete_device_use_case")
         delete_device_use_case(db, device_id)
     except Exception as e:
-        logger.error(f"Error deleting device: {e}")
+        logger.error("Error deleting device: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
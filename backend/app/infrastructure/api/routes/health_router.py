@@ -1,9 +1,23 @@
-from fastapi import APIRouter
-from app.domain.schemas.health import HealthResponse
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from app.domain.schemas.health import HealthResponse, PoolStatusResponse, OutboxStatusResponse
+from app.infrastructure.database.database import engine, async_engine, get_db
+from app.application.use_cases.notification_outbox_use_case import get_outbox_status_use_case
+from app.infrastructure.email.delivery import delivery_backend
+from app.infrastructure.database.pool import pool_status
 
 router = APIRouter()
 
 @router.get("/health", response_model=HealthResponse, description="API health check")
 @router.get("/", response_model=HealthResponse, description="API root health check")
 def health():
-    return HealthResponse(status="ok")
\ No newline at end of file
+    return HealthResponse(status="ok")
+
+@router.get("/health/pool", response_model=PoolStatusResponse, response_model_by_alias=True, description="Connection pool usage and checkout wait times")
+async def health_pool():
+    # On the event loop: the async pool creates its asyncio queue on first use, and a worker thread has no loop.
+    return {"sync": pool_status(engine), "async": pool_status(async_engine.sync_engine)}
+
+@router.get("/health/notifications", response_model=OutboxStatusResponse, description="Notification outbox counts by status and delivery backend stats")
+def health_notifications(db: Session = Depends(get_db)):
+    return {**get_outbox_status_use_case(db), "delivery": delivery_backend.stats()}
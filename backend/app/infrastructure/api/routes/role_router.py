@@ -1,64 +1,93 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from starlette.status import HTTP_204_NO_CONTENT
 from sqlalchemy.orm import Session
 from app.infrastructure.database.database import get_db
+from app.infrastructure.database.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.infrastructure.api.http_cache import make_etag, not_modified, REFERENCE_DATA
+from app.infrastructure.api.json_response import JSONBody
+from app.domain.schemas.pagination import Page
 from app.domain.schemas.role import RoleCreate, RoleUpdate, RoleResponse
 from app.application.use_cases.role_use_case import (
-    create_role_use_case, get_all_roles_use_case,
+    create_role_use_case, get_all_roles_use_case, get_roles_page_use_case,
     get_role_by_id_use_case, update_role_use_case, delete_role_use_case
 )
-from app.config.logger import get_logger
+from app.application.use_cases.collection_version_use_case import get_roles_version_use_case
+from app.config.logger import get_logger, lazy
 
 logger = get_logger("routers.role")
 
 router = APIRouter(prefix="/roles", tags=["Roles"])
 
+ROLES_JSON = JSONBody(list[RoleResponse])
+ROLES_PAGE_JSON = JSONBody(Page[RoleResponse])
+
 @router.post("/", response_model=RoleResponse, description="Add a new role")
 def add_role(role_data: RoleCreate, db: Session = Depends(get_db)):
-    logger.debug(f"Route add_role called with data: {role_data.dict()}")
+    logger.debug("Route add_role called with data: %s", lazy(role_data.dict))
     try:
         logger.debug("Calling create_role_use_case")
         return create_role_use_case(db, role_data)
     except Exception as e:
-        logger.error(f"Error adding role: {e}")
+        logger.error("Error adding role: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/", response_model=list[RoleResponse], description="Get all roles")
-def get_roles(db: Session = Depends(get_db)):
-    logger.debug("Route get_roles called")
+@router.get("/", response_model=Union[Page[RoleResponse], list[RoleResponse]], description="Get roles paginated by cursor, or every row with all=true")
+def get_roles(
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fetch_all: bool = Query(False, alias="all"),
+    db: Session = Depends(get_db)
+):
+    logger.debug("Route get_roles called with limit: %s, cursor: %s, all: %s", limit, cursor, fetch_all)
     try:
-        logger.debug("Calling get_all_roles_use_case")
-        return get_all_roles_use_case(db)
+        logger.debug("Calling get_roles_version_use_case")
+        etag = make_etag(request, get_roles_version_use_case(db))
+        cached = not_modified(request, response, etag, REFERENCE_DATA)
+        if cached:
+            return cached
+        if fetch_all:
+            logger.debug("Calling get_all_roles_use_case")
+            return ROLES_JSON.cached_response(etag, lambda: get_all_roles_use_case(db), request, response)
+        logger.debug("Calling get_roles_page_use_case")
+
+        def load_page():
+            items, next_cursor = get_roles_page_use_case(db, limit, cursor)
+            return {"items": items, "next_cursor": next_cursor}
+
+        return ROLES_PAGE_JSON.cached_response(etag, load_page, request, response)
     except Exception as e:
-        logger.error(f"Error getting roles: {e}")
+        logger.error("Error getting roles: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/{role_id}", response_model=RoleResponse, description="Get a role by id")
 def get_role(role_id: str, db: Session = Depends(get_db)):
-    logger.debug(f"Route get_role called with id: {role_id}")
+    logger.debug("Route get_role called with id: %s", role_id)
     try:
         logger.debug("Calling get_role_by_id_use_case")
         return get_role_by_id_use_case(db, role_id)
     except Exception as e:
-        logger.error(f"Error getting role by id: {e}")
+        logger.error("Error getting role by id: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.put("/{role_id}", response_model=RoleResponse, description="Update a role")
 def update_role(role_id: str, role_data: RoleUpdate, db: Session = Depends(get_db)):
-    logger.debug(f"Route update_role called with id: {role_id}, data: {role_data.dict(exclude_unset=True)}")
+    logger.debug("Route update_role called with id: %s, data: %s", role_id, lazy(role_data.dict, exclude_unset=True))
     try:
         logger.debug("Calling update_role_use_case")
         return update_role_use_case(db, role_id, role_data)
     except Exception as e:
-        logger.error(f"Error updating role: {e}")
+        logger.error("Error updating role: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.delete("/{role_id}", description="Delete a role", status_code=HTTP_204_NO_CONTENT)
 def delete_role(role_id: str, db: Session = Depends(get_db)):
-    logger.debug(f"Route delete_role called with id: {role_id}")
+    logger.debug("Route delete_role called with id: %s", role_id)
     try:
         logger.debug("Calling delete_role_use_case")
         delete_role_use_case(db, role_id)
     except Exception as e:
-        logger.error(f"Error deleting role: {e}")
+        logger.error("Error deleting role: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
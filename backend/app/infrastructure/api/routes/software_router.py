@@ -1,7 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from starlette.status import HTTP_204_NO_CONTENT
 from sqlalchemy.orm import Session
 from app.infrastructure.database.database import get_db
+from app.infrastructure.database.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.infrastructure.api.http_cache import make_etag, not_modified, REVALIDATE
+from app.infrastructure.api.json_response import JSONBody
+from app.domain.schemas.pagination import Page
 from app.domain.schemas.software import SoftwareCreateRequest, SoftwareUpdateRequest, SoftwareResponse
 from app.application.services.software_service import (
     create_software_service,
@@ -9,61 +14,86 @@ from app.application.services.software_service import (
 )
 from app.application.use_cases.software_use_case import (
     get_all_software_use_case,
+    get_software_page_use_case,
     get_software_by_id_use_case,
     delete_software_use_case,
 )
-from app.config.logger import get_logger
+from app.application.use_cases.collection_version_use_case import get_software_version_use_case
+from app.config.logger import get_logger, lazy
 
 logger = get_logger("routers.software")
 
 router = APIRouter(prefix="/software", tags=["Software"])
 
+SOFTWARE_JSON = JSONBody(list[SoftwareResponse])
+SOFTWARE_PAGE_JSON = JSONBody(Page[SoftwareResponse])
+
 @router.post("/", response_model=SoftwareResponse, description="Add a new software")
 def add_software(software_data: SoftwareCreateRequest, db: Session = Depends(get_db)):
-    logger.debug(f"Route add_software called with data: {software_data.dict()}")
+    logger.debug("Route add_software called with data: %s", lazy(software_data.dict))
     try:
         logger.debug("Calling create_software_service")
         return create_software_service(db, software_data)
     except Exception as e:
-        logger.error(f"Error adding software: {e}")
+        logger.error("Error adding software: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/", response_model=list[SoftwareResponse], description="Get all software")
-def get_software(db: Session = Depends(get_db)):
-    logger.debug("Route get_software called")
+@router.get("/", response_model=Union[Page[SoftwareResponse], list[SoftwareResponse]], description="Get software paginated by cursor, or every row with all=true")
+def get_software(
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fetch_all: bool = Query(False, alias="all"),
+    db: Session = Depends(get_db)
+):
+    logger.debug("Route get_software called with limit: %s, cursor: %s, all: %s", limit, cursor, fetch_all)
     try:
-        logger.debug("Calling get_all_software_use_case")
-        return get_all_software_use_case(db)
+        logger.debug("Calling get_software_version_use_case")
+        etag = make_etag(request, get_software_version_use_case(db))
+        cached = not_modified(request, response, etag, REVALIDATE)
+        if cached:
+            return cached
+        if fetch_all:
+            logger.debug("Calling get_all_software_use_case")
+            return SOFTWARE_JSON.cached_response(etag, lambda: get_all_software_use_case(db), request, response)
+        logger.debug("Calling get_software_page_use_case")
+
+        def load_page():
+            items, next_cursor = get_software_page_use_case(db, limit, cursor)
+            return {"items": items, "next_cursor": next_cursor}
+
+        return SOFTWARE_PAGE_JSON.cached_response(etag, load_page, request, response)
     except Exception as e:
-        logger.error(f"Error getting software: {e}")
+        logger.error("Error getting software: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/{software_id}", response_model=SoftwareResponse, description="Get a software by id")
 def get_software_by_id(software_id: str, db: Session = Depends(get_db)):
-    logger.debug(f"Route get_software_by_id called with id: {software_id}")
+    logger.debug("Route get_software_by_id called with id: %s", software_id)
     try:
         logger.debug("Calling get_software_by_id_use_case")
         return get_software_by_id_use_case(db, software_id)
     except Exception as e:
-        logger.error(f"Error getting software by id: {e}")
+        logger.error("Error getting software by id: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.put("/{software_id}", response_model=SoftwareResponse, description="Update a software")
 def update_software(software_id: str, software_data: SoftwareUpdateRequest, db: Session = Depends(get_db)):
-    logger.debug(f"Route update_software called with id: {software_id}, data: {software_data.dict(exclude_unset=True)}")
+    logger.debug("Route update_software called with id: %s, data: %s", software_id, lazy(software_data.dict, exclude_unset=True))
     try:
         logger.debug("Calling update_software_service")
         return update_software_service(db, software_id, software_data)
     except Exception as e:
-        logger.error(f"Error updating software: {e}")
+        logger.error("Error updating software: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.delete("/{software_id}", description="Delete a software", status_code=HTTP_204_NO_CONTENT)
 def delete_software(software_id: str, db: Session = Depends(get_db)):
-    logger.debug(f"Route delete_software called with id: {software_id}")
+    logger.debug("Route delete_software called with id: %s", software_id)
     try:
         logger.debug("Calling delete_software_use_case")
         delete_software_use_case(db, software_id)
     except Exception as e:
-        logger.error(f"Error deleting software: {e}")
+        logger.error("Error deleting software: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
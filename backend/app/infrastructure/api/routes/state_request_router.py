@@ -1,67 +1,97 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from starlette.status import HTTP_204_NO_CONTENT
 from sqlalchemy.orm import Session
 from app.infrastructure.database.database import get_db
+from app.infrastructure.database.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.infrastructure.api.http_cache import make_etag, not_modified, REFERENCE_DATA
+from app.infrastructure.api.json_response import JSONBody
+from app.domain.schemas.pagination import Page
 from app.domain.schemas.state_request import StateRequestCreate, StateRequestUpdate, StateRequestResponse
 from app.application.use_cases.state_request_use_case import (
     create_state_request_use_case,
     get_all_state_requests_use_case,
+    get_state_requests_page_use_case,
     get_state_request_by_id_use_case,
     update_state_request_use_case,
     delete_state_request_use_case
 )
-from app.config.logger import get_logger
+from app.application.use_cases.collection_version_use_case import get_state_requests_version_use_case
+from app.config.logger import get_logger, lazy
 
 logger = get_logger("routers.state_request")
 
 router = APIRouter(prefix="/state-requests", tags=["State Requests"])
 
+STATE_REQUESTS_JSON = JSONBody(list[StateRequestResponse])
+STATE_REQUESTS_PAGE_JSON = JSONBody(Page[StateRequestResponse])
+
 @router.post("/", response_model=StateRequestResponse, description="Add a new state request")
 def add_state_request(state_request_data: StateRequestCreate, db: Session = Depends(get_db)):
-    logger.debug(f"Route add_state_request called with data: {state_request_data.dict()}")
+    logger.debug("Route add_state_request called with data: %s", lazy(state_request_data.dict))
     try:
         logger.debug("Calling create_state_request_use_case")
         return create_state_request_use_case(db, state_request_data)
     except Exception as e:
-        logger.error(f"Error adding state request: {e}")
+        logger.error("Error adding state request: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/", response_model=list[StateRequestResponse], description="Get all state requests")
-def get_state_requests(db: Session = Depends(get_db)):
-    logger.debug("Route get_state_requests called")
+@router.get("/", response_model=Union[Page[StateRequestResponse], list[StateRequestResponse]], description="Get state requests paginated by cursor, or every row with all=true")
+def get_state_requests(
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fetch_all: bool = Query(False, alias="all"),
+    db: Session = Depends(get_db)
+):
+    logger.debug("Route get_state_requests called with limit: %s, cursor: %s, all: %s", limit, cursor, fetch_all)
     try:
-        logger.debug("Calling get_all_state_requests_use_case")
-        return get_all_state_requests_use_case(db)
+        logger.debug("Calling get_state_requests_version_use_case")
+        etag = make_etag(request, get_state_requests_version_use_case(db))
+        cached = not_modified(request, response, etag, REFERENCE_DATA)
+        if cached:
+            return cached
+        if fetch_all:
+            logger.debug("Calling get_all_state_requests_use_case")
+            return STATE_REQUESTS_JSON.cached_response(etag, lambda: get_all_state_requests_use_case(db), request, response)
+        logger.debug("Calling get_state_requests_page_use_case")
+
+        def load_page():
+            items, next_cursor = get_state_requests_page_use_case(db, limit, cursor)
+            return {"items": items, "next_cursor": next_cursor}
+
+        return STATE_REQUESTS_PAGE_JSON.cached_response(etag, load_page, request, response)
     except Exception as e:
-        logger.error(f"Error getting state requests: {e}")
+        logger.error("Error getting state requests: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/{state_request_id}", response_model=StateRequestResponse, description="Get a state request by id")
 def get_state_request(state_request_id: str, db: Session = Depends(get_db)):
-    logger.debug(f"Route get_state_request called with id: {state_request_id}")
+    logger.debug("Route get_state_request called with id: %s", state_request_id)
     try:
         logger.debug("Calling get_state_request_by_id_use_case")
         return get_state_request_by_id_use_case(db, state_request_id)
     except Exception as e:
-        logger.error(f"Error getting state request by id: {e}")
+        logger.error("Error getting state request by id: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.put("/{state_request_id}", response_model=StateRequestResponse, description="Update a state request")
 def update_state_request(state_request_id: str, state_request_data: StateRequestUpdate, db: Session = Depends(get_db)):
-    logger.debug(f"Route update_state_request called with id: {state_request_id}, data: {state_request_data.dict(exclude_unset=True)}")
+    logger.debug("Route update_state_request called with id: %s, data: %s", state_request_id, lazy(state_request_data.dict, exclude_unset=True))
     try:
         logger.debug("Calling update_state_request_use_case")
         return update_state_request_use_case(db, state_request_id, state_request_data)
     except Exception as e:
-        logger.error(f"Error updating state request: {e}")
+        logger.error("Error updating state request: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.delete("/{state_request_id}", description="Delete a state request", status_code=HTTP_204_NO_CONTENT)
 def delete_state_request(state_request_id: str, db: Session = Depends(get_db)):
-    logger.debug(f"Route delete_state_request called with id: {state_request_id}")
+    logger.debug("Route delete_state_request called with id: %s", state_request_id)
     try:
         logger.debug("Calling delete_state_request_use_case")
         delete_state_request_use_case(db, state_request_id)
     except Exception as e:
-        logger.error(f"Error deleting state request: {e}")
+        logger.error("Error deleting state request: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
@@ -1,67 +1,112 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional, Union
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile
 from starlette.status import HTTP_204_NO_CONTENT
 from sqlalchemy.orm import Session
 from app.infrastructure.database.database import get_db
-from app.domain.schemas.user import UserCreate, UserUpdate, UserResponse
+from app.infrastructure.database.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.infrastructure.api.http_cache import make_etag, not_modified, REVALIDATE
+from app.infrastructure.api.json_response import JSONBody
+from app.domain.schemas.pagination import Page
+from app.domain.schemas.user import UserCreate, UserUpdate, UserResponse, UserImportReport
 from app.application.use_cases.user_use_case import (
     create_user_use_case,
     get_all_users_use_case,
+    get_users_page_use_case,
     get_user_by_id_use_case,
     update_user_use_case,
     delete_user_use_case,
 )
-from app.config.logger import get_logger
+from app.application.use_cases.collection_version_use_case import get_users_version_use_case
+from app.application.services.user_import_service import (
+    IMPORT_BATCH_SIZE, detect_import_format, iter_user_rows, import_users_service
+)
+from app.config.logger import get_logger, lazy
 
 logger = get_logger("routers.user")
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
+USERS_JSON = JSONBody(list[UserResponse])
+USERS_PAGE_JSON = JSONBody(Page[UserResponse])
+
 @router.post("/", response_model=UserResponse, description="Add a new user")
 def add_user(user_data: UserCreate, db: Session = Depends(get_db)):
-    logger.debug(f"Route add_user called with data: {user_data.dict()}")
+    logger.debug("Route add_user called with data: %s", lazy(user_data.dict))
     try:
         logger.debug("Calling create_user_use_case")
         return create_user_use_case(db, user_data)
     except Exception as e:
-        logger.error(f"Error adding user: {e}")
+        logger.error("Error adding user: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/import", response_model=UserImportReport, description="Bulk import users from a CSV, JSON or NDJSON file; existing emails are skipped")
+def import_users(
+    file: UploadFile = File(...),
+    file_format: Optional[str] = Query(None, alias="format", pattern="^(csv|json|ndjson)$"),
+    batch_size: int = Query(IMPORT_BATCH_SIZE, ge=1, le=5000),
+    db: Session = Depends(get_db)
+):
+    logger.debug("Route import_users called with file: %s, format: %s, batch_size: %s", file.filename, file_format, batch_size)
+    try:
+        file_format = file_format or detect_import_format(file.filename, file.content_type)
+        logger.debug("Calling import_users_service")
+        return import_users_service(db, iter_user_rows(file.file, file_format), batch_size)
+    except Exception as e:
+        logger.error("Error importing users: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/", response_model=list[UserResponse], description="Get all users")
-def get_users(db: Session = Depends(get_db)):
-    logger.debug("Route get_users called")
+@router.get("/", response_model=Union[Page[UserResponse], list[UserResponse]], description="Get users paginated by cursor, or every row with all=true")
+def get_users(
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fetch_all: bool = Query(False, alias="all"),
+    db: Session = Depends(get_db)
+):
+    logger.debug("Route get_users called with limit: %s, cursor: %s, all: %s", limit, cursor, fetch_all)
     try:
-        logger.debug("Calling get_all_users_use_case")
-        return get_all_users_use_case(db)
+        logger.debug("Calling get_users_version_use_case")
+        etag = make_etag(request, get_users_version_use_case(db))
+        cached = not_modified(request, response, etag, REVALIDATE)
+        if cached:
+            return cached
+        if fetch_all:
+            logger.debug("Calling get_all_users_use_case")
+            return USERS_JSON.response(get_all_users_use_case(db), response)
+        logger.debug("Calling get_users_page_use_case")
+        items, next_cursor = get_users_page_use_case(db, limit, cursor)
+        return USERS_PAGE_JSON.response({"items": items, "next_cursor": next_cursor}, response)
     except Exception as e:
-        logger.error(f"Error getting users: {e}")
+        logger.error("Error getting users: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/{user_id}", response_model=UserResponse, description="Get a user by id")
 def get_user(user_id: str, db: Session = Depends(get_db)):
-    logger.debug(f"Route get_user called with user_id: {user_id}")
+    logger.debug("Route get_user called with user_id: %s", user_id)
     try:
         logger.debug("Calling get_user_by_id_use_case")
         return get_user_by_id_use_case(db, user_id)
     except Exception as e:
-        logger.error(f"Error getting user by id: {e}")
+        logger.error("Error getting user by id: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.put("/{user_id}", response_model=UserResponse, description="Update a user")
 def update_user(user_id: str, user_data: UserUpdate, db: Session = Depends(get_db)):
-    logger.debug(f"Route update_user called with user_id: {user_id}, data: {user_data.dict(exclude_unset=True)}")
+    logger.debug("Route update_user called with user_id: %s, data: %s", user_id, lazy(user_data.dict, exclude_unset=True))
     try:
         logger.debug("Calling update_user_use_case")
         return update_user_use_case(db, user_id, user_data)
     except Exception as e:
-        logger.error(f"Error updating user: {e}")
+        logger.error("Error updating user: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.delete("/{user_id}", description="Delete a user", status_code=HTTP_204_NO_CONTENT)
 def delete_user(user_id: str, db: Session = Depends(get_db)):
-    logger.debug(f"Route delete_user called with user_id: {user_id}")
+    logger.debug("Route delete_user called with user_id: %s", user_id)
     try:
         logger.debug("Calling delete_user_use_case")
         delete_user_use_case(db, user_id)
     except Exception as e:
-        logger.error(f"Error deleting user: {e}")
+        logger.error("Error deleting user: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
@@ -0,0 +1,134 @@
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, Tuple, Type, TypeVar
+from uuid import UUID
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.infrastructure.database.pagination import paginate_items
+from app.infrastructure.database.repositories.role_repository import get_all_roles, get_all_roles_async
+from app.infrastructure.database.repositories.state_request_repository import (
+    get_all_state_requests, get_all_state_requests_async
+)
+from app.infrastructure.database.repositories.software_repository import get_all_software, get_all_software_async
+from app.domain.schemas.role import RoleResponse
+from app.domain.schemas.state_request import StateRequestResponse
+from app.domain.schemas.software import SoftwareResponse
+from app.config.logger import get_logger
+
+logger = get_logger("cache.reference")
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class _Snapshot(Generic[T]):
+    __slots__ = ("version", "items", "by_id")
+
+    def __init__(self, version: int, items: List[T]):
+        self.version = version
+        self.items = sorted(items, key=lambda item: (item.created_at, item.id))
+        self.by_id: Dict[UUID, T] = {item.id: item for item in items}
+
+
+def _as_uuid(item_id: Any) -> Optional[UUID]:
+    if isinstance(item_id, UUID):
+        return item_id
+    try:
+        return UUID(str(item_id))
+    except ValueError:
+        return None
+
+
+class ReferenceCache(Generic[T]):
+    """Whole-table snapshot of a small, rarely written table, kept as detached response schemas.
+
+    Writers call ``invalidate()`` after committing; that bumps ``version`` and the
+    next read reloads the table. A load that races with an invalidation is served
+    to its caller but never stored, so a stale snapshot cannot outlive a write.
+    Writes from other processes are caught by ``sync()``, which the ETag
+    validators call with the table's version as read from the database.
+    """
+
+    def __init__(self, name: str, schema: Type[T],
+                 loader: Callable[[Session], List[Any]],
+                 async_loader: Callable[[AsyncSession], Awaitable[List[Any]]]):
+        self.name = name
+        self._schema = schema
+        self._loader = loader
+        self._async_loader = async_loader
+        self._lock = Lock()
+        self._version = 0
+        self._source_version: Optional[str] = None
+        self._snapshot: Optional[_Snapshot[T]] = None
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def invalidate(self):
+        with self._lock:
+            self._version += 1
+            self._snapshot = None
+        logger.debug(f"Cache {self.name} invalidada - versión {self._version}")
+
+    def sync(self, source_version: str):
+        """Invalidate if the table's database version (row count, ``max(updated_at)``) differs from the last one seen."""
+        if source_version == self._source_version:
+            return
+        with self._lock:
+            if source_version == self._source_version:
+                return
+            changed = self._source_version is not None
+            self._source_version = source_version
+            self._version += 1
+            self._snapshot = None
+        if changed:
+            logger.debug(f"Cache {self.name} desactualizada respecto a la base de datos - versión {self._version}")
+
+    def _store(self, version: int, rows: List[Any]) -> _Snapshot[T]:
+        snapshot = _Snapshot(version, [self._schema.model_validate(row) for row in rows])
+        with self._lock:
+            if self._version == version:
+                self._snapshot = snapshot
+        logger.debug(f"Cache {self.name} cargada - {len(snapshot.items)} elementos, versión {version}")
+        return snapshot
+
+    def _get(self, db: Session) -> _Snapshot[T]:
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+        version = self._version
+        return self._store(version, self._loader(db))
+
+    async def _get_async(self, db: AsyncSession) -> _Snapshot[T]:
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+        version = self._version
+        return self._store(version, await self._async_loader(db))
+
+    def get_all(self, db: Session) -> List[T]:
+        return list(self._get(db).items)
+
+    def get_page(self, db: Session, limit: int, cursor: Optional[str] = None) -> Tuple[List[T], Optional[str]]:
+        return paginate_items(self._get(db).items, limit, cursor)
+
+    def get_by_id(self, db: Session, item_id: Any) -> Optional[T]:
+        return self._get(db).by_id.get(_as_uuid(item_id))
+
+    async def get_all_async(self, db: AsyncSession) -> List[T]:
+        return list((await self._get_async(db)).items)
+
+    async def get_page_async(self, db: AsyncSession, limit: int, cursor: Optional[str] = None) -> Tuple[List[T], Optional[str]]:
+        return paginate_items((await self._get_async(db)).items, limit, cursor)
+
+    async def get_by_id_async(self, db: AsyncSession, item_id: Any) -> Optional[T]:
+        return (await self._get_async(db)).by_id.get(_as_uuid(item_id))
+
+
+role_cache: ReferenceCache[RoleResponse] = ReferenceCache(
+    "roles", RoleResponse, get_all_roles, get_all_roles_async)
+state_request_cache: ReferenceCache[StateRequestResponse] = ReferenceCache(
+    "state_requests", StateRequestResponse, get_all_state_requests, get_all_state_requests_async)
+# Software embeds its roles, so role writes must invalidate it too.
+software_cache: ReferenceCache[SoftwareResponse] = ReferenceCache(
+    "software", SoftwareResponse, get_all_software, get_all_software_async)
@@ -0,0 +1,66 @@
+from threading import Lock
+from typing import Callable, Generic, Optional, TypeVar
+from app.config.logger import get_logger
+
+logger = get_logger("cache.snapshot")
+
+T = TypeVar("T")
+
+
+class SnapshotCache(Generic[T]):
+    """One expensive response kept in memory, already serialized, until a write invalidates it.
+
+    Writers call ``invalidate()`` after committing, as with ``ReferenceCache``. Readers pass the
+    response's ETag as ``key``. It is built from each table's row count and ``max(updated_at)``, read
+    from the database on every request, so it also moves when another worker or replica writes.
+
+    Concurrent misses are coalesced: one caller builds while the rest wait for its result, so a burst
+    of requests after a write costs one build. A build that races with an invalidation is returned to
+    its caller but not stored.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = Lock()
+        self._build_lock = Lock()
+        self._version = 0
+        self._key: Optional[str] = None
+        self._value: Optional[T] = None
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def invalidate(self):
+        with self._lock:
+            self._version += 1
+            self._key = None
+            self._value = None
+        logger.debug(f"Snapshot {self.name} invalidado - versión {self._version}")
+
+    def _current(self, key: str) -> Optional[T]:
+        with self._lock:
+            return self._value if self._key == key else None
+
+    def get_or_build(self, key: str, build: Callable[[], T]) -> T:
+        value = self._current(key)
+        if value is not None:
+            return value
+        with self._build_lock:
+            # Whoever held the lock may have just built it for us.
+            value = self._current(key)
+            if value is not None:
+                return value
+            version = self._version
+            value = build()
+            with self._lock:
+                if self._version == version:
+                    self._key = key
+                    self._value = value
+        logger.debug(f"Snapshot {self.name} reconstruido - versión {version}")
+        return value
+
+
+# Serialized body of the full nested /all-data response. User, device and access writes invalidate it;
+# role, software and state writes change those tables' versions, and so the ETag it is keyed by.
+all_data_snapshot: SnapshotCache = SnapshotCache("all_data")
@@ -0,0 +1,36 @@
+from datetime import datetime
+from typing import Any, Dict, Sequence
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+
+
+def get_table_versions(db: Session, models: Sequence[Any]) -> Dict[str, str]:
+    """Cheap change validator for whole tables: row count plus ``max(updated_at)`` per model, in one statement.
+
+    Inserts and updates move ``max(updated_at)``; deletes move the count. Keyed by table name.
+
+    ``updated_at`` is stamped when the writing statement runs (``write_timestamp``), not when it commits. An
+    update that has already run but commits after a later write was committed and read does not move the
+    max, so that reader gets a 304 until the next write. Stamping with ``clock_timestamp()`` instead of the
+    transaction start shrinks that window to the time between the statement and its commit.
+    """
+    columns = []
+    for model in models:
+        columns.append(select(func.count()).select_from(model).scalar_subquery())
+        columns.append(select(func.max(model.updated_at)).scalar_subquery())
+    row = db.execute(select(*columns)).one()
+    return {
+        model.__tablename__: f"{row[index * 2]}:{row[index * 2 + 1]}"
+        for index, model in enumerate(models)
+    }
+
+
+def any_updated_since(db: Session, models: Sequence[Any], since: datetime) -> bool:
+    """Whether any row of ``models`` was created or updated after ``since``, in one statement."""
+    checks = [select(model.id).where(model.updated_at > since).exists() for model in models]
+    return bool(db.execute(select(or_(*checks))).scalar())
+
+
+def get_database_now(db: Session) -> datetime:
+    """The database clock, which is the one stamping ``updated_at``; used as the delta-sync watermark."""
+    return db.execute(select(func.now())).scalar_one()
@@ -1,3 +1,6 @@
+import time
+from typing import List, Tuple
+from app.config.logger import get_logger
 from .roles import insert_default_roles
 from .state_requests import insert_default_states
 from .software import insert_default_software
@@ -5,10 +8,25 @@ from .users import insert_default_users
 from .devices import insert_default_devices
 from .access import insert_default_access
 
-def load_all_initial_data(db):
-    insert_default_roles(db)
-    insert_default_states(db)
-    insert_default_software(db)
-    insert_default_users(db)
-    insert_default_devices(db)
-    insert_default_access(db)
\ No newline at end of file
+logger = get_logger("database.init_data")
+
+LOADERS = [
+    ("roles", insert_default_roles),
+    ("state_requests", insert_default_states),
+    ("software", insert_default_software),
+    ("users", insert_default_users),
+    ("devices", insert_default_devices),
+    ("access", insert_default_access),
+]
+
+
+def load_all_initial_data(db) -> List[Tuple[str, int, float]]:
+    """Run every loader in dependency order; returns ``(loader, rows inserted, seconds)`` for each."""
+    timings = []
+    for name, loader in LOADERS:
+        start = time.perf_counter()
+        rows = loader(db)
+        elapsed = time.perf_counter() - start
+        logger.info("Seed %s: %d filas en %.1f ms", name, rows, elapsed * 1000)
+        timings.append((name, rows, elapsed))
+    return timings
@@ -1,24 +1,37 @@
+from sqlalchemy import insert
 from app.domain.models.access import Access
 from app.domain.models.user import User
 from app.domain.models.software import Software
 from app.domain.models.state_request import StateRequest
+from .users import DEFAULT_USER_EMAILS
 import random
 
 def insert_default_access(db):
-    users = db.query(User).all()
-    software_list = db.query(Software).all()
-    states = db.query(StateRequest).all()
-    if not users or not software_list or not states:
+    # Only the seed's own users, and only those without accesses, so re-running the seed neither duplicates
+    # them nor invents requests for real users who have not made one yet.
+    user_ids = [
+        user_id for (user_id,) in db.query(User.id)
+        .filter(User.email.in_(DEFAULT_USER_EMAILS), ~User.id.in_(db.query(Access.user_id)))
+        .all()
+    ]
+    software_ids = [software_id for (software_id,) in db.query(Software.id).all()]
+    state_ids = [state_id for (state_id,) in db.query(StateRequest.id).all()]
+    if not user_ids:
+        return 0
+    if not software_ids or not state_ids:
         print("⚠️ No hay datos suficientes para crear accesos.")
-        return
+        return 0
 
-    for user in users:
-        selected_software = random.sample(software_list, min(3, len(software_list)))
-        for software in selected_software:
-            access = Access(
-                user_id=user.id,
-                software_id=software.id,
-                state_request_id=random.choice(states).id
-            )
-            db.add(access)
-    db.commit()
\ No newline at end of file
+    rows = [
+        {
+            "user_id": user_id,
+            "software_id": software_id,
+            "state_request_id": random.choice(state_ids)
+        }
+        for user_id in user_ids
+        for software_id in random.sample(software_ids, min(3, len(software_ids)))
+    ]
+
+    db.execute(insert(Access), rows)
+    db.commit()
+    return len(rows)
@@ -1,39 +1,45 @@
+from sqlalchemy import insert
 from app.domain.models.device import Device
 from app.domain.models.user import User
 from app.domain.models.state_request import StateRequest
+from .users import DEFAULT_USER_EMAILS
 import random
 
 
 def insert_default_devices(db):
-    users = db.query(User).all()
+    # Only the seed's own users, and only those without devices, so re-running the seed neither duplicates
+    # them nor invents requests for real users who have not made one yet.
+    user_ids = [
+        user_id for (user_id,) in db.query(User.id)
+        .filter(User.email.in_(DEFAULT_USER_EMAILS), ~User.id.in_(db.query(Device.user_id)))
+        .all()
+    ]
     states = db.query(StateRequest).all()
 
-    if not users or not states:
+    if not user_ids:
+        return 0
+    if not states:
         print("⚠️ No hay usuarios o estados de solicitud para asociar dispositivos.")
-        return
+        return 0
 
     models = ["Laptop Pro", "MacBook Air", "Dell XPS",
               "Lenovo ThinkPad", "Surface Laptop"]
     operating_systems = ["Windows 11",
                          "macOS Sonoma", "Ubuntu 22.04", "Fedora 39"]
 
-    for user in users:
+    rows = []
+    for user_id in user_ids:
         for _ in range(random.randint(2, 5)):
             selected_state = random.choice(states)
-
-            device = Device(
-                user_id=user.id,
-                state_request_id=selected_state.id
-            )
-
-            if selected_state.label == "Aprobada":
-                device.serial_number = f"SN-{random.randint(10000,99999)}"
-                device.model = random.choice(models)
-                device.system_operating = random.choice(operating_systems)
-            else:
-                device.serial_number = None
-                device.model = None
-                device.system_operating = None
-
-            db.add(device)
+            approved = selected_state.label == "Aprobada"
+            rows.append({
+                "user_id": user_id,
+                "state_request_id": selected_state.id,
+                "serial_number": f"SN-{random.randint(10000,99999)}" if approved else None,
+                "model": random.choice(models) if approved else None,
+                "system_operating": random.choice(operating_systems) if approved else None
+            })
+
+    db.execute(insert(Device), rows)
     db.commit()
+    return len(rows)
@@ -1,3 +1,4 @@
+from sqlalchemy import insert
 from app.domain.models.role import Role
 
 def insert_default_roles(db):
@@ -13,8 +14,9 @@ def insert_default_roles(db):
         {"label": "Calidad (QA)"},
     ]
     
-    existing_roles = {role.label for role in db.query(Role).all()}
-    for role_data in default_roles:
-        if role_data["label"] not in existing_roles:
-            db.add(Role(label=role_data["label"]))
-    db.commit()
\ No newline at end of file
+    existing_roles = {label for (label,) in db.query(Role.label).all()}
+    rows = [role_data for role_data in default_roles if role_data["label"] not in existing_roles]
+    if rows:
+        db.execute(insert(Role), rows)
+    db.commit()
+    return len(rows)
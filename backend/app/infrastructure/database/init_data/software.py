@@ -1,3 +1,4 @@
+import uuid
 from app.domain.models.software import Software
 from app.domain.models.software_roles import software_roles
 from app.domain.models.role import Role
@@ -138,25 +139,33 @@ def insert_default_software(db):
         extended_software.append({**item, "name": f"{item['name']} QA", "url": f"{item['url']}/qa"})
     
     role_mapping = {role.label: role.id for role in db.query(Role).all()}
+    existing_names = {name for (name,) in db.query(Software.name).all()}
 
+    software_rows = []
+    link_rows = []
     for software_data in extended_software:
-        software = Software(
-            name=software_data["name"],
-            description=software_data["description"],
-            url=software_data["url"],
-            is_active=software_data["is_active"]
-        )
-        db.add(software)
-        db.flush()
-
+        if software_data["name"] in existing_names:
+            continue
+        # Ids generated here so the role links can be inserted without reading the rows back.
+        software_id = uuid.uuid4()
+        software_rows.append({
+            "id": software_id,
+            "name": software_data["name"],
+            "description": software_data["description"],
+            "url": software_data["url"],
+            "is_active": software_data["is_active"]
+        })
         for role_label in software_data["roles_required"]:
             role_id = role_mapping.get(role_label)
             if not role_id:
                 raise Exception(
                     f"El rol '{role_label}' no existe en la base de datos.")
-            stmt = insert(software_roles).values(
-                software_id=software.id,
-                role_id=role_id
-            )
-            db.execute(stmt)
+            link_rows.append({"software_id": software_id, "role_id": role_id})
+
+    if software_rows:
+        db.execute(insert(Software), software_rows)
+        db.execute(insert(software_roles), link_rows)
     db.commit()
+    # Only software rows are counted, so the seed summary compares with the other tables; links are reported here.
+    print(f"🔗 {len(link_rows)} relaciones software-rol creadas.")
+    return len(software_rows)
@@ -1,3 +1,4 @@
+from sqlalchemy import insert
 from app.domain.models.state_request import StateRequest
 
 def insert_default_states(db):
@@ -7,8 +8,9 @@ def insert_default_states(db):
         {"label": "Rechazada"},
     ]
 
-    existing_states = {state.label for state in db.query(StateRequest).all()}
-    for state_data in default_states:
-        if state_data["label"] not in existing_states:
-            db.add(StateRequest(label=state_data["label"]))
-    db.commit()
\ No newline at end of file
+    existing_states = {label for (label,) in db.query(StateRequest.label).all()}
+    rows = [state_data for state_data in default_states if state_data["label"] not in existing_states]
+    if rows:
+        db.execute(insert(StateRequest), rows)
+    db.commit()
+    return len(rows)
@@ -0,0 +1,256 @@
+"""Deterministic, production-sized datasets for load tests and query-plan checks.
+
+Everything is drawn from one ``random.Random(seed)``, ids included, so the same arguments always produce the same rows.
+Rows are generated and inserted ``batch_size`` at a time, so memory stays flat at 10^6 rows.
+"""
+import itertools
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from sqlalchemy import insert
+from app.config.logger import get_logger
+from app.domain.models.access import Access
+from app.domain.models.device import Device
+from app.domain.models.role import Role
+from app.domain.models.software import Software
+from app.domain.models.software_roles import software_roles
+from app.domain.models.state_request import StateRequest
+from app.domain.models.user import User
+from .state_requests import insert_default_states
+
+logger = get_logger("database.init_data.synthetic")
+
+SYNTHETIC_EMAIL_DOMAIN = "synthetic.example.com"
+
+# Share of the headcount and the teams inside each area, roughly what a mid-size tech company looks like.
+AREAS: Dict[str, Tuple[float, List[str]]] = {
+    "Desarrollo": (0.34, ["Backend", "Frontend", "Movil", "Data", "Plataforma", "Integraciones"]),
+    "Calidad": (0.08, ["Testing", "Automatización", "Auditoría"]),
+    "Infraestructura": (0.07, ["DevOps", "SRE", "Redes"]),
+    "Producto": (0.07, ["Negocio", "Investigación", "UX"]),
+    "Diseño": (0.05, ["UX/UI", "Contenido"]),
+    "Soporte": (0.09, ["Helpdesk", "Mesa de ayuda"]),
+    "Ventas": (0.08, ["Comercial", "Internacional", "Preventa"]),
+    "Marketing": (0.06, ["Digital", "SEO", "Publicidad"]),
+    "Operaciones": (0.05, ["Producción", "Distribución"]),
+    "Finanzas": (0.04, ["Contabilidad", "Tesorería", "Auditoría"]),
+    "Recursos Humanos": (0.03, ["Talento", "Gestión"]),
+    "Legal": (0.02, ["Jurídico", "Cumplimiento", "Contratos"]),
+    "Seguridad": (0.02, ["SOC", "Identidades"]),
+}
+
+BASE_ROLES = [
+    "Desarrollador", "Administrador", "Líder Técnico", "DevOps", "Arquitecto de Software",
+    "Product Owner", "Scrum Master", "Diseñador UX/UI", "Calidad (QA)",
+]
+
+SOFTWARE_CATEGORIES = [
+    "Repositorio", "Nube", "CI/CD", "Monitoreo", "Mensajería", "Documentación", "Diseño",
+    "Pruebas", "Incidentes", "CRM", "ERP", "Analítica", "Seguridad", "Gestión de proyectos",
+]
+
+FIRST_NAMES = [
+    "María", "Carlos", "Laura", "David", "Sofía", "Luis", "Ana", "Felipe", "Gabriela", "Andrés",
+    "Valentina", "Julián", "Camila", "Tomás", "Natalia", "Sebastián", "Diego", "Isabella", "Mateo", "Paula",
+    "Martín", "Lorena", "Alejandro", "Diana", "Pablo", "Sandra", "Ricardo", "Fernanda", "Oscar", "Marisol",
+]
+LAST_NAMES = [
+    "Fernández", "Gómez", "Rodríguez", "Martínez", "Torres", "Ramírez", "Morales", "Castro", "Mendoza", "Herrera",
+    "Rojas", "Navarro", "Vega", "Duarte", "López", "Ruiz", "Medina", "Sánchez", "Gil", "Salazar",
+    "Pérez", "Vargas", "Romero", "Jiménez", "Ortiz", "Gutiérrez", "Díaz", "Guzmán", "Pineda", "Molina",
+]
+
+DEVICE_MODELS = ["Laptop Pro", "MacBook Air", "MacBook Pro", "Dell XPS", "Lenovo ThinkPad", "Surface Laptop", "HP EliteBook"]
+OPERATING_SYSTEMS = ["Windows 11", "macOS Sonoma", "Ubuntu 22.04", "Fedora 39"]
+
+# Most requests in a live system have already been resolved; every state is still represented.
+STATE_WEIGHTS = {"Aprobada": 0.7, "Pendiente": 0.2, "Rechazada": 0.1}
+
+HISTORY_DAYS = 730
+
+
+class SyntheticDataset:
+    """Row generators for one seeded dataset; ``load`` bulk-inserts them table by table."""
+
+    def __init__(self, users: int, software: int, roles: int, seed: int = 42,
+                 devices_per_user: Tuple[int, int] = (1, 4), accesses_per_user: Tuple[int, int] = (2, 8),
+                 now: Optional[datetime] = None):
+        self.users = users
+        self.software = software
+        self.roles = roles
+        self.seed = seed
+        self.devices_per_user = devices_per_user
+        self.accesses_per_user = accesses_per_user
+        self.now = now or datetime(2025, 1, 1)
+        self.rng = random.Random(seed)
+        self.role_ids: List[uuid.UUID] = []
+        self.software_ids: List[uuid.UUID] = []
+        self.user_ids: List[uuid.UUID] = []
+
+    def _uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def _timestamps(self) -> Dict[str, datetime]:
+        created_at = self.now - timedelta(seconds=self.rng.random() * HISTORY_DAYS * 86400)
+        # A third of the rows were edited after creation.
+        if self.rng.random() < 0.33:
+            updated_at = created_at + timedelta(seconds=self.rng.random() * (self.now - created_at).total_seconds())
+        else:
+            updated_at = created_at
+        return {"created_at": created_at, "updated_at": updated_at}
+
+    def _states(self, states: Dict[str, uuid.UUID]) -> Iterator[uuid.UUID]:
+        """Weighted state ids that start with one of each, so even tiny datasets cover every state."""
+        labels = sorted(states)
+        cum_weights = list(itertools.accumulate(STATE_WEIGHTS.get(label, 0.05) for label in labels))
+        for label in labels:
+            yield states[label]
+        while True:
+            yield states[self.rng.choices(labels, cum_weights=cum_weights)[0]]
+
+    def role_rows(self, existing: Dict[str, uuid.UUID]) -> Iterator[Dict]:
+        """Roles that already exist (e.g. from the default seed) are reused by label instead of duplicated."""
+        for index in range(self.roles):
+            label = BASE_ROLES[index] if index < len(BASE_ROLES) else f"{BASE_ROLES[index % len(BASE_ROLES)]} {index // len(BASE_ROLES) + 1}"
+            role_id = self._uuid()
+            timestamps = self._timestamps()
+            if label in existing:
+                self.role_ids.append(existing[label])
+                continue
+            self.role_ids.append(role_id)
+            yield {"id": role_id, "label": label, **timestamps}
+
+    def software_rows(self) -> Iterator[Dict]:
+        for index in range(self.software):
+            software_id = self._uuid()
+            self.software_ids.append(software_id)
+            category = SOFTWARE_CATEGORIES[index % len(SOFTWARE_CATEGORIES)]
+            yield {
+                "id": software_id,
+                "name": f"{category} {index + 1:05d}",
+                "description": f"Herramienta de {category.lower()} generada para pruebas de carga.",
+                "url": f"https://{category.lower().replace(' ', '-').replace('/', '-')}-{index + 1}.{SYNTHETIC_EMAIL_DOMAIN}/",
+                "is_active": self.rng.random() < 0.95,
+                **self._timestamps(),
+            }
+
+    def software_role_rows(self) -> Iterator[Dict]:
+        for software_id in self.software_ids:
+            for role_id in self.rng.sample(self.role_ids, min(self.rng.randint(1, 4), len(self.role_ids))):
+                yield {"software_id": software_id, "role_id": role_id}
+
+    def user_rows(self) -> Iterator[Dict]:
+        areas = list(AREAS)
+        cum_weights = list(itertools.accumulate(AREAS[area][0] for area in areas))
+        for index in range(self.users):
+            area = self.rng.choices(areas, cum_weights=cum_weights)[0]
+            teams = AREAS[area][1]
+            # The first team of each area is the largest.
+            team = self.rng.choices(teams, [len(teams) - position for position in range(len(teams))])[0]
+            first_name, last_name = self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+            user_id = self._uuid()
+            self.user_ids.append(user_id)
+            timestamps = self._timestamps()
+            yield {
+                "id": user_id,
+                "name": f"{first_name} {last_name}",
+                "email": f"user{index + 1:07d}@{SYNTHETIC_EMAIL_DOMAIN}",
+                "area": area,
+                "team": team,
+                # Role popularity is skewed towards the first (base) roles.
+                "role_id": self.role_ids[min(int(self.rng.paretovariate(1.2)) - 1, len(self.role_ids) - 1)],
+                "last_login": timestamps["updated_at"] if self.rng.random() < 0.8 else None,
+                "is_active": self.rng.random() < 0.92,
+                **timestamps,
+            }
+
+    def device_rows(self, states: Dict[str, uuid.UUID]) -> Iterator[Dict]:
+        approved_id = states.get("Aprobada")
+        state_ids = self._states(states)
+        low, high = self.devices_per_user
+        for user_id in self.user_ids:
+            for _ in range(self.rng.randint(low, high)):
+                state_id = next(state_ids)
+                approved = state_id == approved_id
+                yield {
+                    "id": self._uuid(),
+                    "user_id": user_id,
+                    "state_request_id": state_id,
+                    "serial_number": f"SN-{self.rng.getrandbits(40):012X}" if approved else None,
+                    "model": self.rng.choice(DEVICE_MODELS) if approved else None,
+                    "system_operating": self.rng.choice(OPERATING_SYSTEMS) if approved else None,
+                    **self._timestamps(),
+                }
+
+    def access_rows(self, states: Dict[str, uuid.UUID]) -> Iterator[Dict]:
+        state_ids = self._states(states)
+        low, high = self.accesses_per_user
+        # Zipf-like popularity: a handful of tools (repo, chat, tickets) are requested by almost everyone.
+        cum_popularity = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(self.software_ids))))
+        for user_id in self.user_ids:
+            wanted = min(self.rng.randint(low, high), len(self.software_ids))
+            chosen = set()
+            while len(chosen) < wanted:
+                chosen.update(self.rng.choices(self.software_ids, cum_weights=cum_popularity, k=wanted - len(chosen)))
+            for software_id in chosen:
+                yield {
+                    "id": self._uuid(),
+                    "user_id": user_id,
+                    "software_id": software_id,
+                    "state_request_id": next(state_ids),
+                    **self._timestamps(),
+                }
+
+    def load(self, db, batch_size: int = 5000) -> List[Tuple[str, int, float]]:
+        """Insert every table in dependency order in a single transaction; returns ``(table, rows, seconds)``.
+
+        Rows go in ``batch_size`` statements but are committed only at the end, so a failed run leaves
+        no partial dataset behind and can simply be repeated.
+        """
+        if db.query(User.id).filter(User.email.like(f"%@{SYNTHETIC_EMAIL_DOMAIN}")).first():
+            raise Exception("La base de datos ya contiene un dataset sintético; use una base de datos vacía.")
+        insert_default_states(db)
+        existing_roles = {label: role_id for role_id, label in db.query(Role.id, Role.label).all()}
+        states = {label: state_id for state_id, label in db.query(StateRequest.id, StateRequest.label).all()}
+        if not states:
+            raise Exception("No hay estados de solicitud en la base de datos.")
+
+        steps = [
+            ("roles", Role.__table__, lambda: self.role_rows(existing_roles)),
+            ("software", Software.__table__, self.software_rows),
+            ("software_roles", software_roles, self.software_role_rows),
+            ("users", User.__table__, self.user_rows),
+            ("devices", Device.__table__, lambda: self.device_rows(states)),
+            ("access", Access.__table__, lambda: self.access_rows(states)),
+        ]
+        timings = []
+        for name, table, rows in steps:
+            start = time.perf_counter()
+            count = _insert_batches(db, table, rows(), batch_size)
+            elapsed = time.perf_counter() - start
+            logger.info("Dataset sintético %s: %d filas en %.1f s (%.0f filas/s)",
+                        name, count, elapsed, count / elapsed if elapsed else 0)
+            timings.append((name, count, elapsed))
+        db.commit()
+        return timings
+
+
+def _insert_batches(db, table, rows: Iterator[Dict], batch_size: int) -> int:
+    # Core executemany on the Table, not the ORM bulk path: at 10^6 rows the per-row ORM bookkeeping dominates.
+    count = 0
+    batch: List[Dict] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            count += _flush(db, table, batch)
+            batch = []
+    if batch:
+        count += _flush(db, table, batch)
+    return count
+
+
+def _flush(db, table, batch: Sequence[Dict]) -> int:
+    db.execute(insert(table), batch)
+    return len(batch)
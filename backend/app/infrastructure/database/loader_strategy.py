@@ -0,0 +1,50 @@
+from functools import lru_cache
+from typing import Any, Optional, Tuple, Type, get_args, get_origin
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from app.config.env import SQL_STRICT_LOADING
+
+
+def _nested_schema(annotation: Any) -> Optional[Type[BaseModel]]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    if get_origin(annotation) is None:
+        return None
+    for arg in get_args(annotation):
+        nested = _nested_schema(arg)
+        if nested:
+            return nested
+    return None
+
+
+def _build_options(model: Any, schema: Type[BaseModel], strict: bool) -> Tuple[Any, ...]:
+    relationships = inspect(model).relationships
+    options = []
+    for field_name, field in schema.model_fields.items():
+        if field_name not in relationships:
+            continue
+        relationship = relationships[field_name]
+        # Collections go through a second IN query; scalars ride along in the main JOIN.
+        loader = selectinload if relationship.uselist else joinedload
+        option = loader(getattr(model, field_name))
+        nested_schema = _nested_schema(field.annotation)
+        if nested_schema:
+            nested_options = _build_options(relationship.mapper.class_, nested_schema, strict)
+            if nested_options:
+                option = option.options(*nested_options)
+        options.append(option)
+    if strict:
+        options.append(raiseload("*"))
+    return tuple(options)
+
+
+@lru_cache(maxsize=None)
+def schema_loader_options(model: Any, schema: Type[BaseModel], strict: Optional[bool] = None) -> Tuple[Any, ...]:
+    """Eager-load exactly the relationships ``schema`` serializes from ``model``.
+
+    In strict mode every other relationship is ``raiseload``-ed, so a response
+    schema that grows a field without a matching loader fails loudly instead of
+    issuing one lazy query per row.
+    """
+    return _build_options(model, schema, SQL_STRICT_LOADING if strict is None else strict)
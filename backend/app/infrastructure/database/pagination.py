@@ -0,0 +1,66 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple, List, Any
+from uuid import UUID
+from sqlalchemy import Select, literal, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    payload = json.dumps([created_at.isoformat(), str(row_id)]).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except Exception:
+        raise ValueError("Cursor de paginación inválido")
+
+
+def _keyset_window(query: Any, model: Any, limit: int, cursor: Optional[str]) -> Any:
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.filter(
+            tuple_(model.created_at, model.id) > tuple_(
+                literal(created_at, type_=model.created_at.type),
+                literal(row_id, type_=model.id.type),
+            )
+        )
+    return query.order_by(model.created_at, model.id).limit(limit + 1)
+
+
+def _page_result(rows: List[Any], limit: int) -> Tuple[List[Any], Optional[str]]:
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+    return rows, next_cursor
+
+
+def paginate(query: Query, model: Any, limit: int, cursor: Optional[str] = None) -> Tuple[List[Any], Optional[str]]:
+    """Keyset pagination over (created_at, id), backed by the ix_<table>_created_at_id index."""
+    rows = _keyset_window(query, model, limit, cursor).all()
+    return _page_result(rows, limit)
+
+
+async def paginate_async(db: AsyncSession, stmt: Select, model: Any, limit: int, cursor: Optional[str] = None) -> Tuple[List[Any], Optional[str]]:
+    result = await db.execute(_keyset_window(stmt, model, limit, cursor))
+    return _page_result(list(result.scalars().all()), limit)
+
+
+def paginate_items(items: List[Any], limit: int, cursor: Optional[str] = None) -> Tuple[List[Any], Optional[str]]:
+    """Same keyset contract as ``paginate``, applied to an in-memory list (e.g. the reference-data cache)."""
+    rows = sorted(items, key=lambda item: (item.created_at, item.id))
+    if cursor:
+        after = decode_cursor(cursor)
+        rows = [item for item in rows if (item.created_at, item.id) > after]
+    return _page_result(rows[:limit + 1], limit)
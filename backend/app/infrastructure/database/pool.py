@@ -0,0 +1,88 @@
+import time
+from threading import Lock
+from typing import Any, Dict
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from app.config.logger import get_logger
+
+logger = get_logger("database.pool")
+
+
+class _WaitStatsMixin:
+    """Times every checkout so the time threads spend blocked on an exhausted pool is visible."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._stats_lock:
+                self.checkouts += 1
+                self.wait_time_total += waited
+                self.wait_time_max = max(self.wait_time_max, waited)
+
+
+class InstrumentedQueuePool(_WaitStatsMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_WaitStatsMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_status(engine: Engine) -> Dict[str, Any]:
+    pool = engine.pool
+    status = {
+        "pool_class": type(pool).__name__,
+        "size": pool.size() if hasattr(pool, "size") else 0,
+        "checked_out": pool.checkedout() if hasattr(pool, "checkedout") else 0,
+        "checked_in": pool.checkedin() if hasattr(pool, "checkedin") else 0,
+        "overflow": max(pool.overflow(), 0) if hasattr(pool, "overflow") else 0,
+        "checkouts": getattr(pool, "checkouts", 0),
+        "timeouts": getattr(pool, "timeouts", 0),
+        "wait_time_total_ms": round(getattr(pool, "wait_time_total", 0.0) * 1000, 3),
+        "wait_time_max_ms": round(getattr(pool, "wait_time_max", 0.0) * 1000, 3),
+    }
+    return status
+
+
+def prewarm_pool(engine: Engine, connections: int):
+    """Open ``connections`` connections up front so the first requests do not pay for the handshake."""
+    opened = []
+    try:
+        for _ in range(connections):
+            opened.append(engine.connect())
+    except Exception as e:
+        logger.warning(f"Pre-calentamiento del pool incompleto ({len(opened)}/{connections}): {e}")
+    finally:
+        for connection in opened:
+            connection.close()
+    logger.info(f"Pool pre-calentado con {len(opened)} conexiones")
+
+
+async def prewarm_async_pool(engine: AsyncEngine, connections: int):
+    opened = []
+    try:
+        for _ in range(connections):
+            opened.append(await engine.connect())
+    except Exception as e:
+        logger.warning(f"Pre-calentamiento del pool async incompleto ({len(opened)}/{connections}): {e}")
+    finally:
+        for connection in opened:
+            await connection.close()
+    logger.info(f"Pool async pre-calentado con {len(opened)} conexiones")
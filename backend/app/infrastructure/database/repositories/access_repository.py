@@ -1,21 +1,73 @@
-from sqlalchemy.orm import Session, joinedload
+from datetime import datetime
+import uuid
+from typing import Dict, List, Optional, Sequence
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.infrastructure.database.pagination import paginate, paginate_async
+from app.infrastructure.database.loader_strategy import schema_loader_options
+from app.infrastructure.database.repositories.tombstone_repository import record_tombstone
+from app.infrastructure.cache.snapshot_cache import all_data_snapshot
 from app.domain.models.access import Access
-from app.domain.schemas.access import AccessUpdate
+from app.domain.schemas.access import AccessUpdate, AccessResponse
 
 def create_access(db: Session, access: Access):
     db.add(access)
     db.commit()
+    all_data_snapshot.invalidate()
     db.refresh(access)
     return access
 
+def create_accesses(db: Session, rows: List[Dict]):
+    # Ids are generated here so the rows can be read back without RETURNING; one multi-row INSERT, one commit.
+    rows = [{"id": uuid.uuid4(), **row} for row in rows]
+    db.execute(insert(Access), rows)
+    db.commit()
+    all_data_snapshot.invalidate()
+    stmt = (
+        select(Access)
+        .options(*schema_loader_options(Access, AccessResponse))
+        .where(Access.id.in_([row["id"] for row in rows]))
+    )
+    return db.execute(stmt).scalars().all()
+
+def get_software_ids_with_access(db: Session, user_id: uuid.UUID, software_ids: Sequence[uuid.UUID]):
+    stmt = select(Access.software_id).where(Access.user_id == user_id, Access.software_id.in_(software_ids))
+    return set(db.execute(stmt).scalars().all())
+
 def get_all_accesses(db: Session):
-    return db.query(Access).options(
-        joinedload(Access.software),
-        joinedload(Access.state_request),
-    ).all()
+    return db.query(Access).options(*schema_loader_options(Access, AccessResponse)).all()
+
+def get_accesses_page(db: Session, limit: int, cursor: Optional[str] = None):
+    query = db.query(Access).options(*schema_loader_options(Access, AccessResponse))
+    return paginate(query, Access, limit, cursor)
+
+def iter_all_accesses(db: Session, batch_size: int):
+    stmt = select(Access).options(*schema_loader_options(Access, AccessResponse)).execution_options(yield_per=batch_size)
+    return db.execute(stmt).scalars()
+
+def get_accesses_rows(db: Session, since: Optional[datetime] = None):
+    """Column tuples only, no entities or relationships, for responses that reference related rows by id."""
+    stmt = select(*Access.__table__.columns)
+    if since is not None:
+        stmt = stmt.where(Access.updated_at > since)
+    return db.execute(stmt).all()
+
+def get_accesses_changed_since(db: Session, since: datetime):
+    stmt = select(Access).options(*schema_loader_options(Access, AccessResponse)).where(Access.updated_at > since)
+    return db.execute(stmt).scalars().all()
+
+def get_accesses_by_ids(db: Session, access_ids: Sequence[str]):
+    stmt = select(Access).options(*schema_loader_options(Access, AccessResponse)).where(Access.id.in_(access_ids))
+    return db.execute(stmt).scalars().all()
 
 def get_access_by_id(db: Session, access_id: str):
-    return db.query(Access).filter(Access.id == access_id).first()
+    return (
+        db.query(Access)
+        .options(*schema_loader_options(Access, AccessResponse))
+        .filter(Access.id == access_id)
+        .first()
+    )
 
 def update_access(db: Session, access_id: str, access_data: AccessUpdate):
     access = get_access_by_id(db, access_id)
@@ -24,6 +76,7 @@ def update_access(db: Session, access_id: str, access_data: AccessUpdate):
     for field, value in access_data.dict(exclude_unset=True).items():
         setattr(access, field, value)
     db.commit()
+    all_data_snapshot.invalidate()
     db.refresh(access)
     return access
 
@@ -31,6 +84,21 @@ def delete_access(db: Session, access_id: str):
     access = get_access_by_id(db, access_id)
     if not access:
         return False
+    record_tombstone(db, Access.__tablename__, access.id)
     db.delete(access)
     db.commit()
-    return True
\ No newline at end of file
+    all_data_snapshot.invalidate()
+    return True
+
+async def get_all_accesses_async(db: AsyncSession):
+    result = await db.execute(select(Access).options(*schema_loader_options(Access, AccessResponse)))
+    return result.scalars().all()
+
+async def get_accesses_page_async(db: AsyncSession, limit: int, cursor: Optional[str] = None):
+    stmt = select(Access).options(*schema_loader_options(Access, AccessResponse))
+    return await paginate_async(db, stmt, Access, limit, cursor)
+
+async def get_access_by_id_async(db: AsyncSession, access_id: str):
+    stmt = select(Access).options(*schema_loader_options(Access, AccessResponse)).where(Access.id == access_id)
+    result = await db.execute(stmt)
+    return result.scalars().first()
\ No newline at end of file
@@ -1,20 +1,55 @@
-from sqlalchemy.orm import Session, joinedload
+from datetime import datetime
+from typing import Optional, Sequence
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.infrastructure.database.pagination import paginate, paginate_async
+from app.infrastructure.database.loader_strategy import schema_loader_options
+from app.infrastructure.database.repositories.tombstone_repository import record_tombstone
+from app.infrastructure.cache.snapshot_cache import all_data_snapshot
 from app.domain.models.device import Device
-from app.domain.schemas.device import DeviceUpdate
+from app.domain.schemas.device import DeviceUpdate, DeviceResponse
 
 def create_device(db: Session, device: Device):
     db.add(device)
     db.commit()
+    all_data_snapshot.invalidate()
     db.refresh(device)
     return device
 
 def get_all_devices(db: Session):
-    return db.query(Device).options(
-        joinedload(Device.state_request),
-    ).all()
+    return db.query(Device).options(*schema_loader_options(Device, DeviceResponse)).all()
+
+def get_devices_page(db: Session, limit: int, cursor: Optional[str] = None):
+    query = db.query(Device).options(*schema_loader_options(Device, DeviceResponse))
+    return paginate(query, Device, limit, cursor)
+
+def iter_all_devices(db: Session, batch_size: int):
+    stmt = select(Device).options(*schema_loader_options(Device, DeviceResponse)).execution_options(yield_per=batch_size)
+    return db.execute(stmt).scalars()
+
+def get_devices_rows(db: Session, since: Optional[datetime] = None):
+    """Column tuples only, no entities or relationships, for responses that reference related rows by id."""
+    stmt = select(*Device.__table__.columns)
+    if since is not None:
+        stmt = stmt.where(Device.updated_at > since)
+    return db.execute(stmt).all()
+
+def get_devices_changed_since(db: Session, since: datetime):
+    stmt = select(Device).options(*schema_loader_options(Device, DeviceResponse)).where(Device.updated_at > since)
+    return db.execute(stmt).scalars().all()
+
+def get_devices_by_ids(db: Session, device_ids: Sequence[str]):
+    stmt = select(Device).options(*schema_loader_options(Device, DeviceResponse)).where(Device.id.in_(device_ids))
+    return db.execute(stmt).scalars().all()
 
 def get_device_by_id(db: Session, device_id: str):
-    return db.query(Device).filter(Device.id == device_id).first()
+    return (
+        db.query(Device)
+        .options(*schema_loader_options(Device, DeviceResponse))
+        .filter(Device.id == device_id)
+        .first()
+    )
 
 def update_device(db: Session, device_id: str, device_data: DeviceUpdate):
     device = get_device_by_id(db, device_id)
@@ -23,6 +58,7 @@ def update_device(db: Session, device_id: str, device_data: DeviceUpdate):
     for field, value in device_data.dict(exclude_unset=True).items():
         setattr(device, field, value)
     db.commit()
+    all_data_snapshot.invalidate()
     db.refresh(device)
     return device
 
@@ -30,6 +66,21 @@ def delete_device(db: Session, device_id: str):
     device = get_device_by_id(db, device_id)
     if not device:
         return False
+    record_tombstone(db, Device.__tablename__, device.id)
     db.delete(device)
     db.commit()
-    return True
\ No newline at end of file
+    all_data_snapshot.invalidate()
+    return True
+
+async def get_all_devices_async(db: AsyncSession):
+    result = await db.execute(select(Device).options(*schema_loader_options(Device, DeviceResponse)))
+    return result.scalars().all()
+
+async def get_devices_page_async(db: AsyncSession, limit: int, cursor: Optional[str] = None):
+    stmt = select(Device).options(*schema_loader_options(Device, DeviceResponse))
+    return await paginate_async(db, stmt, Device, limit, cursor)
+
+async def get_device_by_id_async(db: AsyncSession, device_id: str):
+    stmt = select(Device).options(*schema_loader_options(Device, DeviceResponse)).where(Device.id == device_id)
+    result = await db.execute(stmt)
+    return result.scalars().first()
\ No newline at end of file
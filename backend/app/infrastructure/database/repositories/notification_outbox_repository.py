@@ -0,0 +1,77 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+from app.domain.models.notification_outbox import NotificationOutbox, OUTBOX_PENDING, OUTBOX_SENT, OUTBOX_FAILED
+
+def add_outbox_event(db: Session, event_type: str, payload: Dict[str, Any], digest_key: Optional[str] = None,
+                     request_count: int = 1):
+    # Added to the caller's transaction, so it commits together with the change it announces.
+    db.add(NotificationOutbox(event_type=event_type, payload=payload, digest_key=digest_key, request_count=request_count))
+
+def _pending_due(now: datetime):
+    return NotificationOutbox.status == OUTBOX_PENDING, NotificationOutbox.next_attempt_at <= now
+
+def claim_pending_events(db: Session, now: datetime, limit: int, exclude_digest: bool = False) -> List[NotificationOutbox]:
+    # SKIP LOCKED lets several dispatchers (one per worker) drain the outbox without sending twice.
+    stmt = select(NotificationOutbox).where(*_pending_due(now))
+    if exclude_digest:
+        stmt = stmt.where(NotificationOutbox.digest_key.is_(None))
+    stmt = (
+        stmt
+        .order_by(NotificationOutbox.created_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    return db.execute(stmt).scalars().all()
+
+def claim_ready_digest_events(db: Session, now: datetime, window_start: datetime, max_size: int, limit: int) -> List[NotificationOutbox]:
+    """Claim every due event of the digest keys whose oldest event predates ``window_start`` or that hold ``max_size`` requests."""
+    ready_keys = (
+        select(NotificationOutbox.digest_key)
+        .where(*_pending_due(now), NotificationOutbox.digest_key.is_not(None))
+        .group_by(NotificationOutbox.digest_key)
+        .having(or_(func.min(NotificationOutbox.created_at) <= window_start, func.sum(NotificationOutbox.request_count) >= max_size))
+    )
+    stmt = (
+        select(NotificationOutbox)
+        .where(*_pending_due(now), NotificationOutbox.digest_key.in_(ready_keys))
+        .order_by(NotificationOutbox.created_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    return db.execute(stmt).scalars().all()
+
+def get_events_by_ids(db: Session, event_ids: List[UUID]) -> List[NotificationOutbox]:
+    stmt = select(NotificationOutbox).where(NotificationOutbox.id.in_(event_ids))
+    return db.execute(stmt).scalars().all()
+
+def lease_events(events: List[NotificationOutbox], until: datetime):
+    # Still pending, but not due again until the lease runs out: other dispatchers skip them without a lock.
+    for event in events:
+        event.next_attempt_at = until
+
+def mark_event_sent(event: NotificationOutbox, now: datetime):
+    event.attempts += 1
+    event.status = OUTBOX_SENT
+    event.sent_at = now
+    event.last_error = None
+
+def mark_event_retry(event: NotificationOutbox, error: str, next_attempt_at: Optional[datetime]):
+    """Schedule another attempt at ``next_attempt_at``, or give up when it is None."""
+    event.attempts += 1
+    event.last_error = error
+    if next_attempt_at is None:
+        event.status = OUTBOX_FAILED
+    else:
+        event.next_attempt_at = next_attempt_at
+
+def commit_outbox_batch(db: Session):
+    db.commit()
+
+def count_events_by_status(db: Session) -> Dict[str, int]:
+    stmt = select(NotificationOutbox.status, func.count()).group_by(NotificationOutbox.status)
+    counts = {OUTBOX_PENDING: 0, OUTBOX_SENT: 0, OUTBOX_FAILED: 0}
+    counts.update({status: count for status, count in db.execute(stmt)})
+    return counts
@@ -1,6 +1,11 @@
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from app.infrastructure.database.pagination import paginate, paginate_async
+from app.infrastructure.database.loader_strategy import schema_loader_options
 from app.domain.models.role import Role
-from app.domain.schemas.role import RoleUpdate
+from app.domain.schemas.role import RoleUpdate, RoleResponse
 
 def create_role(db: Session, role: Role):
     db.add(role)
@@ -9,10 +14,19 @@ def create_role(db: Session, role: Role):
     return role
 
 def get_all_roles(db: Session):
-    return db.query(Role).all()
+    return db.query(Role).options(*schema_loader_options(Role, RoleResponse)).all()
+
+def get_roles_page(db: Session, limit: int, cursor: Optional[str] = None):
+    query = db.query(Role).options(*schema_loader_options(Role, RoleResponse))
+    return paginate(query, Role, limit, cursor)
 
 def get_role_by_id(db: Session, role_id: str):
-    return db.query(Role).filter(Role.id == role_id).first()
+    return (
+        db.query(Role)
+        .options(*schema_loader_options(Role, RoleResponse))
+        .filter(Role.id == role_id)
+        .first()
+    )
 
 def update_role(db: Session, role_id: str, role_data: RoleUpdate):
     role = get_role_by_id(db, role_id)
@@ -30,4 +44,17 @@ def delete_role(db: Session, role_id: str):
         return False
     db.delete(role)
     db.commit()
-    return True
\ No newline at end of file
+    return True
+
+async def get_all_roles_async(db: AsyncSession):
+    result = await db.execute(select(Role).options(*schema_loader_options(Role, RoleResponse)))
+    return result.scalars().all()
+
+async def get_roles_page_async(db: AsyncSession, limit: int, cursor: Optional[str] = None):
+    stmt = select(Role).options(*schema_loader_options(Role, RoleResponse))
+    return await paginate_async(db, stmt, Role, limit, cursor)
+
+async def get_role_by_id_async(db: AsyncSession, role_id: str):
+    stmt = select(Role).options(*schema_loader_options(Role, RoleResponse)).where(Role.id == role_id)
+    result = await db.execute(stmt)
+    return result.scalars().first()
\ No newline at end of file
@@ -1,6 +1,11 @@
-from sqlalchemy.orm import Session, joinedload
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.infrastructure.database.pagination import paginate, paginate_async
+from app.infrastructure.database.loader_strategy import schema_loader_options
 from app.domain.models.software import Software
-from app.domain.schemas.software import SoftwareUpdate
+from app.domain.schemas.software import SoftwareUpdate, SoftwareResponse
 
 def create_software(db: Session, software: Software):
     db.add(software)
@@ -9,12 +14,16 @@ def create_software(db: Session, software: Software):
     return software
 
 def get_all_software(db: Session):
-    return db.query(Software).all()
+    return db.query(Software).options(*schema_loader_options(Software, SoftwareResponse)).all()
+
+def get_software_page(db: Session, limit: int, cursor: Optional[str] = None):
+    query = db.query(Software).options(*schema_loader_options(Software, SoftwareResponse))
+    return paginate(query, Software, limit, cursor)
 
 def get_software_by_id(db: Session, software_id: str):
     return (
         db.query(Software)
-        .options(joinedload(Software.roles))
+        .options(*schema_loader_options(Software, SoftwareResponse))
         .filter(Software.id == software_id)
         .first()
     )
@@ -35,4 +44,17 @@ def delete_software(db: Session, software_id: str):
         return False
     db.delete(software)
     db.commit()
-    return True
\ No newline at end of file
+    return True
+
+async def get_all_software_async(db: AsyncSession):
+    result = await db.execute(select(Software).options(*schema_loader_options(Software, SoftwareResponse)))
+    return result.scalars().all()
+
+async def get_software_page_async(db: AsyncSession, limit: int, cursor: Optional[str] = None):
+    stmt = select(Software).options(*schema_loader_options(Software, SoftwareResponse))
+    return await paginate_async(db, stmt, Software, limit, cursor)
+
+async def get_software_by_id_async(db: AsyncSession, software_id: str):
+    stmt = select(Software).options(*schema_loader_options(Software, SoftwareResponse)).where(Software.id == software_id)
+    result = await db.execute(stmt)
+    return result.scalars().first()
\ No newline at end of file
@@ -1,11 +1,18 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import insert, delete, select
+from sqlalchemy import insert, delete, select, update
+from app.domain.models.base import write_timestamp
 from app.domain.models.software_roles import software_roles
+from app.domain.models.software import Software
 from uuid import UUID
 
+def _touch_software(db: Session, software_id: UUID):
+    # The link table has no updated_at; moving the software's keeps its version and delta sync honest.
+    db.execute(update(Software).where(Software.id == software_id).values(updated_at=write_timestamp()))
+
 def add_role_to_software(db: Session, software_id: UUID, role_id: UUID):
     stmt = insert(software_roles).values(software_id=software_id, role_id=role_id)
     db.execute(stmt)
+    _touch_software(db, software_id)
     db.commit()
 
 def remove_role_from_software(db: Session, software_id: UUID, role_id: UUID):
@@ -14,6 +21,7 @@ def remove_role_from_software(db: Session, software_id: UUID, role_id: UUID):
         software_roles.c.role_id == role_id
     )
     db.execute(stmt)
+    _touch_software(db, software_id)
     db.commit()
 
 def get_roles_by_software(db: Session, software_id: UUID):
@@ -1,6 +1,11 @@
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from app.infrastructure.database.pagination import paginate, paginate_async
+from app.infrastructure.database.loader_strategy import schema_loader_options
 from app.domain.models.state_request import StateRequest
-from app.domain.schemas.state_request import StateRequestUpdate
+from app.domain.schemas.state_request import StateRequestUpdate, StateRequestResponse
 
 def create_state_request(db: Session, state_request: StateRequest):
     db.add(state_request)
@@ -9,10 +14,19 @@ def create_state_request(db: Session, state_request: StateRequest):
     return state_request
 
 def get_all_state_requests(db: Session):
-    return db.query(StateRequest).all()
+    return db.query(StateRequest).options(*schema_loader_options(StateRequest, StateRequestResponse)).all()
+
+def get_state_requests_page(db: Session, limit: int, cursor: Optional[str] = None):
+    query = db.query(StateRequest).options(*schema_loader_options(StateRequest, StateRequestResponse))
+    return paginate(query, StateRequest, limit, cursor)
 
 def get_state_request_by_id(db: Session, state_request_id: str):
-    return db.query(StateRequest).filter(StateRequest.id == state_request_id).first()
+    return (
+        db.query(StateRequest)
+        .options(*schema_loader_options(StateRequest, StateRequestResponse))
+        .filter(StateRequest.id == state_request_id)
+        .first()
+    )
 
 def update_state_request(db: Session, state_request_id: str, state_request_data: StateRequestUpdate):
     state_request = get_state_request_by_id(db, state_request_id)
@@ -30,4 +44,17 @@ def delete_state_request(db: Session, state_request_id: str):
         return False
     db.delete(state_request)
     db.commit()
-    return True
\ No newline at end of file
+    return True
+
+async def get_all_state_requests_async(db: AsyncSession):
+    result = await db.execute(select(StateRequest).options(*schema_loader_options(StateRequest, StateRequestResponse)))
+    return result.scalars().all()
+
+async def get_state_requests_page_async(db: AsyncSession, limit: int, cursor: Optional[str] = None):
+    stmt = select(StateRequest).options(*schema_loader_options(StateRequest, StateRequestResponse))
+    return await paginate_async(db, stmt, StateRequest, limit, cursor)
+
+async def get_state_request_by_id_async(db: AsyncSession, state_request_id: str):
+    stmt = select(StateRequest).options(*schema_loader_options(StateRequest, StateRequestResponse)).where(StateRequest.id == state_request_id)
+    result = await db.execute(stmt)
+    return result.scalars().first()
\ No newline at end of file
@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import Dict, List, Sequence
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.domain.models.tombstone import Tombstone
+
+def record_tombstone(db: Session, entity: str, entity_id: UUID):
+    # Added to the caller's transaction, so it commits together with the delete.
+    db.add(Tombstone(entity=entity, entity_id=entity_id))
+
+def get_deleted_ids_since(db: Session, entities: Sequence[str], since: datetime) -> Dict[str, List[UUID]]:
+    stmt = (
+        select(Tombstone.entity, Tombstone.entity_id)
+        .where(Tombstone.entity.in_(entities), Tombstone.created_at > since)
+        .order_by(Tombstone.created_at)
+    )
+    deleted = {entity: [] for entity in entities}
+    for entity, entity_id in db.execute(stmt):
+        deleted[entity].append(entity_id)
+    return deleted
@@ -1,18 +1,70 @@
-from sqlalchemy.orm import Session, joinedload
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Set
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.infrastructure.database.pagination import paginate, paginate_async
+from app.infrastructure.database.loader_strategy import schema_loader_options
+from app.infrastructure.database.repositories.tombstone_repository import record_tombstone
+from app.infrastructure.cache.snapshot_cache import all_data_snapshot
 from app.domain.models.user import User
-from app.domain.schemas.user import UserUpdate
+from app.domain.schemas.user import UserUpdate, UserResponse
 
 def create_user(db: Session, user: User):
     db.add(user)
     db.commit()
+    all_data_snapshot.invalidate()
     db.refresh(user)
     return user
 
+def insert_users_skipping_existing(db: Session, rows: List[Dict]) -> Set[str]:
+    """Multi-row ``INSERT ... ON CONFLICT (email) DO NOTHING``; returns the emails actually inserted."""
+    stmt = (
+        pg_insert(User)
+        .values([{"id": uuid.uuid4(), **row} for row in rows])
+        .on_conflict_do_nothing(index_elements=[User.email])
+        .returning(User.email)
+    )
+    inserted = set(db.execute(stmt).scalars().all())
+    db.commit()
+    all_data_snapshot.invalidate()
+    return inserted
+
 def get_all_users(db: Session):
-    return db.query(User).options(joinedload(User.role)).all()
+    return db.query(User).options(*schema_loader_options(User, UserResponse)).all()
+
+def get_users_page(db: Session, limit: int, cursor: Optional[str] = None):
+    query = db.query(User).options(*schema_loader_options(User, UserResponse))
+    return paginate(query, User, limit, cursor)
+
+def iter_all_users(db: Session, batch_size: int):
+    stmt = select(User).options(*schema_loader_options(User, UserResponse)).execution_options(yield_per=batch_size)
+    return db.execute(stmt).scalars()
+
+def get_users_rows(db: Session, since: Optional[datetime] = None):
+    """Column tuples only, no entities or relationships, for responses that reference related rows by id."""
+    stmt = select(*User.__table__.columns)
+    if since is not None:
+        stmt = stmt.where(User.updated_at > since)
+    return db.execute(stmt).all()
+
+def get_users_changed_since(db: Session, since: datetime):
+    stmt = select(User).options(*schema_loader_options(User, UserResponse)).where(User.updated_at > since)
+    return db.execute(stmt).scalars().all()
+
+def get_users_by_ids(db: Session, user_ids: Sequence[str]):
+    stmt = select(User).options(*schema_loader_options(User, UserResponse)).where(User.id.in_(user_ids))
+    return db.execute(stmt).scalars().all()
 
 def get_user_by_id(db: Session, user_id: str):
-    return db.query(User).filter(User.id == user_id).first()
+    return (
+        db.query(User)
+        .options(*schema_loader_options(User, UserResponse))
+        .filter(User.id == user_id)
+        .first()
+    )
 
 def update_user(db: Session, user_id: str, user_data: UserUpdate):
     user = get_user_by_id(db, user_id)
@@ -21,6 +73,7 @@ def update_user(db: Session, user_id: str, user_data: UserUpdate):
     for field, value in user_data.dict(exclude_unset=True).items():
         setattr(user, field, value)
     db.commit()
+    all_data_snapshot.invalidate()
     db.refresh(user)
     return user
 
@@ -28,6 +81,21 @@ def delete_user(db: Session, user_id: str):
     user = get_user_by_id(db, user_id)
     if not user:
         return False
+    record_tombstone(db, User.__tablename__, user.id)
     db.delete(user)
     db.commit()
-    return True
\ No newline at end of file
+    all_data_snapshot.invalidate()
+    return True
+
+async def get_all_users_async(db: AsyncSession):
+    result = await db.execute(select(User).options(*schema_loader_options(User, UserResponse)))
+    return result.scalars().all()
+
+async def get_users_page_async(db: AsyncSession, limit: int, cursor: Optional[str] = None):
+    stmt = select(User).options(*schema_loader_options(User, UserResponse))
+    return await paginate_async(db, stmt, User, limit, cursor)
+
+async def get_user_by_id_async(db: AsyncSession, user_id: str):
+    stmt = select(User).options(*schema_loader_options(User, UserResponse)).where(User.id == user_id)
+    result = await db.execute(stmt)
+    return result.scalars().first()
\ No newline at end of file
@@ -0,0 +1,49 @@
+from pathlib import Path
+from typing import Optional
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy.engine import Engine
+from app.config.logger import get_logger
+
+logger = get_logger("database.schema")
+
+ALEMBIC_INI = Path(__file__).resolve().parents[3] / "alembic.ini"
+
+
+class SchemaOutOfDateError(RuntimeError):
+    pass
+
+
+def _alembic_config() -> Config:
+    config = Config(str(ALEMBIC_INI))
+    config.attributes["configure_logger"] = False
+    # Relative to the ini file, so commands work from any working directory.
+    config.set_main_option("script_location", str(ALEMBIC_INI.parent / "migrations"))
+    return config
+
+
+def get_head_revision() -> Optional[str]:
+    return ScriptDirectory.from_config(_alembic_config()).get_current_head()
+
+
+def get_current_revision(engine: Engine) -> Optional[str]:
+    with engine.connect() as connection:
+        return MigrationContext.configure(connection).get_current_revision()
+
+
+def upgrade_schema(revision: str = "head"):
+    logger.info("Aplicando migraciones hasta %s", revision)
+    command.upgrade(_alembic_config(), revision)
+
+
+def check_schema(engine: Engine):
+    """One read of ``alembic_version``: fail fast instead of serving against an old schema."""
+    current, head = get_current_revision(engine), get_head_revision()
+    if current != head:
+        raise SchemaOutOfDateError(
+            f"Esquema de base de datos en la revisión {current}, se esperaba {head}. "
+            "Ejecute `alembic upgrade head` o arranque con DB_STARTUP_MODE=migrate."
+        )
+    logger.info("Esquema de base de datos al día (revisión %s)", current)
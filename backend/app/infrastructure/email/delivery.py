@@ -0,0 +1,245 @@
+import queue
+import smtplib
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter
+from email.message import EmailMessage
+from typing import Any, Dict, List, Optional, Sequence
+from app.config.notification_config import NOTIFICATION_SETTINGS
+from app.config.logger import get_logger
+
+logger = get_logger("email.delivery")
+
+
+class DeliveryResult:
+    """Outcome of one message: the recipients that accepted it, those refused, or the error that stopped it."""
+
+    __slots__ = ("accepted", "refused", "error")
+
+    def __init__(self, accepted: List[str], refused: Dict[str, str], error: Optional[str] = None):
+        self.accepted = accepted
+        self.refused = refused
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return bool(self.accepted)
+
+    def describe(self) -> str:
+        return self.error or f"destinatarios rechazados: {self.refused}"
+
+
+def _recipients(message: EmailMessage) -> List[str]:
+    recipients = []
+    for field in ("To", "Cc", "Bcc"):
+        for header in message.get_all(field, []):
+            recipients.extend(address.strip() for address in str(header).split(",") if address.strip())
+    return recipients
+
+
+class DeliveryBackend(ABC):
+    """Sends rendered notifications; subclasses implement ``_send_many``, which reports failures per message."""
+
+    name = "base"
+
+    def __init__(self):
+        self._stats_lock = threading.Lock()
+        self.messages_sent = 0
+        self.messages_failed = 0
+        self.recipient_failures: Counter = Counter()
+
+    def send(self, message: EmailMessage) -> DeliveryResult:
+        return self.send_many([message])[0]
+
+    def send_many(self, messages: Sequence[EmailMessage]) -> List[DeliveryResult]:
+        results = self._send_many(messages)
+        with self._stats_lock:
+            for result in results:
+                if result.ok:
+                    self.messages_sent += 1
+                else:
+                    self.messages_failed += 1
+                self.recipient_failures.update(result.refused.keys())
+        return results
+
+    @abstractmethod
+    def _send_many(self, messages: Sequence[EmailMessage]) -> List[DeliveryResult]:
+        """Send ``messages`` and return one result per message, in order."""
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {
+                "backend": self.name,
+                "messages_sent": self.messages_sent,
+                "messages_failed": self.messages_failed,
+                "failed_recipients": dict(self.recipient_failures.most_common(20)),
+            }
+
+    def close(self):
+        pass
+
+
+class LogDeliveryBackend(DeliveryBackend):
+    """Development backend: writes each message to the log instead of sending it."""
+
+    name = "log"
+
+    def _send_many(self, messages: Sequence[EmailMessage]) -> List[DeliveryResult]:
+        results = []
+        for message in messages:
+            recipients = _recipients(message)
+            logger.info(f"EMAIL [log] para {', '.join(recipients)}: {message['Subject']}")
+            logger.debug(f"Email body:\n{message.get_content()}")
+            results.append(DeliveryResult(recipients, {}))
+        return results
+
+
+class _Connection:
+    __slots__ = ("smtp", "messages_sent")
+
+    def __init__(self, smtp: smtplib.SMTP):
+        self.smtp = smtp
+        self.messages_sent = 0
+
+
+class SMTPDeliveryBackend(DeliveryBackend):
+    """SMTP client that keeps up to ``pool_size`` authenticated connections open between sends.
+
+    A batch is sent back to back over one connection, so EHLO/STARTTLS/AUTH are paid once per
+    connection rather than once per message. At most ``pool_size`` batches are in flight at a
+    time; a connection is recycled after ``max_messages_per_connection`` messages, and one the
+    server has dropped while idle is reopened transparently.
+    """
+
+    name = "smtp"
+
+    def __init__(self, host: str, port: int, username: str = "", password: str = "", starttls: bool = False,
+                 timeout: float = 10, pool_size: int = 4, max_messages_per_connection: int = 100):
+        super().__init__()
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self.max_messages_per_connection = max_messages_per_connection
+        self._idle: "queue.LifoQueue[_Connection]" = queue.LifoQueue(maxsize=pool_size)
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self.connections_opened = 0
+
+    def _open(self) -> _Connection:
+        return _Connection(self._connect())
+
+    def _connect(self) -> smtplib.SMTP:
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        smtp.ehlo()
+        if self.starttls:
+            smtp.starttls()
+            smtp.ehlo()
+        if self.username:
+            smtp.login(self.username, self.password)
+        with self._stats_lock:
+            self.connections_opened += 1
+        logger.debug(f"Conexión SMTP abierta con {self.host}:{self.port}")
+        return smtp
+
+    @staticmethod
+    def _close_client(smtp: smtplib.SMTP):
+        try:
+            smtp.close()
+        except OSError:
+            pass
+
+    @staticmethod
+    def _quit(connection: _Connection):
+        try:
+            connection.smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            SMTPDeliveryBackend._close_client(connection.smtp)
+
+    def _acquire(self) -> _Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._open()
+
+    def _release(self, connection: Optional[_Connection]):
+        if connection is None:
+            return
+        if connection.messages_sent >= self.max_messages_per_connection:
+            self._quit(connection)
+            return
+        try:
+            self._idle.put_nowait(connection)
+        except queue.Full:
+            self._quit(connection)
+
+    def _send_one(self, connection: _Connection, message: EmailMessage) -> DeliveryResult:
+        recipients = _recipients(message)
+        try:
+            try:
+                refused = connection.smtp.send_message(message)
+            except smtplib.SMTPServerDisconnected:
+                # Idle connection closed by the server: drop its socket, reopen once and resend.
+                self._close_client(connection.smtp)
+                connection.smtp = self._connect()
+                connection.messages_sent = 0
+                refused = connection.smtp.send_message(message)
+        except smtplib.SMTPRecipientsRefused as e:
+            refused = e.recipients
+        except (smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as e:
+            connection.smtp.rset()
+            refused = {recipient: (e.smtp_code, e.smtp_error) for recipient in recipients}
+        connection.messages_sent += 1
+        refused_detail = {recipient: f"{code} {error.decode(errors='replace') if isinstance(error, bytes) else error}"
+                          for recipient, (code, error) in refused.items()}
+        for recipient, detail in refused_detail.items():
+            logger.warning(f"Destinatario rechazado {recipient}: {detail}")
+        return DeliveryResult([recipient for recipient in recipients if recipient not in refused], refused_detail)
+
+    def _send_many(self, messages: Sequence[EmailMessage]) -> List[DeliveryResult]:
+        results = []
+        with self._slots:
+            connection = None
+            try:
+                connection = self._acquire()
+                for message in messages:
+                    if connection.messages_sent >= self.max_messages_per_connection:
+                        self._quit(connection)
+                        connection = self._open()
+                    results.append(self._send_one(connection, message))
+            except (smtplib.SMTPException, OSError) as e:
+                # What was sent stays sent; only the rest of the batch is reported as failed.
+                logger.error(f"Envío SMTP interrumpido tras {len(results)}/{len(messages)} mensajes: {e}")
+                if connection is not None:
+                    self._quit(connection)
+                    connection = None
+                results.extend(DeliveryResult([], {}, f"{type(e).__name__}: {e}") for _ in messages[len(results):])
+            finally:
+                self._release(connection)
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        stats["connections_opened"] = self.connections_opened
+        stats["idle_connections"] = self._idle.qsize()
+        return stats
+
+    def close(self):
+        while True:
+            try:
+                self._quit(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+
+def create_delivery_backend(settings: Dict[str, Any]) -> DeliveryBackend:
+    backend = settings.get("backend", "log")
+    if backend == "smtp":
+        return SMTPDeliveryBackend(**settings["smtp"])
+    if backend != "log":
+        logger.warning(f"Backend de notificaciones desconocido '{backend}', usando 'log'")
+    return LogDeliveryBackend()
+
+
+delivery_backend = create_delivery_backend(NOTIFICATION_SETTINGS["delivery"])
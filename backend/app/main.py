@@ -1,9 +1,20 @@
 import os
+import anyio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 from app.config.logger import get_logger
-from app.infrastructure.database.database import init_db
+from app.config.env import (
+    DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_PREWARM, THREADPOOL_SIZE, NOTIFICATION_DISPATCHER_ENABLED,
+    ALL_DATA_PARALLEL_READS, ALL_DATA_READ_WORKERS, ASYNC_DB_POOL_PREWARM
+)
+from app.infrastructure.database.database import init_db, engine, async_engine
+from app.infrastructure.database.pool import prewarm_pool, prewarm_async_pool
+from app.application.services.notification_dispatcher import notification_dispatcher
+from app.infrastructure.email.delivery import delivery_backend
+from app.infrastructure.api.middleware.query_metrics import QueryMetricsMiddleware, instrument_engine
+from app.infrastructure.api.json_response import DefaultJSONResponse
+from app.infrastructure.api.compression import CompressionMiddleware
 from app.infrastructure.api.routes import (
     user_router,
     device_router,
@@ -12,14 +23,15 @@ from app.infrastructure.api.routes import (
     access_router,
     state_request_router,
     health_router,
-    all_data_router
+    all_data_router,
+    async_router
 )
 
 logger = get_logger("main")
 
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), "..", ".env"))
 
-app = FastAPI(title="Gestion de Usuarios, Equipos y Accesos")
+app = FastAPI(title="Gestion de Usuarios, Equipos y Accesos", default_response_class=DefaultJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -27,12 +39,40 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "ETag"],
 )
+# Inside QueryMetricsMiddleware so Server-Timing's total includes the compression time.
+app.add_middleware(CompressionMiddleware)
+
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
+app.add_middleware(QueryMetricsMiddleware)
 
 
 @app.on_event("startup")
 async def startup_event():
     init_db()
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    # Parallel /all-data reads take up to ALL_DATA_READ_WORKERS connections on top of the threadpool's.
+    read_workers = ALL_DATA_READ_WORKERS if ALL_DATA_PARALLEL_READS else 0
+    if DB_POOL_SIZE + DB_MAX_OVERFLOW < THREADPOOL_SIZE + read_workers:
+        logger.warning(
+            f"Pool de conexiones ({DB_POOL_SIZE}+{DB_MAX_OVERFLOW}) menor que el threadpool ({THREADPOOL_SIZE}) "
+            f"más los lectores de /all-data ({read_workers}); las rutas síncronas pueden esperar por conexión")
+    if DB_POOL_PREWARM > 0:
+        prewarm_pool(engine, DB_POOL_PREWARM)
+    if ASYNC_DB_POOL_PREWARM > 0:
+        await prewarm_async_pool(async_engine, ASYNC_DB_POOL_PREWARM)
+    if NOTIFICATION_DISPATCHER_ENABLED:
+        notification_dispatcher.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    if NOTIFICATION_DISPATCHER_ENABLED:
+        notification_dispatcher.stop()
+    delivery_backend.close()
+    await async_engine.dispose()
 
 app.include_router(health_router.router)
 app.include_router(user_router.router)
@@ -42,3 +82,4 @@ app.include_router(software_router.router)
 app.include_router(state_request_router.router)
 app.include_router(access_router.router)
 app.include_router(all_data_router.router)
+app.include_router(async_router.router)
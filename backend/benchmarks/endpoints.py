@@ -0,0 +1,248 @@
+"""Latency, throughput and queries per request for every read endpoint, with the app running in-process.
+
+Requests go through httpx's ASGI transport straight into ``app.main.app`` (middleware, threadpool and
+the real database included, no network hop), so the numbers isolate the application and its queries.
+Point DATABASE_URL at a migrated local Postgres and fill it first, either with
+``python -m app.cli.generate_dataset`` or with ``--generate``:
+
+    cd backend && python -m benchmarks.endpoints --generate 20000 --requests 200 --concurrency 16
+    cd backend && python -m benchmarks.endpoints --baseline benchmarks/results/baseline.json
+
+Results are written as JSON (``--output``); ``--baseline`` prints the change against an earlier run.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import re
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+# One request_metrics line per request would dominate the measurement; set LOG_LEVEL to override.
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+# The dispatcher thread would compete with the requests for the pool.
+os.environ.setdefault("NOTIFICATION_DISPATCHER_ENABLED", "false")
+
+import httpx  # noqa: E402
+from sqlalchemy import func, select  # noqa: E402
+from app.main import app  # noqa: E402
+from app.infrastructure.database.database import SessionLocal, engine  # noqa: E402
+from app.domain.models.access import Access  # noqa: E402
+from app.domain.models.device import Device  # noqa: E402
+from app.domain.models.role import Role  # noqa: E402
+from app.domain.models.software import Software  # noqa: E402
+from app.domain.models.state_request import StateRequest  # noqa: E402
+from app.domain.models.user import User  # noqa: E402
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+# name -> path; {placeholders} are filled with ids read from the database before the run.
+SCENARIOS: Dict[str, str] = {
+    "users_page": "/users/?limit=100",
+    "users_all": "/users/?all=true",
+    "user_by_id": "/users/{user_id}",
+    "devices_page": "/devices/?limit=100",
+    "devices_all": "/devices/?all=true",
+    "device_by_id": "/devices/{device_id}",
+    "access_page": "/access/?limit=100",
+    "access_all": "/access/?all=true",
+    "access_by_id": "/access/{access_id}",
+    "software_all": "/software/?all=true",
+    "software_by_id": "/software/{software_id}",
+    "roles_all": "/roles/?all=true",
+    "state_requests_all": "/state-requests/?all=true",
+    "all_data": "/all-data/",
+    "async_users_page": "/async/users/?limit=100",
+    "async_all_data": "/async/all-data/",
+}
+
+# Full dumps are orders of magnitude heavier than the rest; they get a fraction of --requests.
+HEAVY_SCENARIOS = {"users_all", "devices_all", "access_all", "all_data", "async_all_data"}
+
+_QUERIES = re.compile(r'desc="(\d+) queries"')
+_DB_DURATION = re.compile(r"db;dur=([\d.]+)")
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, round(percent / 100 * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+def _dataset_info() -> Dict[str, Any]:
+    db = SessionLocal()
+    try:
+        counts = {
+            model.__tablename__: db.execute(select(func.count()).select_from(model)).scalar_one()
+            for model in (User, Device, Access, Software, Role, StateRequest)
+        }
+        ids = {
+            "user_id": db.execute(select(User.id).limit(1)).scalar(),
+            "device_id": db.execute(select(Device.id).limit(1)).scalar(),
+            "access_id": db.execute(select(Access.id).limit(1)).scalar(),
+            "software_id": db.execute(select(Software.id).limit(1)).scalar(),
+        }
+    finally:
+        db.close()
+    return {"row_counts": counts, "ids": {key: str(value) for key, value in ids.items() if value is not None}}
+
+
+def _generate(users: int, seed: int):
+    from app.infrastructure.database.init_data.synthetic import SyntheticDataset
+
+    db = SessionLocal()
+    try:
+        if db.execute(select(func.count()).select_from(User)).scalar_one() >= users:
+            return
+        SyntheticDataset(users=users, software=max(50, users // 200), roles=20, seed=seed).load(db)
+    finally:
+        db.close()
+
+
+async def _run_scenario(client: httpx.AsyncClient, path: str, requests: int, concurrency: int,
+                        warmup: int) -> Dict[str, Any]:
+    for _ in range(warmup):
+        await client.get(path)
+
+    latencies: List[float] = []
+    queries: List[int] = []
+    db_ms: List[float] = []
+    statuses: Dict[str, int] = {}
+    total_bytes = 0
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining, total_bytes
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            response = await client.get(path)
+            latencies.append((time.perf_counter() - started) * 1000)
+            total_bytes += response.num_bytes_downloaded
+            statuses[str(response.status_code)] = statuses.get(str(response.status_code), 0) + 1
+            timing = response.headers.get("server-timing", "")
+            match = _QUERIES.search(timing)
+            if match:
+                queries.append(int(match.group(1)))
+            match = _DB_DURATION.search(timing)
+            if match:
+                db_ms.append(float(match.group(1)))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, requests))))
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "path": path,
+        "requests": len(latencies),
+        "concurrency": concurrency,
+        "statuses": statuses,
+        "errors": sum(count for status, count in statuses.items() if not status.startswith("2")),
+        "latency_ms": {
+            "p50": round(_percentile(latencies, 50), 3),
+            "p95": round(_percentile(latencies, 95), 3),
+            "p99": round(_percentile(latencies, 99), 3),
+            "mean": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+            "max": round(latencies[-1], 3) if latencies else 0.0,
+        },
+        "throughput_rps": round(len(latencies) / wall, 2) if wall else 0.0,
+        "bytes_per_response": round(total_bytes / len(latencies)) if latencies else 0,
+        "bytes_per_second": round(total_bytes / wall) if wall else 0,
+        "queries_per_request": round(sum(queries) / len(queries), 2) if queries else None,
+        "db_ms_per_request": round(sum(db_ms) / len(db_ms), 3) if db_ms else None,
+    }
+
+
+async def run(scenarios: List[str], requests: int, heavy_requests: int, concurrency: int, warmup: int,
+              ids: Dict[str, str]) -> Dict[str, Any]:
+    results = {}
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as client:
+            for name in scenarios:
+                try:
+                    path = SCENARIOS[name].format(**ids)
+                except KeyError:
+                    print(f"  {name:<20} omitido (no hay filas para {SCENARIOS[name]})")
+                    continue
+                count = heavy_requests if name in HEAVY_SCENARIOS else requests
+                result = await _run_scenario(client, path, count, concurrency, warmup)
+                results[name] = result
+                latency = result["latency_ms"]
+                print(f"  {name:<20} p50 {latency['p50']:9.2f} ms  p95 {latency['p95']:9.2f} ms  "
+                      f"p99 {latency['p99']:9.2f} ms  {result['throughput_rps']:8.1f} req/s  "
+                      f"{result['bytes_per_second'] / 1e6:7.2f} MB/s  "
+                      f"{result['queries_per_request'] if result['queries_per_request'] is not None else '-':>5} q/req"
+                      + (f"  errores: {result['errors']}" if result["errors"] else ""))
+    return results
+
+
+def _compare(results: Dict[str, Any], baseline_path: str):
+    baseline = json.loads(Path(baseline_path).read_text(encoding="utf-8"))["scenarios"]
+    print(f"\nComparación con {baseline_path} (negativo = más rápido):")
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+
+        def change(new: float, old: float) -> str:
+            return f"{(new - old) / old * 100:+7.1f}%" if old else "    n/a"
+
+        print(f"  {name:<20} p50 {change(result['latency_ms']['p50'], before['latency_ms']['p50'])}  "
+              f"p95 {change(result['latency_ms']['p95'], before['latency_ms']['p95'])}  "
+              f"p99 {change(result['latency_ms']['p99'], before['latency_ms']['p99'])}  "
+              f"req/s {change(result['throughput_rps'], before['throughput_rps'])}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200, help="Requests per scenario")
+    parser.add_argument("--heavy-requests", type=int, default=20, help="Requests per full-dump scenario (all=true, /all-data)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Requests in flight at once")
+    parser.add_argument("--warmup", type=int, default=3, help="Unmeasured requests per scenario")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="Run only these (repeatable)")
+    parser.add_argument("--generate", type=int, metavar="USERS", help="Load a synthetic dataset of this many users first if the database has fewer")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for --generate")
+    parser.add_argument("--output", help="JSON results file (default benchmarks/results/endpoints-<timestamp>.json)")
+    parser.add_argument("--baseline", help="Earlier results file to compare against")
+    args = parser.parse_args(argv)
+
+    if args.generate:
+        _generate(args.generate, args.seed)
+    dataset = _dataset_info()
+    print(f"Dataset: {dataset['row_counts']} ({engine.dialect.name})")
+
+    results = asyncio.run(run(args.scenario or list(SCENARIOS), args.requests, args.heavy_requests,
+                              args.concurrency, args.warmup, dataset["ids"]))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "database": engine.dialect.name,
+            "python": platform.python_version(),
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "heavy_requests": args.heavy_requests,
+            "row_counts": dataset["row_counts"],
+        },
+        "scenarios": results,
+    }
+    output = Path(args.output) if args.output else RESULTS_DIR / f"endpoints-{datetime.now():%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"\nResultados guardados en {output}")
+
+    if args.baseline:
+        _compare(results, args.baseline)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""Per-record CPU cost of logging on the calling (request) thread.
+
+Compares the previous setup (synchronous console + file handlers, a new Formatter built for
+every record, a color filter on each handler) with the queue-based one in app.config.logger,
+and the cost of a disabled DEBUG line built eagerly with an f-string vs deferred with ``lazy``.
+
+    cd backend && python -m benchmarks.logging_overhead --records 20000
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.config.logger import CustomFormatter, lazy, setup_logger, stop_logging  # noqa: E402
+from app.domain.schemas.access import AccessCreate  # noqa: E402
+
+
+class _LegacyFormatter(logging.Formatter):
+    def format(self, record):
+        log_format = "%(asctime)s | %(name)s | %(levelname)s | %(message)s"
+        if getattr(record, "color", False):
+            color = CustomFormatter.COLORS.get(record.levelname, CustomFormatter.COLORS["RESET"])
+            log_format = f"{color}{log_format}{CustomFormatter.COLORS['RESET']}"
+        return logging.Formatter(log_format, datefmt="%Y-%m-%d %H:%M:%S").format(record)
+
+
+def _legacy_logger(name: str, stream, log_file: str) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    console = logging.StreamHandler(stream)
+    console.setFormatter(_LegacyFormatter())
+    console.addFilter(lambda record: setattr(record, "color", True) or True)
+    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    file_handler.setFormatter(_LegacyFormatter())
+    file_handler.addFilter(lambda record: setattr(record, "color", False) or True)
+    logger.addHandler(console)
+    logger.addHandler(file_handler)
+    return logger
+
+
+def _measure(logger: logging.Logger, records: int) -> float:
+    started = time.thread_time()
+    for i in range(records):
+        logger.info("Solicitud procesada - ID: %s, estado: %s", i, "ok")
+    return (time.thread_time() - started) / records
+
+
+def _measure_disabled_debug(logger: logging.Logger, records: int):
+    """A DEBUG line with a model dump while DEBUG is off: eager f-string vs %-args with ``lazy``."""
+    data = AccessCreate(user_id=uuid.uuid4(), software_id=uuid.uuid4(), state_request_id=uuid.uuid4())
+    started = time.thread_time()
+    for _ in range(records):
+        logger.debug(f"Entrando a create_access_service con datos: {data.dict()}")
+    eager = (time.thread_time() - started) / records
+    started = time.thread_time()
+    for _ in range(records):
+        logger.debug("Entrando a create_access_service con datos: %s", lazy(data.dict))
+    deferred = (time.thread_time() - started) / records
+    return eager, deferred
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--requests-per-second", type=int, default=200,
+                        help="Request rate used to express the cost as CPU time per second of traffic")
+    parser.add_argument("--records-per-request", type=int, default=8)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        stdout = sys.stdout
+        legacy = _legacy_logger("bench.legacy", devnull, os.path.join(tmp, "legacy.log"))
+        legacy_cost = _measure(legacy, args.records)
+
+        sys.stdout = devnull  # setup_logger binds its console handler to sys.stdout
+        try:
+            queued = setup_logger("bench.queued", log_file=os.path.join(tmp, "queued.log"))
+            queued.propagate = False
+            queued_cost = _measure(queued, args.records)
+            eager_cost, lazy_cost = _measure_disabled_debug(queued, args.records)
+            stop_logging()
+        finally:
+            sys.stdout = stdout
+
+    per_second = args.requests_per_second * args.records_per_request
+    for label, cost in (("sync handlers (before)", legacy_cost), ("queue handler (after)", queued_cost)):
+        print(f"{label:<24} {cost * 1e6:8.2f} µs/record  "
+              f"{cost * per_second * 1000:7.2f} ms of request-thread time per second "
+              f"at {args.requests_per_second} req/s x {args.records_per_request} records")
+
+    print(f"{'disabled debug, eager':<24} {eager_cost * 1e6:8.2f} µs/call")
+    print(f"{'disabled debug, lazy':<24} {lazy_cost * 1e6:8.2f} µs/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Serialization cost of the large responses, without HTTP or the database in the timing.
+
+Loads the ``/all-data`` payload and the ``?all=true`` lists once from DATABASE_URL, then times the
+three ways a route can turn ORM rows into a body:
+
+- ``stock``: FastAPI's response_model pass (validate, convert to dicts and lists) plus ``JSONResponse``;
+- ``stock+orjson``: the same pass with ``ORJSONResponse``, now the app's default response class;
+- ``json_body``: ``JSONBody`` from app.infrastructure.api.json_response, one validation and a direct dump.
+
+    cd backend && python -m benchmarks.serialization --repeat 5
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_response_field  # noqa: E402
+from app.infrastructure.database.database import SessionLocal, load_models  # noqa: E402
+from app.infrastructure.api.json_response import JSONBody  # noqa: E402
+from app.application.services.all_data_service import get_all_data_service  # noqa: E402
+from app.application.use_cases.user_use_case import get_all_users_use_case  # noqa: E402
+from app.application.use_cases.device_use_case import get_all_devices_use_case  # noqa: E402
+from app.application.use_cases.access_use_case import get_all_accesses_use_case  # noqa: E402
+from app.domain.schemas.all_data import AllDataResponse  # noqa: E402
+from app.domain.schemas.user import UserResponse  # noqa: E402
+from app.domain.schemas.device import DeviceResponse  # noqa: E402
+from app.domain.schemas.access import AccessResponse  # noqa: E402
+
+
+def _stock(schema: Any, response_class) -> Callable[[Any], bytes]:
+    field = create_response_field(name="Response_benchmark", type_=schema, mode="serialization")
+
+    def render(data: Any) -> bytes:
+        content = asyncio.run(serialize_response(field=field, response_content=data, is_coroutine=True))
+        return response_class(content).body
+
+    return render
+
+
+def _measure(render: Callable[[Any], bytes], data: Any, repeat: int) -> Dict[str, float]:
+    body = render(data)
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        render(data)
+        best = min(best, time.perf_counter() - started)
+    return {"ms": best * 1000, "bytes": len(body), "mb_per_s": len(body) / best / 1e6}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Coste de serialización de las respuestas grandes")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per variant (best is reported)")
+    args = parser.parse_args(argv)
+
+    load_models()
+    db = SessionLocal()
+    try:
+        payloads = {
+            "all_data": (AllDataResponse, get_all_data_service(db)),
+            "users_all": (list[UserResponse], get_all_users_use_case(db)),
+            "devices_all": (list[DeviceResponse], get_all_devices_use_case(db)),
+            "access_all": (list[AccessResponse], get_all_accesses_use_case(db)),
+        }
+
+        for name, (schema, data) in payloads.items():
+            variants = {
+                "stock": _stock(schema, JSONResponse),
+                "stock+orjson": _stock(schema, ORJSONResponse),
+                "json_body": JSONBody(schema).render,
+            }
+            print(f"{name}:")
+            baseline = None
+            for variant, render in variants.items():
+                result = _measure(render, data, args.repeat)
+                baseline = baseline or result["ms"]
+                print(f"  {variant:<14} {result['ms']:9.2f} ms  {result['bytes'] / 1e6:7.2f} MB  "
+                      f"{result['mb_per_s']:7.1f} MB/s  x{baseline / result['ms']:.2f}")
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
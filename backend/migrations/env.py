@@ -0,0 +1,36 @@
+from logging.config import fileConfig
+from alembic import context
+from app.infrastructure.database.database import Base, engine, load_models
+
+config = context.config
+
+# Skip when called from the app (upgrade_schema): its logging is already configured.
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+load_models()
+target_metadata = Base.metadata
+
+
+def run_migrations_offline():
+    context.configure(
+        url=str(engine.url),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    with engine.connect() as connection:
+        context.configure(connection=connection, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,176 @@
+"""initial schema
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-18 16:59:25.322487
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('notification_outbox',
+    sa.Column('event_type', sa.String(), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('digest_key', sa.String(), nullable=True),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('next_attempt_at', sa.DateTime(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('sent_at', sa.DateTime(), nullable=True),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_notification_outbox_created_at_id', 'notification_outbox', ['created_at', 'id'], unique=False)
+    op.create_index(op.f('ix_notification_outbox_id'), 'notification_outbox', ['id'], unique=False)
+    op.create_index('ix_notification_outbox_status_digest_key', 'notification_outbox', ['status', 'digest_key'], unique=False)
+    op.create_index('ix_notification_outbox_status_next_attempt_at', 'notification_outbox', ['status', 'next_attempt_at'], unique=False)
+    op.create_index('ix_notification_outbox_updated_at', 'notification_outbox', ['updated_at'], unique=False)
+    op.create_table('roles',
+    sa.Column('label', sa.String(), nullable=False),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_roles_created_at_id', 'roles', ['created_at', 'id'], unique=False)
+    op.create_index(op.f('ix_roles_id'), 'roles', ['id'], unique=False)
+    op.create_index('ix_roles_updated_at', 'roles', ['updated_at'], unique=False)
+    op.create_table('software',
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('url', sa.String(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_software_created_at_id', 'software', ['created_at', 'id'], unique=False)
+    op.create_index(op.f('ix_software_id'), 'software', ['id'], unique=False)
+    op.create_index('ix_software_updated_at', 'software', ['updated_at'], unique=False)
+    op.create_table('state_requests',
+    sa.Column('label', sa.String(), nullable=False),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_state_requests_created_at_id', 'state_requests', ['created_at', 'id'], unique=False)
+    op.create_index(op.f('ix_state_requests_id'), 'state_requests', ['id'], unique=False)
+    op.create_index('ix_state_requests_updated_at', 'state_requests', ['updated_at'], unique=False)
+    op.create_table('tombstones',
+    sa.Column('entity', sa.String(), nullable=False),
+    sa.Column('entity_id', sa.UUID(), nullable=False),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_tombstones_created_at_id', 'tombstones', ['created_at', 'id'], unique=False)
+    op.create_index(op.f('ix_tombstones_id'), 'tombstones', ['id'], unique=False)
+    op.create_index('ix_tombstones_updated_at', 'tombstones', ['updated_at'], unique=False)
+    op.create_table('software_roles',
+    sa.Column('software_id', sa.UUID(), nullable=False),
+    sa.Column('role_id', sa.UUID(), nullable=False),
+    sa.ForeignKeyConstraint(['role_id'], ['roles.id'], ),
+    sa.ForeignKeyConstraint(['software_id'], ['software.id'], ),
+    sa.PrimaryKeyConstraint('software_id', 'role_id')
+    )
+    op.create_table('users',
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('email', sa.String(), nullable=False),
+    sa.Column('area', sa.String(), nullable=False),
+    sa.Column('team', sa.String(), nullable=False),
+    sa.Column('role_id', sa.UUID(), nullable=False),
+    sa.Column('last_login', sa.DateTime(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['role_id'], ['roles.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_users_created_at_id', 'users', ['created_at', 'id'], unique=False)
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
+    op.create_index('ix_users_updated_at', 'users', ['updated_at'], unique=False)
+    op.create_table('access',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('software_id', sa.UUID(), nullable=False),
+    sa.Column('state_request_id', sa.UUID(), nullable=False),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['software_id'], ['software.id'], ),
+    sa.ForeignKeyConstraint(['state_request_id'], ['state_requests.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_access_created_at_id', 'access', ['created_at', 'id'], unique=False)
+    op.create_index(op.f('ix_access_id'), 'access', ['id'], unique=False)
+    op.create_index('ix_access_updated_at', 'access', ['updated_at'], unique=False)
+    op.create_table('devices',
+    sa.Column('serial_number', sa.String(), nullable=True),
+    sa.Column('model', sa.String(), nullable=True),
+    sa.Column('system_operating', sa.String(), nullable=True),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('state_request_id', sa.UUID(), nullable=False),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['state_request_id'], ['state_requests.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_devices_created_at_id', 'devices', ['created_at', 'id'], unique=False)
+    op.create_index(op.f('ix_devices_id'), 'devices', ['id'], unique=False)
+    op.create_index('ix_devices_updated_at', 'devices', ['updated_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_devices_updated_at', table_name='devices')
+    op.drop_index(op.f('ix_devices_id'), table_name='devices')
+    op.drop_index('ix_devices_created_at_id', table_name='devices')
+    op.drop_table('devices')
+    op.drop_index('ix_access_updated_at', table_name='access')
+    op.drop_index(op.f('ix_access_id'), table_name='access')
+    op.drop_index('ix_access_created_at_id', table_name='access')
+    op.drop_table('access')
+    op.drop_index('ix_users_updated_at', table_name='users')
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_index('ix_users_created_at_id', table_name='users')
+    op.drop_table('users')
+    op.drop_table('software_roles')
+    op.drop_index('ix_tombstones_updated_at', table_name='tombstones')
+    op.drop_index(op.f('ix_tombstones_id'), table_name='tombstones')
+    op.drop_index('ix_tombstones_created_at_id', table_name='tombstones')
+    op.drop_table('tombstones')
+    op.drop_index('ix_state_requests_updated_at', table_name='state_requests')
+    op.drop_index(op.f('ix_state_requests_id'), table_name='state_requests')
+    op.drop_index('ix_state_requests_created_at_id', table_name='state_requests')
+    op.drop_table('state_requests')
+    op.drop_index('ix_software_updated_at', table_name='software')
+    op.drop_index(op.f('ix_software_id'), table_name='software')
+    op.drop_index('ix_software_created_at_id', table_name='software')
+    op.drop_table('software')
+    op.drop_index('ix_roles_updated_at', table_name='roles')
+    op.drop_index(op.f('ix_roles_id'), table_name='roles')
+    op.drop_index('ix_roles_created_at_id', table_name='roles')
+    op.drop_table('roles')
+    op.drop_index('ix_notification_outbox_updated_at', table_name='notification_outbox')
+    op.drop_index('ix_notification_outbox_status_next_attempt_at', table_name='notification_outbox')
+    op.drop_index('ix_notification_outbox_status_digest_key', table_name='notification_outbox')
+    op.drop_index(op.f('ix_notification_outbox_id'), table_name='notification_outbox')
+    op.drop_index('ix_notification_outbox_created_at_id', table_name='notification_outbox')
+    op.drop_table('notification_outbox')
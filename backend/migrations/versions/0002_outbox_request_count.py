@@ -0,0 +1,30 @@
+"""notification_outbox.request_count
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 18:05:12.418230
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('notification_outbox', sa.Column('request_count', sa.Integer(), server_default='1', nullable=False))
+    if op.get_bind().dialect.name == 'postgresql':
+        # Pending bulk events enqueued before this revision: count the requests they carry.
+        op.execute(
+            "UPDATE notification_outbox SET request_count = json_array_length(payload->'request_ids') "
+            "WHERE status = 'pending' AND json_typeof(payload->'request_ids') = 'array' "
+            "AND json_array_length(payload->'request_ids') > 0"
+        )
+
+
+def downgrade():
+    op.drop_column('notification_outbox', 'request_count')
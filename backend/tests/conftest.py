@@ -0,0 +1,6 @@
+import os
+
+# app.infrastructure.database builds its engines at import time; the default URL needs psycopg2 and a
+# running Postgres. Tests that touch the database create their own SQLite engine, so this only has to import.
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("ASYNC_DATABASE_URL", "sqlite+aiosqlite://")
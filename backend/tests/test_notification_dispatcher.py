@@ -0,0 +1,120 @@
+"""NotificationDispatcher: a claimed batch is rendered, sent with one send_many call, and recorded per event."""
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.application.services import notification_dispatcher as dispatcher_module
+from app.application.services.notification_dispatcher import NotificationDispatcher
+from app.domain.models.notification_outbox import NotificationOutbox
+from app.infrastructure.database.database import Base
+from app.infrastructure.database.repositories.notification_outbox_repository import (
+    add_outbox_event,
+    claim_ready_digest_events
+)
+from app.infrastructure.email.delivery import DeliveryBackend, DeliveryResult
+
+EVENT_TYPE = "test_event"
+
+
+class FakeBackend(DeliveryBackend):
+    """Refuses every message addressed to ``refused``; records each send_many call."""
+
+    name = "fake"
+
+    def __init__(self, refused: str = ""):
+        super().__init__()
+        self.refused = refused
+        self.calls = []
+
+    def _send_many(self, messages):
+        self.calls.append([message["To"] for message in messages])
+        return [
+            DeliveryResult([], {message["To"]: "550 Mailbox unavailable"}) if message["To"] == self.refused
+            else DeliveryResult([message["To"]], {})
+            for message in messages
+        ]
+
+
+def _render(db, payloads):
+    if payloads[0].get("skip"):
+        return None
+    message = EmailMessage()
+    message["To"] = payloads[0]["to"]
+    message["Subject"] = "Prueba"
+    message.set_content("Hola")
+    return message
+
+
+@pytest.fixture
+def session_factory(monkeypatch):
+    monkeypatch.setitem(dispatcher_module.EVENT_HANDLERS, EVENT_TYPE, _render)
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def _dispatcher(session_factory, backend: FakeBackend) -> NotificationDispatcher:
+    return NotificationDispatcher(session_factory, batch_size=10, poll_interval_seconds=1, max_attempts=3,
+                                  retry_backoff_seconds=60, lease_seconds=300, delivery=backend)
+
+
+def _status(session_factory):
+    with session_factory() as db:
+        return {event.payload["to"]: (event.status, event.attempts, event.last_error)
+                for event in db.query(NotificationOutbox)}
+
+
+def test_batch_is_sent_in_one_call_and_recorded_per_event(session_factory):
+    with session_factory() as db:
+        for to in ("a@example.com", "rechazado@example.com", "b@example.com"):
+            db.add(NotificationOutbox(event_type=EVENT_TYPE, payload={"to": to}))
+        db.add(NotificationOutbox(event_type=EVENT_TYPE, payload={"to": "nadie@example.com", "skip": True}))
+        db.commit()
+    backend = FakeBackend(refused="rechazado@example.com")
+
+    assert _dispatcher(session_factory, backend).dispatch_batch() == 4
+
+    assert len(backend.calls) == 1
+    assert sorted(backend.calls[0]) == ["a@example.com", "b@example.com", "rechazado@example.com"]
+    status = _status(session_factory)
+    assert status["a@example.com"] == ("sent", 1, None)
+    assert status["b@example.com"] == ("sent", 1, None)
+    # Nothing to send is not a failure.
+    assert status["nadie@example.com"] == ("sent", 1, None)
+    state, attempts, error = status["rechazado@example.com"]
+    assert (state, attempts) == ("pending", 1)
+    assert "rechazado@example.com" in error
+
+
+def test_render_error_fails_only_its_event(session_factory):
+    with session_factory() as db:
+        db.add(NotificationOutbox(event_type=EVENT_TYPE, payload={"to": "a@example.com"}))
+        db.add(NotificationOutbox(event_type="desconocido", payload={"to": "b@example.com"}))
+        db.commit()
+    backend = FakeBackend()
+
+    assert _dispatcher(session_factory, backend).dispatch_batch() == 2
+
+    assert backend.calls == [["a@example.com"]]
+    status = _status(session_factory)
+    assert status["a@example.com"][0] == "sent"
+    assert status["b@example.com"][:2] == ("pending", 1)
+    assert "desconocido" in status["b@example.com"][2]
+
+
+def test_digest_is_ready_once_it_holds_max_size_requests(session_factory):
+    with session_factory() as db:
+        add_outbox_event(db, EVENT_TYPE, {"to": "equipo@example.com"}, "team:access", request_count=50)
+        add_outbox_event(db, EVENT_TYPE, {"to": "equipo@example.com"}, "team:it", request_count=1)
+        db.commit()
+        # SQLite's CURRENT_TIMESTAMP is UTC; the window has not elapsed for either key.
+        now = datetime.utcnow() + timedelta(seconds=5)
+        events = claim_ready_digest_events(db, now, now - timedelta(hours=1), max_size=50, limit=10)
+
+    # One bulk event of 50 requests fills the digest; one event of a single request waits for the window.
+    assert [event.digest_key for event in events] == ["team:access"]
@@ -0,0 +1,32 @@
+"""RequestQueryStats is shared by the worker threads of a parallel /all-data read."""
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+from app.config.request_metrics import RequestQueryStats, current_request_stats, record_timing
+
+
+def test_concurrent_updates_are_not_lost():
+    stats = RequestQueryStats()
+    token = current_request_stats.set(stats)
+
+    def work(worker: int):
+        for _ in range(10000):
+            stats.add_query(0.001)
+        record_timing(f"read_{worker}", 0.5)
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(contextvars.copy_context().run, work, worker) for worker in range(8)]
+            for future in futures:
+                future.result()
+    finally:
+        current_request_stats.reset(token)
+
+    assert stats.query_count == 80000
+    assert round(stats.db_time, 6) == 80.0
+    assert sorted(name for name, _ in stats.timings) == [f"read_{worker}" for worker in range(8)]
+
+
+def test_record_timing_outside_a_request_is_a_no_op():
+    record_timing("read_users", 0.1)
+    assert current_request_stats.get() is None
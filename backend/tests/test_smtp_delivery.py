@@ -0,0 +1,166 @@
+"""SMTPDeliveryBackend against a local aiosmtpd server.
+
+    cd backend && pip install -r requirements-dev.txt && python -m pytest
+"""
+import socket
+import threading
+from email.message import EmailMessage
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from app.infrastructure.email.delivery import SMTPDeliveryBackend
+
+REFUSED_DOMAIN = "@rechazado.example.com"
+
+
+class RecordingHandler:
+    """Accepts every message except for recipients in REFUSED_DOMAIN, which get a 550."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.messages = []
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address.endswith(REFUSED_DOMAIN):
+            return "550 5.1.1 Mailbox unavailable"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        with self.lock:
+            self.messages.append((envelope.mail_from, list(envelope.rcpt_tos)))
+        return "250 Message accepted for delivery"
+
+
+def _free_port() -> int:
+    # Controller.start() connects to its own port to check it is up, so port=0 cannot be used.
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server():
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=_free_port())
+    controller.start()
+    try:
+        yield handler, controller.hostname, controller.port
+    finally:
+        controller.stop()
+
+
+def _message(index: int, *recipients: str) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = "onboarding@example.com"
+    message["To"] = ", ".join(recipients)
+    message["Subject"] = f"Notificación {index}"
+    message.set_content("Hola")
+    return message
+
+
+def test_batch_reuses_connections_and_recycles_after_limit(smtp_server):
+    handler, host, port = smtp_server
+    backend = SMTPDeliveryBackend(host, port, pool_size=2, max_messages_per_connection=3)
+    try:
+        results = backend.send_many([_message(i, f"user{i}@example.com") for i in range(5)])
+
+        assert [result.ok for result in results] == [True] * 5
+        assert len(handler.messages) == 5
+        # Five messages at three per connection: one recycle, and the second connection is kept idle.
+        assert backend.connections_opened == 2
+        assert backend.stats()["idle_connections"] == 1
+    finally:
+        backend.close()
+
+
+def test_concurrent_batches_stay_within_pool_size(smtp_server):
+    handler, host, port = smtp_server
+    backend = SMTPDeliveryBackend(host, port, pool_size=2, max_messages_per_connection=1000)
+    errors = []
+
+    def send_batch(worker: int):
+        try:
+            backend.send_many([_message(i, f"w{worker}-{i}@example.com") for i in range(10)])
+        except Exception as e:  # surfaced by the assertion below
+            errors.append(e)
+
+    threads = [threading.Thread(target=send_batch, args=(worker,)) for worker in range(6)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(30)
+
+        assert errors == []
+        assert len(handler.messages) == 60
+        assert backend.connections_opened <= 2
+        assert backend.stats()["idle_connections"] <= 2
+        assert backend.stats()["messages_sent"] == 60
+    finally:
+        backend.close()
+
+
+def test_refused_recipients_are_reported_per_message(smtp_server):
+    handler, host, port = smtp_server
+    backend = SMTPDeliveryBackend(host, port, pool_size=1)
+    try:
+        partial, refused = backend.send_many([
+            _message(1, "ok@example.com", f"nadie{REFUSED_DOMAIN}"),
+            _message(2, f"otro{REFUSED_DOMAIN}"),
+        ])
+
+        assert partial.ok
+        assert partial.accepted == ["ok@example.com"]
+        assert list(partial.refused) == [f"nadie{REFUSED_DOMAIN}"]
+        assert partial.refused[f"nadie{REFUSED_DOMAIN}"].startswith("550")
+
+        assert not refused.ok
+        assert refused.accepted == []
+        assert list(refused.refused) == [f"otro{REFUSED_DOMAIN}"]
+
+        stats = backend.stats()
+        assert stats["messages_sent"] == 1
+        assert stats["messages_failed"] == 1
+        assert stats["failed_recipients"] == {f"nadie{REFUSED_DOMAIN}": 1, f"otro{REFUSED_DOMAIN}": 1}
+        # The refused message did not cost the connection.
+        assert backend.connections_opened == 1
+        assert handler.messages == [("onboarding@example.com", ["ok@example.com"])]
+    finally:
+        backend.close()
+
+
+def test_dropped_idle_connection_is_closed_and_reopened(smtp_server):
+    handler, host, port = smtp_server
+    backend = SMTPDeliveryBackend(host, port, pool_size=1)
+    try:
+        backend.send(_message(1, "a@example.com"))
+        idle = backend._idle.get_nowait()
+        dropped = idle.smtp
+        dropped.close()  # what the client sees once the server has timed the session out
+        backend._idle.put_nowait(idle)
+
+        result = backend.send(_message(2, "b@example.com"))
+
+        assert result.ok
+        assert backend.connections_opened == 2
+        assert idle.smtp is not dropped
+        assert dropped.sock is None
+        assert len(handler.messages) == 2
+    finally:
+        backend.close()
+
+
+def test_unreachable_server_fails_each_message_instead_of_raising():
+    backend = SMTPDeliveryBackend("127.0.0.1", _free_port(), pool_size=1, timeout=2)
+    try:
+        results = backend.send_many([_message(1, "a@example.com"), _message(2, "b@example.com")])
+
+        assert [result.ok for result in results] == [False, False]
+        assert all(result.error.startswith("ConnectionRefusedError") for result in results)
+        assert backend.stats()["messages_failed"] == 2
+        # The slot is given back: a later batch still gets to try.
+        assert len(backend.send_many([_message(3, "c@example.com")])) == 1
+    finally:
+        backend.close()
@@ -0,0 +1,111 @@
+"""SQL_STRICT_LOADING: response serialization must only touch relationships the loader options eager-load.
+
+Every other relationship is raiseload-ed, so an N+1 regression (a schema field without a loader) fails here
+instead of issuing one lazy query per row in production.
+"""
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
+from sqlalchemy.pool import StaticPool
+
+from app.domain.models.access import Access
+from app.domain.models.device import Device
+from app.domain.models.role import Role
+from app.domain.models.software import Software
+from app.domain.models.state_request import StateRequest
+from app.domain.models.user import User
+from app.domain.schemas.access import AccessResponse
+from app.domain.schemas.software import SoftwareResponse
+from app.domain.schemas.user import UserResponse
+from app.infrastructure.api.json_response import JSONBody
+from app.infrastructure.database import loader_strategy
+from app.infrastructure.database.database import Base
+from app.infrastructure.database.loader_strategy import schema_loader_options
+from app.infrastructure.database.repositories import access_repository, software_repository, user_repository
+
+
+@pytest.fixture
+def strict_loading(monkeypatch):
+    monkeypatch.setattr(loader_strategy, "SQL_STRICT_LOADING", True)
+    schema_loader_options.cache_clear()
+    yield
+    schema_loader_options.cache_clear()
+
+
+@pytest.fixture
+def data():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        roles = [Role(label="Desarrollador"), Role(label="Administrador")]
+        state = StateRequest(label="Pendiente")
+        software = [Software(name=f"Software {i}", url="https://example.com", roles=roles) for i in range(3)]
+        users = [User(name=f"Usuario {i}", email=f"usuario{i}@example.com", area="Desarrollo", team="Backend",
+                      role=roles[i % 2], is_active=True) for i in range(3)]
+        accesses = [Access(user=user, software=item, state_request=state) for user in users for item in software]
+        db.add_all([*roles, state, *software, *users, *accesses, Device(user=users[0], state_request=state)])
+        db.commit()
+        ids = {"user": users[0].id, "software": software[0].id, "access": accesses[0].id}
+    yield engine, ids
+    engine.dispose()
+
+
+def _dump(schema, rows):
+    # The same TypeAdapter path the list routes render through.
+    return JSONBody(list[schema]).render(rows)
+
+
+CASES = [
+    (User, UserResponse, user_repository.get_all_users, user_repository.get_user_by_id, "user"),
+    (Access, AccessResponse, access_repository.get_all_accesses, access_repository.get_access_by_id, "access"),
+    (Software, SoftwareResponse, software_repository.get_all_software, software_repository.get_software_by_id, "software"),
+]
+
+
+@pytest.mark.parametrize("model, schema, get_all, get_by_id, key", CASES, ids=[case[-1] for case in CASES])
+def test_repository_responses_serialize_under_strict_loading(strict_loading, data, model, schema, get_all, get_by_id, key):
+    engine, ids = data
+    # The repositories call schema_loader_options without ``strict``, so they now get the trailing raiseload("*").
+    assert len(schema_loader_options(model, schema)) == len(schema_loader_options(model, schema, strict=False)) + 1
+    with Session(engine) as db:
+        rows = get_all(db)
+        assert len(rows) > 0
+        _dump(schema, rows)
+    with Session(engine) as db:
+        JSONBody(schema).render(get_by_id(db, ids[key]))
+
+
+@pytest.mark.parametrize("model, schema, get_all, get_by_id, key", CASES, ids=[case[-1] for case in CASES])
+def test_dropping_a_derived_option_raises(data, model, schema, get_all, get_by_id, key):
+    engine, _ = data
+    options = schema_loader_options(model, schema, strict=True)
+    loaders = options[:-1]
+    assert loaders, "the schema serializes at least one relationship"
+    for dropped in range(len(loaders)):
+        kept = options[:dropped] + options[dropped + 1:]
+        with Session(engine) as db:
+            rows = db.execute(select(model).options(*kept)).unique().scalars().all()
+            with pytest.raises(ValidationError, match="lazy='raise'"):
+                _dump(schema, rows)
+
+
+def test_dropping_the_nested_software_roles_option_raises(data):
+    engine, _ = data
+    # The derived options for AccessResponse, minus selectinload(Software.roles) under Access.software.
+    options = (
+        joinedload(Access.software).options(raiseload("*")),
+        joinedload(Access.state_request).options(raiseload("*")),
+        raiseload("*"),
+    )
+    with Session(engine) as db:
+        rows = db.execute(select(Access).options(*options)).scalars().all()
+        with pytest.raises(ValidationError, match="lazy='raise'"):
+            _dump(AccessResponse, rows)
+
+    with Session(engine) as db:
+        rows = db.execute(select(Access).options(
+            joinedload(Access.software).options(selectinload(Software.roles), raiseload("*")),
+            *options[1:]
+        )).scalars().all()
+        _dump(AccessResponse, rows)
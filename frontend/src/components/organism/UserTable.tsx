@@ -10,7 +10,6 @@ import useRolesStore from '@/store/roleStore';
 import type { Devices } from '@/types/devices';
 import { createDeviceRequest } from '@/services/devices';
 import { useStateRequest } from '@/hooks/useStateRequest';
-import { useSoftwareRequest } from '@/hooks/useSoftware';
 import { useAllData } from '@/hooks/useAllData';
 import { createAccessByRol } from '@/services/access';
 import DynamicFilterTable from './DynamicFilterTable';
@@ -185,7 +184,6 @@ const filterOptions: FieldConfig[] = [
 export default function UserTable() {
   const [columns, setColumns] = useState<DynamicColumns<User>[]>(columnsTemplate);
   const { rolesOptions } = useRoleRequest();
-  const { software } = useSoftwareRequest();
   const { roles } = useRolesStore();
   const { stateRequest } = useStateRequest();
   const { users, setUsers } = useAllData();
@@ -226,7 +224,7 @@ export default function UserTable() {
       }
       let accessRequestCreated: Access[] | null = null;
       if (data.access) {
-        accessRequestCreated = await createAccessByRol(userCreated.id || "", userCreated.role_id, software, stateRequest.find(sr => sr.label === "Pendiente")?.id || "");
+        accessRequestCreated = await createAccessByRol(userCreated.id || "", userCreated.role_id, stateRequest.find(sr => sr.label === "Pendiente")?.id || "");
       }
       const userDetail: User = {
         ...userCreated,
@@ -10,6 +10,37 @@ import { showErrorToast } from "@/utils/toast";
 
 const API_URL = import.meta.env.VITE_API_URL;
 
+type AllDataPayload = {
+  user: User[];
+  devices: Devices[];
+  access: Access[];
+  watermark: string;
+  deleted?: { user: string[]; devices: string[]; access: string[] };
+  // Set when a role, state or software changed: the lists are complete and replace what we hold.
+  full_resync?: boolean;
+};
+
+// Lives outside the hook so every refresh after the first only pulls what changed (/all-data?since=).
+const syncState = {
+  watermark: null as string | null,
+  users: new Map<string, User>(),
+  devices: new Map<string, Devices>(),
+  access: new Map<string, Access>(),
+};
+
+function applyChanges<T extends { id?: string }>(
+  target: Map<string, T>,
+  changed: T[],
+  deleted: string[] = []
+) {
+  changed.forEach((item) => {
+    if (item.id) {
+      target.set(item.id, item);
+    }
+  });
+  deleted.forEach((id) => target.delete(id));
+}
+
 export function useAllData() {
   const { setDevices, devices, setDevicesPending } = useDevicesStore();
   const { setAccess, access, setAccessPending } = useAccessStore();
@@ -18,28 +49,25 @@ export function useAllData() {
   useEffect(() => {
     async function fetchData() {
       try {
-        const allUsers = await httpRequest<null, User[]>(
-          `${API_URL}users/`,
-          null,
-          {
-            method: "GET",
-          }
-        );
-        const devices = await httpRequest<null, Devices[]>(
-          `${API_URL}devices/`,
-          null,
-          {
-            method: "GET",
-          }
-        );
+        const url = syncState.watermark
+          ? `${API_URL}all-data/?since=${encodeURIComponent(syncState.watermark)}`
+          : `${API_URL}all-data/`;
+        const data = await httpRequest<null, AllDataPayload>(url, null, {
+          method: "GET",
+        });
+        if (data.full_resync) {
+          syncState.users.clear();
+          syncState.devices.clear();
+          syncState.access.clear();
+        }
+        applyChanges(syncState.users, data.user, data.deleted?.user);
+        applyChanges(syncState.devices, data.devices, data.deleted?.devices);
+        applyChanges(syncState.access, data.access, data.deleted?.access);
+        syncState.watermark = data.watermark;
 
-        const access = await httpRequest<null, Access[]>(
-          `${API_URL}access/`,
-          null,
-          {
-            method: "GET",
-          }
-        );
+        const allUsers = Array.from(syncState.users.values());
+        const devices = Array.from(syncState.devices.values());
+        const access = Array.from(syncState.access.values());
 
         setDevices(devices);
         setAccess(access);
@@ -1,5 +1,4 @@
 import type { Access } from "@/types/access";
-import type { Software } from "@/types/software";
 import { httpRequest } from "./http";
 
 const API_URL = import.meta.env.VITE_API_URL;
@@ -7,28 +6,19 @@ const API_URL = import.meta.env.VITE_API_URL;
 export async function createAccessByRol(
   userId: string,
   roleId: string,
-  software: Software[],
   stateID: string
-) {
-  const softwareFiltered = software.filter((s) =>
-    s.roles?.some((r) => r.id === roleId)
+): Promise<Access[]> {
+  const accessRequestsCreated = await httpRequest<
+    { user_id: string; role_id: string; state_request_id: string },
+    Access[]
+  >(
+    `${API_URL}access/provision-by-role`,
+    { user_id: userId, role_id: roleId, state_request_id: stateID },
+    {
+      method: "POST",
+    }
   );
-  if (softwareFiltered.length === 0) {
-    throw new Error("No hay software disponible para este rol");
-  }
-  const softwaresId: string[] = softwareFiltered.map((s) => s.id || "");
-
-  const newAccessRequestCreated: Access[] = [];
-  for (const id of softwaresId) {
-    const newAccessRequest: Access = {
-      user_id: userId,
-      software_id: id,
-      state_request_id: stateID,
-    };
-    const accessRequestCreated = await createAccessRequest(newAccessRequest);
-    newAccessRequestCreated.push(accessRequestCreated);
-  }
-  return newAccessRequestCreated;
+  return accessRequestsCreated;
 }
 
 export async function createAccessRequest(access: Access): Promise<Access> {
@@ -4,7 +4,7 @@ import { httpRequest } from "./http";
 const API_BASE = import.meta.env.VITE_API_URL;
 
 export async function getRoles(): Promise<Roles[]> {
-  return httpRequest<null, Roles[]>(`${API_BASE}roles/`, null, {
+  return httpRequest<null, Roles[]>(`${API_BASE}roles/?all=true`, null, {
     method: "GET",
   });
 }
@@ -10,7 +10,7 @@ export async function createSoftwareRequest(user: Software): Promise<Software> {
 }
 
 export async function getAllSoftwareRequests(): Promise<Software[]> {
-  return httpRequest<null, Software[]>(`${API_BASE}software/`, null, {
+  return httpRequest<null, Software[]>(`${API_BASE}software/?all=true`, null, {
     method: "GET",
   });
 }
@@ -4,7 +4,7 @@ import type { StateRequest } from "@/types/stateRequest";
 const API_BASE = import.meta.env.VITE_API_URL;
 
 export async function getStateRequests(): Promise<StateRequest[]> {
-  return httpRequest<null, StateRequest[]>(`${API_BASE}state-requests/`, null, {
+  return httpRequest<null, StateRequest[]>(`${API_BASE}state-requests/?all=true`, null, {
     method: "GET",
   });
 }